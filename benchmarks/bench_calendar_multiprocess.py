@@ -0,0 +1,98 @@
+"""Benchmark concurrent calendar writes from several worker processes.
+
+Starts W processes that each open the same calendar in a temporary
+directory and add N events, then reopens the calendar and checks that
+every event survived. Reports total write throughput per backend and
+worker count, plus the number of lost events (which must be zero).
+
+Usage:
+    python benchmarks/bench_calendar_multiprocess.py [--workers 1 2 4 8] [--adds 200] [--backends json journal sqlite] [--json]
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from new_agent.calendar import create_calendar_storage  # noqa: E402
+
+EVENT = {
+    "title": "Benchmark meeting",
+    "start_time": "2030-01-01 10:00:00",
+    "duration": 30,
+    "meeting_url": "https://zoom.us/j/123",
+    "meeting_id": "123",
+    "description": "",
+    "type": "zoom_meeting"
+}
+
+
+def _worker(backend, path, worker, adds, start_event):
+    storage = create_calendar_storage(backend, path)
+    start_event.wait()
+    for i in range(adds):
+        storage.add_event({**EVENT, "description": f"{worker}-{i}"})
+    if hasattr(storage, "close"):
+        storage.close()
+
+
+def bench_backend(backend, workers, adds):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calendar.json")
+        storage = create_calendar_storage(backend, path)
+        if hasattr(storage, "close"):
+            storage.close()
+        start_event = multiprocessing.Event()
+        processes = [
+            multiprocessing.Process(target=_worker, args=(backend, path, worker, adds, start_event))
+            for worker in range(workers)
+        ]
+        for process in processes:
+            process.start()
+        # Let every worker open the calendar before timing the writes
+        time.sleep(0.5)
+        start = time.perf_counter()
+        start_event.set()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+
+        storage = create_calendar_storage(backend, path)
+        stored = {event["description"] for event in storage.list_events()}
+        if hasattr(storage, "close"):
+            storage.close()
+    expected = workers * adds
+    return {
+        "backend": backend,
+        "workers": workers,
+        "adds_per_worker": adds,
+        "events_per_second": round(expected / elapsed),
+        "lost_events": expected - len(stored)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--adds", type=int, default=200)
+    parser.add_argument("--backends", nargs="+", default=["json", "journal", "sqlite"])
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    results = [bench_backend(backend, workers, args.adds) for backend in args.backends for workers in args.workers]
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for result in results:
+            print(f"{result['backend']:>8} workers={result['workers']:>2} "
+                  f"events_per_second={result['events_per_second']:>6} lost_events={result['lost_events']}")
+    if any(result["lost_events"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
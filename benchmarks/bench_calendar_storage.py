@@ -0,0 +1,102 @@
+"""Benchmark calendar add_event and list_events latency as the calendar grows.
+
+Preloads each backend with N events spread over one year in a temporary
+directory, then times a batch of further add_event calls and a batch of
+single-day list_events queries, so per-operation cost can be compared
+across calendar sizes.
+
+Usage:
+    python benchmarks/bench_calendar_storage.py [--sizes 1000 10000 100000] [--adds 200] [--queries 50] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from new_agent.calendar import SQLiteCalendarStorage, create_calendar_storage  # noqa: E402
+
+YEAR_START = datetime(2030, 1, 1)
+
+EVENT = {
+    "title": "Benchmark meeting",
+    "start_time": "2030-01-01 10:00:00",
+    "duration": 30,
+    "meeting_url": "https://zoom.us/j/123",
+    "meeting_id": "123",
+    "description": "",
+    "type": "zoom_meeting"
+}
+
+
+def _events(size):
+    step = timedelta(days=365) / max(size, 1)
+    for i in range(size):
+        start_time = (YEAR_START + step * i).strftime("%Y-%m-%d %H:%M:%S")
+        yield {"id": str(i + 1), "created_at": "2030-01-01 00:00:00", **EVENT, "start_time": start_time}
+
+
+def _preload(backend, path, size):
+    if backend == "sqlite":
+        storage = SQLiteCalendarStorage(path)
+        with storage._connection() as connection:
+            connection.executemany(
+                "INSERT INTO events (id, start_time, meeting_id, data) VALUES (?, ?, ?, ?)",
+                ((e["id"], e["start_time"], e["meeting_id"], json.dumps(e)) for e in _events(size))
+            )
+        return
+    with open(path, "w") as f:
+        json.dump(list(_events(size)), f)
+
+
+def bench_backend(backend, size, adds, queries):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "calendar.json")
+        _preload(backend, path, size)
+        storage = create_calendar_storage(backend, path)
+        start = time.perf_counter()
+        for _ in range(adds):
+            storage.add_event(EVENT)
+        add_elapsed = time.perf_counter() - start
+        days = [(YEAR_START + timedelta(days=i * 7 % 365)).strftime("%Y-%m-%d") for i in range(queries)]
+        start = time.perf_counter()
+        for day in days:
+            storage.list_events(day)
+        query_elapsed = time.perf_counter() - start
+        if hasattr(storage, "close"):
+            storage.close()
+    return {
+        "backend": backend,
+        "calendar_size": size,
+        "adds": adds,
+        "mean_add_ms": round(add_elapsed / adds * 1000, 4),
+        "adds_per_second": round(adds / add_elapsed),
+        "mean_list_day_ms": round(query_elapsed / queries * 1000, 4)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--adds", type=int, default=200)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--backends", nargs="+", default=["json", "journal", "sqlite"])
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    results = [bench_backend(backend, size, args.adds, args.queries) for backend in args.backends for size in args.sizes]
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for result in results:
+            print(f"{result['backend']:>8} size={result['calendar_size']:>7} "
+                  f"mean_add_ms={result['mean_add_ms']:>9} adds_per_second={result['adds_per_second']:>6} "
+                  f"mean_list_day_ms={result['mean_list_day_ms']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Cold-start import time report for the new_agent package.
+
+Imports each module in a fresh interpreter with ``python -X importtime`` and
+reports the total import time plus the slowest dependencies, so regressions
+in cold start (e.g. a heavy import creeping into a tool module) show up.
+Each module is imported several times and the fastest run is kept.
+
+Usage:
+    python benchmarks/bench_import_time.py [--modules new_agent new_agent.zoom] [--runs 5] [--top 10] [--budget-ms 300] [--json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULES = [
+    "new_agent",
+    "new_agent.zoom",
+    "new_agent.calendar",
+    "new_agent.scheduling",
+    "new_agent.agent",
+]
+
+
+def parse_importtime(stderr, module):
+    """Return {name: cumulative_us} for ``module`` and everything it imported.
+
+    ``-X importtime`` prints a module after its dependencies, indented by
+    nesting depth, so the dependencies of a top-level import are the lines
+    between it and the previous top-level line. Interpreter startup (site,
+    encodings, ...) is left out that way.
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        entries.append((name[1:], int(cumulative_us)))
+    timings = {}
+    for name, cumulative_us in reversed(entries):
+        top_level = not name.startswith(" ")
+        if top_level and timings:
+            break
+        if top_level and name.strip() != module:
+            continue
+        timings[name.strip()] = max(cumulative_us, timings.get(name.strip(), 0))
+    return timings
+
+
+def import_once(module):
+    # Run from a scratch directory so nothing is read relative to the repo
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.join(ROOT, "benchmarks"),
+        env={**os.environ, "PYTHONPATH": ROOT, "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{result.stderr.strip().splitlines()[-1]}")
+    return parse_importtime(result.stderr, module)
+
+
+def bench_module(module, runs, top):
+    best = min((import_once(module) for _ in range(runs)), key=lambda timings: timings[module])
+    slowest = sorted(
+        ((name, cumulative) for name, cumulative in best.items() if name != module),
+        key=lambda item: item[1],
+        reverse=True
+    )
+    # Only report top-level packages so one heavy dependency is listed once
+    seen, heaviest = set(), []
+    for name, cumulative in slowest:
+        package = name.split(".")[0]
+        if package in seen:
+            continue
+        seen.add(package)
+        heaviest.append({"module": name, "cumulative_ms": round(cumulative / 1000, 1)})
+        if len(heaviest) == top:
+            break
+    return {
+        "module": module,
+        "total_ms": round(best[module] / 1000, 1),
+        "modules_imported": len(best),
+        "heaviest": heaviest
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Exit with status 1 if any module except new_agent.agent exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    results = [bench_module(module, args.runs, args.top) for module in args.modules]
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for result in results:
+            print(f"{result['module']:<24} {result['total_ms']:>8} ms  ({result['modules_imported']} modules)")
+            for item in result["heaviest"]:
+                print(f"    {item['module']:<40} {item['cumulative_ms']:>8} ms")
+
+    if args.budget_ms is not None:
+        over = [r for r in results if r["module"] != "new_agent.agent" and r["total_ms"] > args.budget_ms]
+        for result in over:
+            print(f"{result['module']} took {result['total_ms']} ms, budget is {args.budget_ms} ms", file=sys.stderr)
+        sys.exit(1 if over else 0)
+
+
+if __name__ == "__main__":
+    main()
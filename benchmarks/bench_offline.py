@@ -0,0 +1,254 @@
+"""Offline latency and throughput benchmark for the Zoom tools and the email workflow.
+
+Starts benchmarks/mock_zoom_server.py in-process and points the package at
+it through ZOOM_API_BASE_URL and ZOOM_OAUTH_TOKEN_URL. The LlmAgents are
+given scripted models from benchmarks/fake_llm.py. Nothing leaves the
+machine and every run is deterministic, so results can be compared between
+commits. Reports p50/p95/p99 latency and throughput per benchmark.
+
+Usage:
+    python benchmarks/bench_offline.py [--iterations 200] [--workflow-iterations 20] [--concurrency 1]
+        [--latency-ms 0] [--jitter-ms 0] [--rate-limit-ratio 0] [--llm-latency-ms 0]
+        [--benches create_zoom_meeting list_zoom_meetings ... email_workflow] [--json]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from mock_zoom_server import API_PREFIX, MockZoomServer  # noqa: E402
+
+LIST_WINDOW = ("2030-01-01", "2030-01-31")
+CREATE_START = "2032-01-05 10:00:00"
+
+SYNC_BENCHES = [
+    "create_zoom_meeting", "get_zoom_meeting", "update_zoom_meeting", "list_zoom_meetings",
+    "delete_zoom_meeting", "check_conflicts", "find_free_slots"
+]
+ASYNC_BENCHES = ["create_zoom_meeting_async", "get_zoom_meeting_async", "list_zoom_meetings_async"]
+ALL_BENCHES = SYNC_BENCHES + ASYNC_BENCHES + ["email_workflow"]
+
+
+def configure_environment(server_url, data_dir, client_rate_limits):
+    """Point the package at the mock server; must run before new_agent is imported."""
+    os.environ.update({
+        "ZOOM_API_BASE_URL": f"{server_url}{API_PREFIX}",
+        "ZOOM_OAUTH_TOKEN_URL": f"{server_url}/oauth/token",
+        "ZOOM_CLIENT_ID": "benchmark",
+        "ZOOM_CLIENT_SECRET": "benchmark",
+        "ZOOM_ACCOUNT_ID": "benchmark",
+        "CALENDAR_FILE": os.path.join(data_dir, "calendar.json"),
+        # Every workflow iteration should reach the model, not a cached answer
+        "LLM_CACHE_BACKEND": "off"
+    })
+    if not client_rate_limits:
+        # Measure the client itself rather than the per-category request budget
+        for category in ("LIGHT", "MEDIUM", "HEAVY"):
+            os.environ[f"ZOOM_RATE_LIMIT_{category}"] = "100000"
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    return sorted_values[max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)]
+
+
+def summarize(name, latencies, errors, elapsed):
+    latencies = sorted(latencies)
+    return {
+        "name": name,
+        "iterations": len(latencies),
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+        "throughput_per_s": round(len(latencies) / elapsed, 1) if elapsed else 0.0
+    }
+
+
+def _succeeded(result):
+    return isinstance(result, dict) and result.get("status") == "success"
+
+
+def bench_sync(name, call, iterations, concurrency):
+    """Time ``call(i)`` for every iteration on ``concurrency`` threads."""
+    call(-1)  # warm up the connection pool and token cache
+
+    def timed(i):
+        start = time.perf_counter()
+        ok = _succeeded(call(i))
+        return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    if concurrency > 1:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            samples = list(executor.map(timed, range(iterations)))
+    else:
+        samples = [timed(i) for i in range(iterations)]
+    elapsed = time.perf_counter() - start
+    return summarize(name, [latency for latency, _ in samples], sum(not ok for _, ok in samples), elapsed)
+
+
+async def bench_async(name, call, iterations, concurrency):
+    """Time ``await call(i)`` for every iteration with at most ``concurrency`` in flight."""
+    await call(-1)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(i):
+        async with semaphore:
+            start = time.perf_counter()
+            ok = await call(i)
+            return time.perf_counter() - start, ok
+
+    start = time.perf_counter()
+    samples = await asyncio.gather(*(timed(i) for i in range(iterations)))
+    elapsed = time.perf_counter() - start
+    return summarize(name, [latency for latency, _ in samples], sum(not ok for _, ok in samples), elapsed)
+
+
+def sync_calls(server, iterations):
+    from new_agent import zoom, scheduling
+
+    meeting_id = str(server.state.seed(1)[0])
+    # Delete needs a fresh meeting per iteration (plus one for the warm-up), outside the listed month
+    doomed = [str(meeting_id) for meeting_id in server.state.seed(iterations + 1, start="2031-01-01")]
+    return {
+        "create_zoom_meeting": lambda i: zoom.create_zoom_meeting(f"Benchmark {i}", 30, CREATE_START),
+        "get_zoom_meeting": lambda i: zoom.get_zoom_meeting(meeting_id, use_cache=False),
+        "update_zoom_meeting": lambda i: zoom.update_zoom_meeting(meeting_id, topic=f"Renamed {i}"),
+        "list_zoom_meetings": lambda i: zoom.list_zoom_meetings(*LIST_WINDOW),
+        "delete_zoom_meeting": lambda i: zoom.delete_zoom_meeting(doomed[i + 1]),
+        "check_conflicts": lambda i: scheduling.check_conflicts("2030-01-05 10:00:00", 30),
+        "find_free_slots": lambda i: scheduling.find_free_slots(30, "2030-01-07 09:00", "2030-01-08 18:00")
+    }
+
+
+def async_calls(server):
+    from new_agent import zoom
+
+    meeting_id = str(server.state.seed(1)[0])
+
+    async def create(i):
+        return _succeeded(await zoom.create_zoom_meeting_async(f"Benchmark {i}", 30, CREATE_START))
+
+    async def get(i):
+        return _succeeded(await zoom.get_zoom_meeting_async(meeting_id, use_cache=False))
+
+    async def list_meetings(i):
+        return _succeeded(await zoom.list_zoom_meetings_async(*LIST_WINDOW))
+
+    return {"create_zoom_meeting_async": create, "get_zoom_meeting_async": get, "list_zoom_meetings_async": list_meetings}
+
+
+def script_agents(llm_latency_ms):
+    """Replace the model of every LlmAgent in the workflow with a scripted one."""
+    from fake_llm import ScriptedLlm
+    from new_agent import agent
+
+    agent.email_analyzer_agent.model = ScriptedLlm(
+        latency_ms=llm_latency_ms,
+        text='MEETING_REQUIRED: yes\nURGENCY: urgent\nMEETING_DETAILS: {"topic": "Benchmark sync", "duration": 30}'
+    )
+    agent.zoom_meeting_agent.model = ScriptedLlm(
+        latency_ms=llm_latency_ms,
+        calls=[("create_zoom_meeting_async", {"topic": "Benchmark sync", "duration": 30, "start_time": CREATE_START})],
+        text="Your meeting \"Benchmark sync\" has been created."
+    )
+    agent.calendar_manager_agent.model = ScriptedLlm(
+        latency_ms=llm_latency_ms,
+        calls=[("add_to_calendar", {"title": "Benchmark sync", "start_time": CREATE_START, "duration": 30})],
+        text="Meeting added to calendar."
+    )
+    agent.meeting_joiner_agent.model = ScriptedLlm(latency_ms=llm_latency_ms, text="No immediate meetings to join.")
+    return agent.email_workflow
+
+
+async def bench_workflow(iterations, concurrency, llm_latency_ms):
+    from google.adk.runners import Runner
+    from google.adk.sessions import InMemorySessionService
+    from google.genai import types
+
+    runner = Runner(app_name="bench", agent=script_agents(llm_latency_ms), session_service=InMemorySessionService())
+    message = types.Content(role="user", parts=[types.Part(text="Check my email and schedule what is needed")])
+
+    async def run(i):
+        session = await runner.session_service.create_session(app_name="bench", user_id="bench")
+        async for _ in runner.run_async(user_id="bench", session_id=session.id, new_message=message):
+            pass
+        session = await runner.session_service.get_session(app_name="bench", user_id="bench", session_id=session.id)
+        return bool(session.state.get("meeting_result"))
+
+    return await bench_async("email_workflow", run, iterations, concurrency)
+
+
+async def run_async_benches(server, names, iterations, workflow_iterations, concurrency, llm_latency_ms):
+    # One event loop for all of them, so the async client's connection pool is reused
+    calls = async_calls(server)
+    results = [await bench_async(name, calls[name], iterations, concurrency) for name in names if name in calls]
+    if "email_workflow" in names:
+        results.append(await bench_workflow(workflow_iterations, concurrency, llm_latency_ms))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per tool benchmark")
+    parser.add_argument("--workflow-iterations", type=int, default=20, help="Runs of the email workflow")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--meetings", type=int, default=250, help="Meetings seeded in the listed month (page size is 100)")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mock Zoom API latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Fraction of API requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=0.05, help="Retry-After seconds sent with a 429")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated model latency per turn")
+    parser.add_argument("--client-rate-limits", action="store_true", help="Keep the client's per-category request budget")
+    parser.add_argument("--benches", nargs="+", default=ALL_BENCHES, choices=ALL_BENCHES)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir, MockZoomServer(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, rate_limit_ratio=args.rate_limit_ratio,
+        retry_after=args.retry_after, seed=args.seed
+    ) as server:
+        server.state.seed(args.meetings)
+        configure_environment(server.url, data_dir, args.client_rate_limits)
+
+        results = []
+        sync_names = [name for name in args.benches if name in SYNC_BENCHES]
+        if sync_names:
+            calls = sync_calls(server, args.iterations)
+            results += [bench_sync(name, calls[name], args.iterations, args.concurrency) for name in sync_names]
+        if any(name not in SYNC_BENCHES for name in args.benches):
+            results += asyncio.run(run_async_benches(
+                server, args.benches, args.iterations, args.workflow_iterations, args.concurrency, args.llm_latency_ms
+            ))
+        server_stats = dict(server.state.stats)
+
+    report = {
+        "config": {key: value for key, value in vars(args).items() if key not in ("json", "benches")},
+        "server": server_stats,
+        "results": results
+    }
+    if args.json:
+        print(json.dumps(report))
+    else:
+        for result in results:
+            print(f"{result['name']:<28} p50={result['p50_ms']:>8} ms  p95={result['p95_ms']:>8} ms  "
+                  f"p99={result['p99_ms']:>8} ms  {result['throughput_per_s']:>8}/s  errors={result['errors']}")
+        print(f"mock server: {server_stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""Micro-benchmark for the natural-language meeting time parser.
+
+Compares parses per second of the legacy string-scanning parser (kept below
+verbatim as the baseline) with new_agent.time_parser, both cold (memo cache
+cleared before every parse) and warm (repeated inputs served from the LRU).
+
+Usage:
+    python benchmarks/bench_time_parser.py [--iterations 20000] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from new_agent.time_parser import _resolve, parse_meeting_time  # noqa: E402
+
+SAMPLES = [
+    "tomorrow 2pm",
+    "tomorrow 10:30 am",
+    "3 pm",
+    "11.15am",
+    "in 3 days at 4pm",
+    "may 12th at 2:30 pm",
+    "december 1st",
+    "2030-05-12 14:00:00",
+]
+
+
+def legacy_parse_meeting_time(time_str: str = "") -> datetime:
+    """Original parse_meeting_time from zoom.py, used as the benchmark baseline."""
+    try:
+        if not time_str:
+            return datetime.now() + timedelta(minutes=5)
+        
+        # Try to parse the time string
+        time_str = time_str.lower().strip()
+        
+        # Handle "in X days" format
+        if "in" in time_str and "days" in time_str:
+            try:
+                days = int(time_str.split("in")[1].split("days")[0].strip())
+                date = datetime.now() + timedelta(days=days)
+                time_part = time_str.split("at")[-1].strip() if "at" in time_str else "00:00:00"
+                
+                if "pm" in time_part:
+                    time_digits = time_part.split('pm')[0].strip().replace('.', ':')
+                    if ':' in time_digits:
+                        hour, minutes = map(int, time_digits.split(':'))
+                        if hour != 12:
+                            hour += 12
+                        time = f"{hour:02d}:{minutes:02d}:00"
+                    else:
+                        hour = int(time_digits)
+                        if hour != 12:
+                            hour += 12
+                        time = f"{hour:02d}:00:00"
+                elif "am" in time_part:
+                    time_digits = time_part.split('am')[0].strip().replace('.', ':')
+                    if ':' in time_digits:
+                        hour, minutes = map(int, time_digits.split(':'))
+                        if hour == 12:
+                            hour = 0
+                        time = f"{hour:02d}:{minutes:02d}:00"
+                    else:
+                        hour = int(time_digits)
+                        if hour == 12:
+                            hour = 0
+                        time = f"{hour:02d}:00:00"
+                else:
+                    time = "00:00:00"
+                
+                return datetime.strptime(f"{date.strftime('%Y-%m-%d')} {time}", "%Y-%m-%d %H:%M:%S")
+            except (ValueError, IndexError):
+                pass
+
+        # Handle month names (e.g., "may 12th")
+        months = {
+            'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+            'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
+        }
+        
+        for month_name, month_num in months.items():
+            if month_name in time_str:
+                try:
+                    # Extract the day
+                    day_part = time_str.split(month_name)[1].strip()
+                    day = int(''.join(filter(str.isdigit, day_part)))
+                    
+                    # Get current year
+                    year = datetime.now().year
+                    
+                    # Extract time if present
+                    time_part = time_str.split("at")[-1].strip() if "at" in time_str else "00:00:00"
+                    
+                    if "pm" in time_part:
+                        time_digits = time_part.split('pm')[0].strip().replace('.', ':')
+                        if ':' in time_digits:
+                            hour, minutes = map(int, time_digits.split(':'))
+                            if hour != 12:
+                                hour += 12
+                            time = f"{hour:02d}:{minutes:02d}:00"
+                        else:
+                            hour = int(time_digits)
+                            if hour != 12:
+                                hour += 12
+                            time = f"{hour:02d}:00:00"
+                    elif "am" in time_part:
+                        time_digits = time_part.split('am')[0].strip().replace('.', ':')
+                        if ':' in time_digits:
+                            hour, minutes = map(int, time_digits.split(':'))
+                            if hour == 12:
+                                hour = 0
+                            time = f"{hour:02d}:{minutes:02d}:00"
+                        else:
+                            hour = int(time_digits)
+                            if hour == 12:
+                                hour = 0
+                            time = f"{hour:02d}:00:00"
+                    else:
+                        time = "00:00:00"
+                    
+                    return datetime.strptime(f"{year}-{month_num:02d}-{day:02d} {time}", "%Y-%m-%d %H:%M:%S")
+                except (ValueError, IndexError):
+                    pass
+        
+        # Handle "tomorrow" format
+        if "tomorrow" in time_str:
+            date = datetime.now() + timedelta(days=1)
+            time_part = time_str.replace('tomorrow', '').strip()
+            
+            if "pm" in time_part:
+                time_digits = time_part.split('pm')[0].strip().replace('.', ':')
+                if ':' in time_digits:
+                    hour, minutes = map(int, time_digits.split(':'))
+                    if hour != 12:
+                        hour += 12
+                    time = f"{hour:02d}:{minutes:02d}:00"
+                else:
+                    hour = int(time_digits)
+                    if hour != 12:
+                        hour += 12
+                    time = f"{hour:02d}:00:00"
+            elif "am" in time_part:
+                time_digits = time_part.split('am')[0].strip().replace('.', ':')
+                if ':' in time_digits:
+                    hour, minutes = map(int, time_digits.split(':'))
+                    if hour == 12:
+                        hour = 0
+                    time = f"{hour:02d}:{minutes:02d}:00"
+                else:
+                    hour = int(time_digits)
+                    if hour == 12:
+                        hour = 0
+                    time = f"{hour:02d}:00:00"
+            else:
+                time = "00:00:00"
+            
+            return datetime.strptime(f"{date.strftime('%Y-%m-%d')} {time}", "%Y-%m-%d %H:%M:%S")
+        
+        # Handle today with time
+        elif any(x in time_str for x in ["am", "pm"]):
+            now = datetime.now()
+            time_part = time_str.lower()
+            
+            if "pm" in time_part:
+                time_digits = time_part.split('pm')[0].strip().replace('.', ':')
+                if ':' in time_digits:
+                    hour, minutes = map(int, time_digits.split(':'))
+                    if hour != 12:
+                        hour += 12
+                    time = f"{hour:02d}:{minutes:02d}:00"
+                else:
+                    hour = int(time_digits)
+                    if hour != 12:
+                        hour += 12
+                    time = f"{hour:02d}:00:00"
+            elif "am" in time_part:
+                time_digits = time_part.split('am')[0].strip().replace('.', ':')
+                if ':' in time_digits:
+                    hour, minutes = map(int, time_digits.split(':'))
+                    if hour == 12:
+                        hour = 0
+                    time = f"{hour:02d}:{minutes:02d}:00"
+                else:
+                    hour = int(time_digits)
+                    if hour == 12:
+                        hour = 0
+                    time = f"{hour:02d}:00:00"
+            else:
+                time = "00:00:00"
+            
+            return datetime.strptime(f"{now.strftime('%Y-%m-%d')} {time}", "%Y-%m-%d %H:%M:%S")
+        else:
+            # Try to parse as exact datetime
+            return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
+    except ValueError:
+        # If parsing fails, return current time + 5 minutes
+        return datetime.now() + timedelta(minutes=5)
+
+
+def _bench(parse, iterations, before_each=None):
+    start = time.perf_counter()
+    for i in range(iterations):
+        if before_each:
+            before_each()
+        parse(SAMPLES[i % len(SAMPLES)])
+    elapsed = time.perf_counter() - start
+    return round(iterations / elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--json", action="store_true", help="Print machine-readable results")
+    args = parser.parse_args()
+
+    results = {
+        "legacy_parses_per_second": _bench(legacy_parse_meeting_time, args.iterations),
+        "cold_parses_per_second": _bench(parse_meeting_time, args.iterations, _resolve.cache_clear),
+        "warm_parses_per_second": _bench(parse_meeting_time, args.iterations),
+    }
+    results["cold_speedup"] = round(results["cold_parses_per_second"] / results["legacy_parses_per_second"], 2)
+    results["warm_speedup"] = round(results["warm_parses_per_second"] / results["legacy_parses_per_second"], 2)
+
+    if args.json:
+        print(json.dumps(results))
+    else:
+        for name, value in results.items():
+            print(f"{name:>26}: {value}")
+
+
+if __name__ == "__main__":
+    main()
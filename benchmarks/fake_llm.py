@@ -0,0 +1,54 @@
+"""Deterministic, scripted model backend for running the ADK agents offline.
+
+A ScriptedLlm replays a fixed list of tool calls, one per model turn, and
+then answers with fixed text. Which step it is on is derived from the
+number of tool responses since the last user message, so the same request
+always produces the same conversation. An optional latency stands in for
+model time, and usage metadata is filled in with a size-based estimate.
+"""
+import asyncio
+from typing import Any, AsyncGenerator, Dict, List, Tuple
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.genai import types
+
+
+def _tool_steps_taken(contents: List[types.Content]) -> int:
+    steps = 0
+    for content in reversed(contents):
+        parts = content.parts or []
+        if any(part.function_response for part in parts):
+            steps += 1
+        elif content.role == "user":
+            break
+    return steps
+
+
+def _estimate_tokens(llm_request: LlmRequest) -> int:
+    size = sum(len(content.model_dump_json(exclude_none=True)) for content in llm_request.contents)
+    instruction = llm_request.config.system_instruction if llm_request.config else None
+    return (size + len(str(instruction or ""))) // 4
+
+
+class ScriptedLlm(BaseLlm):
+    model: str = "scripted"
+    calls: List[Tuple[str, Dict[str, Any]]] = []
+    text: str = "Done."
+    latency_ms: float = 0.0
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        step = _tool_steps_taken(llm_request.contents)
+        if step < len(self.calls) and self.calls[step][0] in llm_request.tools_dict:
+            name, args = self.calls[step]
+            part = types.Part(function_call=types.FunctionCall(name=name, args=args))
+        else:
+            part = types.Part(text=self.text)
+        yield LlmResponse(
+            content=types.Content(role="model", parts=[part]),
+            usage_metadata=types.GenerateContentResponseUsageMetadata(
+                prompt_token_count=_estimate_tokens(llm_request),
+                candidates_token_count=len(part.text or "") // 4 or 1
+            )
+        )
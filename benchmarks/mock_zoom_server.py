@@ -0,0 +1,266 @@
+"""Local stand-in for the Zoom OAuth and REST API used by the offline benchmarks.
+
+Serves the endpoints the tools call, from memory:
+    POST   /oauth/token                   S2S account_credentials grant
+    POST   /v2/users/me/meetings          create
+    GET    /v2/users/me/meetings          list, paginated with page_size/next_page_token, filtered by from/to
+    GET    /v2/meetings/{id}              get
+    PATCH  /v2/meetings/{id}              update (204)
+    DELETE /v2/meetings/{id}              delete (204)
+
+Every API response can be delayed (``latency_ms`` plus up to ``jitter_ms``)
+and a seeded fraction of API requests (``rate_limit_ratio``) is answered with
+429 and a ``Retry-After`` header, so client retries and backoff are exercised
+reproducibly. Point the package at it with ZOOM_API_BASE_URL=<url>/v2 and
+ZOOM_OAUTH_TOKEN_URL=<url>/oauth/token.
+
+Usage:
+    python benchmarks/mock_zoom_server.py [--port 8765] [--meetings 250] [--latency-ms 20] [--jitter-ms 10] [--rate-limit-ratio 0.05]
+"""
+import argparse
+import itertools
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/v2"
+DEFAULT_PAGE_SIZE = 30
+MAX_PAGE_SIZE = 300
+
+
+class MockZoomState:
+    """The meetings and fault-injection settings shared by all request threads."""
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, rate_limit_ratio=0.0, retry_after=0.1, seed=0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.meetings = {}
+        self.lock = threading.Lock()
+        self._ids = itertools.count(81000000000)
+        self._random = random.Random(seed)
+        self.stats = {"requests": 0, "rate_limited": 0, "tokens_issued": 0}
+
+    def add_meeting(self, fields):
+        with self.lock:
+            meeting_id = next(self._ids)
+            meeting = {
+                "id": meeting_id,
+                "uuid": f"mock-{meeting_id}",
+                "topic": "Mock meeting",
+                "type": 2,
+                "start_time": "2030-01-01T10:00:00Z",
+                "duration": 30,
+                "timezone": "UTC",
+                "status": "waiting",
+                "join_url": f"https://zoom.example/j/{meeting_id}",
+                "start_url": f"https://zoom.example/s/{meeting_id}",
+                **fields
+            }
+            self.meetings[meeting_id] = meeting
+            return dict(meeting)
+
+    def seed(self, count, start="2030-01-01", days=28):
+        """Add ``count`` meetings spread over ``days`` days from ``start`` and return their IDs."""
+        year, month, day = (int(part) for part in start.split("-"))
+        return [
+            self.add_meeting({
+                "topic": f"Seeded meeting {i}",
+                "start_time": f"{year:04d}-{month:02d}-{day + i % days:02d}T{9 + i % 8:02d}:00:00Z"
+            })["id"]
+            for i in range(count)
+        ]
+
+    def delay(self):
+        """Sleep for the configured latency and decide whether to answer 429."""
+        with self.lock:
+            self.stats["requests"] += 1
+            jitter = self._random.uniform(0, self.jitter_ms)
+            limited = self._random.random() < self.rate_limit_ratio
+            if limited:
+                self.stats["rate_limited"] += 1
+        if self.latency_ms or jitter:
+            time.sleep((self.latency_ms + jitter) / 1000)
+        return limited
+
+
+def make_handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Send headers and body in one segment; separate small writes on a
+        # keep-alive connection hit delayed ACKs and add ~40 ms per request
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, status, body=None, headers=None):
+            data = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+
+        def _api(self):
+            """Read the body and apply fault injection; return (path, query, json body) or None if answered."""
+            url = urlparse(self.path)
+            raw = self._body()
+            if url.path == "/oauth/token":
+                with state.lock:
+                    state.stats["tokens_issued"] += 1
+                self._send(200, {"access_token": "mock-token", "token_type": "bearer", "expires_in": 3600, "scope": "meeting:write"})
+                return None
+            if not self.headers.get("Authorization", "").startswith("Bearer "):
+                self._send(401, {"code": 124, "message": "Invalid access token."})
+                return None
+            if state.delay():
+                self._send(429, {"code": 429, "message": "Too many requests."},
+                           {"Retry-After": str(state.retry_after), "X-RateLimit-Category": "Light"})
+                return None
+            if not url.path.startswith(API_PREFIX):
+                self._send(404, {"code": 404, "message": "Not found."})
+                return None
+            return url.path[len(API_PREFIX):], parse_qs(url.query), json.loads(raw) if raw else {}
+
+        def _meeting_id(self, path):
+            try:
+                return int(path.rsplit("/", 1)[1])
+            except ValueError:
+                return None
+
+        def _missing(self):
+            self._send(404, {"code": 3001, "message": "Meeting does not exist."})
+
+        def do_POST(self):
+            request = self._api()
+            if request is None:
+                return
+            path, _, body = request
+            if path != "/users/me/meetings":
+                return self._missing()
+            self._send(201, state.add_meeting({key: value for key, value in body.items() if key != "settings"}))
+
+        def do_GET(self):
+            request = self._api()
+            if request is None:
+                return
+            path, query, _ = request
+            if path == "/users/me/meetings":
+                return self._list(query)
+            with state.lock:
+                meeting = state.meetings.get(self._meeting_id(path))
+            if meeting is None:
+                return self._missing()
+            self._send(200, meeting)
+
+        def _list(self, query):
+            page_size = min(int(query.get("page_size", [DEFAULT_PAGE_SIZE])[0]), MAX_PAGE_SIZE)
+            offset = int(query.get("next_page_token", ["0"])[0] or 0)
+            from_date, to_date = query.get("from", [""])[0], query.get("to", ["9999-12-31"])[0]
+            with state.lock:
+                meetings = sorted(
+                    (meeting for meeting in state.meetings.values() if from_date <= meeting["start_time"][:10] <= to_date),
+                    key=lambda meeting: (meeting["start_time"], meeting["id"])
+                )
+            page = meetings[offset:offset + page_size]
+            next_page_token = str(offset + page_size) if offset + page_size < len(meetings) else ""
+            self._send(200, {
+                "page_size": page_size,
+                "total_records": len(meetings),
+                "next_page_token": next_page_token,
+                "meetings": [{key: value for key, value in meeting.items() if key != "start_url"} for meeting in page]
+            })
+
+        def do_PATCH(self):
+            request = self._api()
+            if request is None:
+                return
+            path, _, body = request
+            with state.lock:
+                meeting = state.meetings.get(self._meeting_id(path))
+                if meeting is not None:
+                    meeting.update(body)
+            if meeting is None:
+                return self._missing()
+            self._send(204)
+
+        def do_DELETE(self):
+            request = self._api()
+            if request is None:
+                return
+            path, _, _ = request
+            with state.lock:
+                meeting = state.meetings.pop(self._meeting_id(path), None)
+            if meeting is None:
+                return self._missing()
+            self._send(204)
+
+    return Handler
+
+
+class MockZoomServer:
+    """Runs the mock API on a background thread; ``url`` is its base URL once started."""
+
+    def __init__(self, host="127.0.0.1", port=0, **state_options):
+        self.state = MockZoomState(**state_options)
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(self.state))
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--meetings", type=int, default=250, help="Meetings to seed in January 2030")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--rate-limit-ratio", type=float, default=0.0, help="Fraction of API requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=0.1, help="Retry-After seconds sent with a 429")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockZoomServer(
+        args.host, args.port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit_ratio, retry_after=args.retry_after, seed=args.seed
+    )
+    server.state.seed(args.meetings)
+    print(f"Mock Zoom API on {server.url}")
+    print(f"  ZOOM_API_BASE_URL={server.url}{API_PREFIX}")
+    print(f"  ZOOM_OAUTH_TOKEN_URL={server.url}/oauth/token")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
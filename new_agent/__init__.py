@@ -1,4 +1,14 @@
-from . import agent
-from .agent import root_agent
+import importlib
+from typing import Any
 
-__all__ = ['agent', 'root_agent'] 
\ No newline at end of file
+__all__ = ['agent', 'root_agent']
+
+
+def __getattr__(name: str) -> Any:
+    # Building the agents imports google.adk, so defer it until something
+    # asks for them; tool modules can then be imported on their own cheaply.
+    if name == 'agent':
+        return importlib.import_module('.agent', __name__)
+    if name == 'root_agent':
+        return importlib.import_module('.agent', __name__).root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,24 +1,36 @@
-from google.adk.agents import Agent, SequentialAgent, LlmAgent
-from .gmail import check_emails, mark_as_read
+from google.adk.agents import Agent, SequentialAgent, ParallelAgent, LlmAgent
+from .workflow import (
+    EmailTriageAgent, CalendarSnapshotAgent, UpcomingMeetingsAgent, skip_analysis_when_triaged, skip_meeting_when_not_required, record_meeting_outcome,
+    skip_calendar_when_no_meeting, skip_joiner_when_no_meeting
+)
 from .zoom import (
-    create_zoom_meeting, update_zoom_meeting, delete_zoom_meeting,
-    get_zoom_meeting, list_zoom_meetings, start_zoom_meeting, join_zoom_meeting,
-    open_zoom_url
+    create_zoom_meeting_async, update_zoom_meeting_async, delete_zoom_meeting_async,
+    get_zoom_meeting_async, list_zoom_meetings_async, start_zoom_meeting_async, join_zoom_meeting_async,
+    open_zoom_url_async
+)
+from .zoom_bulk import (
+    bulk_create_zoom_meetings_async, bulk_update_zoom_meetings_async, bulk_delete_zoom_meetings_async
 )
 from .calendar import add_to_calendar, list_calendar_events
+from . import llm_cache
+from .scheduling import check_conflicts_async, find_free_slots_async
 from datetime import datetime, timedelta
 
-# Email Checker Agent - Handles checking for new emails
-email_checker_agent = LlmAgent(
-    name="EmailCheckerAgent",
-    model="gemini-2.0-flash",
-    description="Checks for new emails and provides a summary",
-    instruction="""You are an email checking assistant.
-Your task is to check for new emails and provide a clear summary of what you find.
-Focus on urgent and important emails, and flag any potential spam.
-""",
-    tools=[check_emails],
-    output_key="email_check_result"
+# Email Triage Agent - Checks for new emails and triages them with local rules
+email_triage_agent = EmailTriageAgent(
+    name="EmailTriageAgent",
+    description="Checks for new emails and scores urgency, meeting intent and spam without a model call"
+)
+
+# Prefetch Agent - Loads everything the later stages read, concurrently and without model calls
+prefetch_agent = ParallelAgent(
+    name="PrefetchAgent",
+    description="Triages email, loads the calendar and lists upcoming Zoom meetings at the same time",
+    sub_agents=[
+        email_triage_agent,
+        CalendarSnapshotAgent(name="CalendarSnapshotAgent", description="Loads calendar events from today on"),
+        UpcomingMeetingsAgent(name="UpcomingMeetingsAgent", description="Lists Zoom meetings in the next 24 hours")
+    ]
 )
 
 # Email Analyzer Agent - Analyzes emails and determines if meetings are needed
@@ -27,6 +39,8 @@ email_analyzer_agent = LlmAgent(
     model="gemini-2.0-flash",
     description="Analyzes emails and identifies meeting requirements",
     instruction="""You are an email analysis assistant.
+The emails below were triaged by rules first. Tagged emails are already decided; only the
+emails the rules could not decide need your judgement, but your answer covers all of them.
 Based on the email check results, you should:
 1. Identify if any emails require scheduling a meeting
 2. Extract meeting requirements (topic, urgency)
@@ -48,9 +62,18 @@ For urgent meetings:
 - Set URGENCY to "urgent" if the email mentions immediate, urgent, or ASAP meetings
 - Set URGENCY to "normal" for regular meetings
 
-Email check results:
+Email check results (tags from the rules):
 {email_check_result}
+
+Emails the rules could not decide:
+{ambiguous_emails}
 """,
+    # Everything the analyzer needs is in its instruction; leaving out the
+    # conversation history also keeps the cache key stable between polls
+    include_contents="none",
+    before_agent_callback=skip_analysis_when_triaged,
+    before_model_callback=llm_cache.before_model_callback,
+    after_model_callback=llm_cache.after_model_callback,
     output_key="email_analysis"
 )
 
@@ -130,6 +153,32 @@ For joining a meeting:
 Opening meeting "MEETING_TOPIC" in a new tab...
 
 
+For free slots:
+Free slots of at least DURATION minutes:
+
+1. DATE_1 from START_TIME_1 to END_TIME_1
+
+2. DATE_2 from START_TIME_2 to END_TIME_2
+
+...
+
+
+For a scheduling conflict:
+The requested time overlaps with:
+
+1. "CONFLICT_TITLE_1" from START_TIME_1 to END_TIME_1
+
+...
+
+Suggest a free slot instead of creating the meeting.
+
+
+For bulk operations:
+NUMBER_SUCCEEDED of NUMBER_TOTAL meetings were CREATED/UPDATED/DELETED.
+
+List each failed meeting with its error on its own line.
+
+
 For errors:
 Error: ERROR_MESSAGE
 
@@ -147,11 +196,20 @@ Guidelines:
 - Do not ask the user for the meeting ID if there is a recent meeting in context—just use it
 - Always format URLs as Markdown links with descriptive text
 - When the user says "start meeting" or "join meeting" followed by a meeting topic or ID, use the appropriate function to open the meeting in a new tab
+- Before creating or rescheduling a meeting, call check_conflicts with the new start time and duration; if it reports a conflict, do not create the meeting and offer free slots from find_free_slots instead
+- When the user asks when they are free or for a good time to meet, use find_free_slots instead of listing meetings
+- A tool result may hold the meeting in a single "meeting" record (or a "meetings" list of records) instead of "details"; read the values from whichever is present
+- When listing meetings only to find one or to count them, pass fields (e.g. ["meeting_id", "topic", "start_time"]) so only those fields are returned
+- When the user asks to create, reschedule or cancel several meetings at once, use the bulk functions with all meetings in a single call instead of calling the single-meeting functions repeatedly
 """,
     tools=[
-        create_zoom_meeting, update_zoom_meeting, delete_zoom_meeting,
-        get_zoom_meeting, list_zoom_meetings, start_zoom_meeting, join_zoom_meeting
+        create_zoom_meeting_async, update_zoom_meeting_async, delete_zoom_meeting_async,
+        get_zoom_meeting_async, list_zoom_meetings_async, start_zoom_meeting_async, join_zoom_meeting_async,
+        bulk_create_zoom_meetings_async, bulk_update_zoom_meetings_async, bulk_delete_zoom_meetings_async,
+        check_conflicts_async, find_free_slots_async
     ],
+    before_agent_callback=skip_meeting_when_not_required,
+    after_tool_callback=record_meeting_outcome,
     output_key="meeting_result"
 )
 
@@ -169,6 +227,7 @@ When a meeting has been scheduled:
 
 2. If meeting was successfully created:
    - Extract meeting details from the meeting_result
+   - If the meeting ID is already in the current calendar below, do not add it again
    - Add to calendar ONLY ONCE
    - Return ONLY the calendar addition confirmation
    - DO NOT add multiple confirmations
@@ -184,8 +243,12 @@ DO NOT:
 
 Meeting result:
 {meeting_result}
+
+Current calendar:
+{calendar_snapshot}
 """,
     tools=[add_to_calendar, list_calendar_events],
+    before_agent_callback=skip_calendar_when_no_meeting,
     output_key="calendar_result"
 )
 
@@ -197,7 +260,8 @@ meeting_joiner_agent = LlmAgent(
     instruction="""You are a meeting attendance assistant.
 After a meeting has been added to the calendar:
 
-1. Check for any meetings starting in the next 5 minutes
+1. Check the upcoming meetings below (and the calendar result) for meetings starting in the next 5 minutes;
+   only list Zoom meetings again if the list below could not be loaded
 2. If an urgent meeting is found:
    - Join the meeting using the Zoom URL
    - Confirm that you've joined
@@ -206,8 +270,12 @@ After a meeting has been added to the calendar:
 
 Calendar result:
 {calendar_result}
+
+Upcoming meetings:
+{upcoming_meetings}
 """,
-    tools=[list_zoom_meetings, open_zoom_url],
+    tools=[list_zoom_meetings_async, open_zoom_url_async],
+    before_agent_callback=skip_joiner_when_no_meeting,
     output_key="meeting_join_result"
 )
 
@@ -216,7 +284,7 @@ email_workflow = SequentialAgent(
     name="EmailWorkflowAgent",
     description="Manages the email checking, meeting scheduling, calendar management, and meeting joining workflow",
     sub_agents=[
-        email_checker_agent,
+        prefetch_agent,
         email_analyzer_agent,
         zoom_meeting_agent,
         calendar_manager_agent,
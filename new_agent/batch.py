@@ -0,0 +1,267 @@
+"""Replay a JSONL file of requests through the agent.
+
+Each input line is a JSON object whose ``request`` field (see ``--field``)
+holds the request text; a bare JSON string is accepted as well. Records run
+concurrently, each in its own session, and every result is appended to the
+output JSONL as soon as it finishes, tagged with its input line number.
+
+Progress is checkpointed to ``<output>.checkpoint`` as the last input line
+up to which every record is done, together with its byte offset, so an
+interrupted run resumes by seeking there instead of starting over.
+
+Usage:
+    python -m new_agent.batch INPUT OUTPUT [--concurrency 8] [--field request] [--timeout 120] [--no-resume]
+"""
+import os
+import sys
+import json
+import time
+import uuid
+import asyncio
+import logging
+import argparse
+from .config import get_float, get_int
+from typing import Dict, Any, List, Optional, Set, Tuple
+from .main import end_session, run_zoom_request
+
+logger = logging.getLogger(__name__)
+
+BATCH_USER_ID = "batch"
+
+
+class Watermark:
+    """Tracks the last input line up to which every record has finished.
+
+    Records finish out of order, so completions past a gap are held until
+    the gap closes. Only the watermark is safe to resume from.
+    """
+
+    def __init__(self, line: int = 0, offset: int = 0):
+        self.line = line
+        self.offset = offset
+        self._ahead: Dict[int, int] = {}
+
+    def complete(self, line: int, offset: int) -> None:
+        self._ahead[line] = offset
+        while self.line + 1 in self._ahead:
+            self.line += 1
+            self.offset = self._ahead.pop(self.line)
+
+
+def _load_checkpoint(path: str) -> Tuple[int, int]:
+    try:
+        with open(path, 'r') as f:
+            checkpoint = json.load(f)
+        return checkpoint["line"], checkpoint["offset"]
+    except (OSError, ValueError, KeyError):
+        return 0, 0
+
+
+def _save_checkpoint(path: str, input_path: str, watermark: Watermark) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump({"input": input_path, "line": watermark.line, "offset": watermark.offset}, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _truncate_torn_tail(path: str, chunk_size: int = 64 * 1024) -> None:
+    """Cut a partially written last line off the output so resumed results start on a line of their own."""
+    try:
+        f = open(path, 'rb+')
+    except FileNotFoundError:
+        return
+    with f:
+        end = f.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            start = max(0, position - chunk_size)
+            f.seek(start)
+            chunk = f.read(position - start)
+            newline = chunk.rfind(b'\n')
+            if newline != -1:
+                position = start + newline + 1
+                break
+            position = start
+        if position < end:
+            logger.warning("Dropping %d bytes of a partially written line at the end of %s", end - position, path)
+            f.truncate(position)
+
+
+def _finished_after(output_path: str, line: int) -> Set[int]:
+    """Return the input lines past the checkpoint that already have a result in the output.
+
+    This is at most the records that were in flight when the run stopped,
+    so they are skipped on resume instead of written twice.
+    """
+    finished = set()
+    try:
+        with open(output_path, 'r') as f:
+            for raw in f:
+                try:
+                    result_line = json.loads(raw)["line"]
+                except (ValueError, KeyError, TypeError):
+                    continue  # a partially written last line
+                if result_line > line:
+                    finished.add(result_line)
+    except OSError:
+        pass
+    return finished
+
+
+def _request_text(record: Any, field: str) -> Optional[str]:
+    if isinstance(record, str):
+        return record
+    if isinstance(record, dict) and isinstance(record.get(field), str):
+        return record[field]
+    return None
+
+
+async def _run_record(line: int, raw: bytes, field: str, timeout: float) -> Dict[str, Any]:
+    """Run one input line in its own session and return its result record."""
+    started = time.perf_counter()
+    try:
+        record = json.loads(raw)
+    except ValueError as e:
+        return {"line": line, "id": None, "status": "error", "response": f"Invalid JSON: {str(e)}"}
+    record_id = record.get("id", record.get("request_id")) if isinstance(record, dict) else None
+    request = _request_text(record, field)
+    if request is None:
+        return {"line": line, "id": record_id, "status": "error", "response": f"Missing '{field}' field"}
+
+    session_id = f"{BATCH_USER_ID}-{line}-{uuid.uuid4().hex[:8]}"
+    try:
+        result = await asyncio.wait_for(
+            run_zoom_request(request, BATCH_USER_ID, session_id, request_id=session_id), timeout
+        )
+        response, status = result.text, "success" if result.ok else "error"
+    except asyncio.TimeoutError:
+        response, status = f"Timed out after {timeout} seconds", "error"
+    finally:
+        # One session per record; drop it so a long replay does not keep every conversation in memory
+        await end_session(BATCH_USER_ID, session_id)
+    return {
+        "line": line,
+        "id": record_id,
+        "status": status,
+        "response": response,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+
+
+async def run_batch(
+    input_path: str,
+    output_path: str,
+    concurrency: Optional[int] = None,
+    field: str = "request",
+    timeout: Optional[float] = None,
+    resume: bool = True,
+    checkpoint_path: Optional[str] = None,
+    checkpoint_every: Optional[int] = None
+) -> Dict[str, Any]:
+    """Stream ``input_path`` through the agent and append results to ``output_path``.
+
+    Only a bounded window of records is held in memory: the reader waits
+    once ``2 * concurrency`` records are queued. Settings left as None come
+    from BATCH_CONCURRENCY, BATCH_TIMEOUT and BATCH_CHECKPOINT_EVERY.
+    Returns counts and throughput. If reading the input fails, the records
+    already read still run; the failure counts in ``failed`` and is
+    described in ``error``.
+    """
+    concurrency = concurrency or get_int('BATCH_CONCURRENCY', 8)
+    timeout = timeout or get_float('BATCH_TIMEOUT', 120.0)
+    checkpoint_every = checkpoint_every or get_int('BATCH_CHECKPOINT_EVERY', 50)
+    checkpoint_path = checkpoint_path or f"{output_path}.checkpoint"
+    if resume:
+        _truncate_torn_tail(output_path)
+    start_line, start_offset = _load_checkpoint(checkpoint_path) if resume else (0, 0)
+    already_done = _finished_after(output_path, start_line) if resume else set()
+    watermark = Watermark(start_line, start_offset)
+    queue: "asyncio.Queue[Optional[Tuple[int, int, bytes]]]" = asyncio.Queue(maxsize=2 * concurrency)
+    counts = {"processed": 0, "failed": 0, "skipped": len(already_done)}
+    read_error: List[str] = []
+    started = time.perf_counter()
+
+    out = open(output_path, 'a' if resume else 'w')
+
+    def checkpoint() -> None:
+        # Results must be on disk before the checkpoint claims them
+        out.flush()
+        os.fsync(out.fileno())
+        _save_checkpoint(checkpoint_path, input_path, watermark)
+
+    async def read() -> None:
+        line = start_line
+        try:
+            with open(input_path, 'rb') as f:
+                f.seek(start_offset)
+                for raw in iter(f.readline, b''):
+                    line += 1
+                    if line in already_done or not raw.strip():
+                        watermark.complete(line, f.tell())
+                        continue
+                    await queue.put((line, f.tell(), raw))
+        except Exception as e:
+            # Records already queued still finish; the checkpoint stays before the unread lines
+            logger.error("Reading %s failed after line %d: %s", input_path, line, e)
+            read_error.append(f"Reading {input_path} failed after line {line}: {str(e)}")
+            counts["failed"] += 1
+        finally:
+            for _ in range(concurrency):
+                await queue.put(None)
+
+    async def work() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            line, offset, raw = item
+            result = await _run_record(line, raw, field, timeout)
+            out.write(json.dumps(result) + "\n")
+            watermark.complete(line, offset)
+            counts["processed"] += 1
+            counts["failed"] += result["status"] != "success"
+            if counts["processed"] % checkpoint_every == 0:
+                checkpoint()
+                logger.info("%d records done, resumable from line %d", counts["processed"], watermark.line)
+
+    try:
+        await asyncio.gather(read(), *(work() for _ in range(concurrency)))
+    finally:
+        checkpoint()
+        out.close()
+
+    elapsed = time.perf_counter() - started
+    return {
+        **counts,
+        "error": read_error[0] if read_error else None,
+        "last_line": watermark.line,
+        "elapsed_s": round(elapsed, 2),
+        "requests_per_second": round(counts["processed"] / elapsed, 1) if elapsed else 0.0
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="JSONL file of requests")
+    parser.add_argument("output", help="JSONL file the results are appended to")
+    parser.add_argument("--concurrency", type=int, help="Records run at once (default: BATCH_CONCURRENCY)")
+    parser.add_argument("--field", default="request", help="Field of each record that holds the request text")
+    parser.add_argument("--timeout", type=float, help="Seconds allowed per record (default: BATCH_TIMEOUT)")
+    parser.add_argument("--checkpoint", default=None, help="Checkpoint file (defaults to OUTPUT.checkpoint)")
+    parser.add_argument("--checkpoint-every", type=int, help="Records between checkpoints (default: BATCH_CHECKPOINT_EVERY)")
+    parser.add_argument("--no-resume", action="store_true", help="Start from the first line and overwrite OUTPUT")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(run_batch(
+        args.input, args.output, args.concurrency, args.field, args.timeout,
+        resume=not args.no_resume, checkpoint_path=args.checkpoint, checkpoint_every=args.checkpoint_every
+    ))
+    print(json.dumps(summary))
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
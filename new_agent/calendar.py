@@ -1,51 +1,492 @@
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta
+import atexit
 import json
 import os
+import sqlite3
+import threading
+import time
+import uuid
+from .config import get_float, get_int, get_setting
+from .telemetry import traced
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Relative paths are resolved against the working directory on first use
+DEFAULT_CALENDAR_FILE = "mock_calendar.json"
+
+def _range_bounds(date: Optional[str], from_time: Optional[str], to_time: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Turn date/range filters into [low, high) bounds on the start_time string.
+
+    start_time is stored as "YYYY-MM-DD HH:MM:SS", so bounds compare
+    lexicographically. A date-only ``to_time`` includes that whole day.
+    """
+    low, high = from_time, None
+    if date:
+        low = max(low or date, date)
+        high = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    if to_time:
+        if len(to_time) == 10:
+            end = datetime.strptime(to_time, "%Y-%m-%d") + timedelta(days=1)
+        else:
+            end = datetime.strptime(to_time, "%Y-%m-%d %H:%M:%S") + timedelta(seconds=1)
+        end_str = end.strftime("%Y-%m-%d %H:%M:%S")
+        high = min(high, end_str) if high else end_str
+    return low, high
+
+def _lock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+def _unlock_file(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+class InterProcessLock:
+    """Reentrant lock shared by the threads of this process and, through an
+    advisory lock on ``lock_file``, by every process using the same file."""
+
+    def __init__(self, lock_file: str):
+        self.lock_file = lock_file
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    def __enter__(self):
+        self._lock.acquire()
+        if self._depth == 0:
+            try:
+                if self._file is None:
+                    self._file = open(self.lock_file, 'a+b')
+                _lock_file(self._file)
+            except BaseException:
+                self._lock.release()
+                raise
+        self._depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self._depth -= 1
+        if self._depth == 0:
+            _unlock_file(self._file)
+        self._lock.release()
+
+def _file_state(path: str) -> Optional[Tuple[int, int, int]]:
+    """Identify a version of a file by inode, modification time and size"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+def _atomic_write_json(path: str, data: Any, **dump_kwargs) -> Tuple[int, int, int]:
+    """Write JSON to a temporary file and rename it over ``path``.
+
+    Readers see either the old or the new file, never a partial one.
+    Returns the file state of the new file.
+    """
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, **dump_kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+        st = os.fstat(f.fileno())
+    os.replace(tmp_file, path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+def _read_json(path: str) -> Tuple[Any, Tuple[int, int, int]]:
+    """Read a JSON file together with the state of the exact version read"""
+    with open(path, 'r') as f:
+        st = os.fstat(f.fileno())
+        return json.load(f), (st.st_ino, st.st_mtime_ns, st.st_size)
 
 # Mock calendar storage
 class CalendarStorage:
-    def __init__(self):
-        self.calendar_file = "mock_calendar.json"
+    """Calendar stored as one JSON file.
+
+    Several processes can share the file: every write holds an advisory lock
+    on ``<calendar_file>.lock``, first picks up changes made by others, and
+    replaces the file atomically. Readers compare the file's inode, mtime
+    and size with the version they loaded and reload only when it changed.
+    """
+
+    def __init__(self, calendar_file: str = DEFAULT_CALENDAR_FILE):
+        self.calendar_file = calendar_file
+        # Bumped on every change so derived indexes know when to rebuild
+        self.revision = 0
+        self._file_lock = InterProcessLock(calendar_file + ".lock")
+        self._file_state: Optional[Tuple[int, int, int]] = None
         self._load_calendar()
 
     def _load_calendar(self):
         """Load calendar from file or create new if doesn't exist"""
-        if os.path.exists(self.calendar_file):
-            with open(self.calendar_file, 'r') as f:
-                self.events = json.load(f)
-        else:
-            self.events = []
-            self._save_calendar()
+        with self._file_lock:
+            if os.path.exists(self.calendar_file):
+                self.events, self._file_state = _read_json(self.calendar_file)
+            else:
+                self.events = []
+                self._save_calendar()
 
     def _save_calendar(self):
         """Save calendar to file"""
-        with open(self.calendar_file, 'w') as f:
-            json.dump(self.events, f, indent=2)
+        self._file_state = _atomic_write_json(self.calendar_file, self.events, indent=2)
 
-    def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Add new event to calendar"""
-        event = {
-            "id": str(len(self.events) + 1),
+    def _is_stale(self) -> bool:
+        return _file_state(self.calendar_file) != self._file_state
+
+    def refresh(self):
+        """Reload the calendar if another process changed it"""
+        if self._is_stale():
+            with self._file_lock:
+                if self._is_stale():
+                    self._load_calendar()
+                    self.revision += 1
+
+    def _new_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        # Random IDs stay unique across processes sharing the same calendar
+        return {
+            "id": uuid.uuid4().hex,
             "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             **event_data
         }
-        self.events.append(event)
-        self._save_calendar()
+
+    def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add new event to calendar"""
+        with self._file_lock:
+            self.refresh()
+            event = self._new_event(event_data)
+            self.events.append(event)
+            self._save_calendar()
+            self.revision += 1
+            return event
+
+    def list_events(
+        self,
+        date: str = None,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        meeting_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List events, optionally filtered by date, start time range or meeting ID"""
+        self.refresh()
+        low, high = _range_bounds(date, from_time, to_time)
+        if low is None and high is None and not meeting_id:
+            return self.events
+        return [
+            event for event in self.events
+            if (low is None or event.get("start_time", "") >= low)
+            and (high is None or event.get("start_time", "") < high)
+            and (not meeting_id or str(event.get("meeting_id", "")) == str(meeting_id))
+        ]
+
+class JournalCalendarStorage(CalendarStorage):
+    """Calendar storage backed by a snapshot plus an append-only journal.
+
+    Each added event is appended to ``<calendar_file>.journal`` as one JSON
+    line, so adding costs the same no matter how large the calendar is.
+    Appends are fsynced in groups (every ``group_commit_size`` appends or
+    ``group_commit_interval`` seconds). Once the journal grows past the
+    compaction threshold it is folded into the snapshot, which is written to
+    a temporary file and atomically renamed over ``calendar_file``. Loading
+    reads the snapshot and replays the journal on top of it.
+
+    Processes sharing the calendar append under the advisory file lock and
+    remember how far they have read the journal, so picking up other
+    processes' events only reads the new lines. A changed snapshot means
+    another process compacted, and triggers a full reload.
+    """
+
+    def __init__(
+        self,
+        calendar_file: str = DEFAULT_CALENDAR_FILE,
+        group_commit_size: int = 64,
+        group_commit_interval: float = 0.05,
+        compact_threshold: int = 1000,
+        compact_interval: float = 300.0
+    ):
+        self.journal_file = calendar_file + ".journal"
+        self.group_commit_size = group_commit_size
+        self.group_commit_interval = group_commit_interval
+        self.compact_threshold = compact_threshold
+        self.compact_interval = compact_interval
+        self._journal = None
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._snapshot_entries = 0
+        self._event_ids = set()
+        self._pending = 0
+        self._sync_timer: Optional[threading.Timer] = None
+        self._last_compaction = time.monotonic()
+        super().__init__(calendar_file)
+        atexit.register(self.close)
+
+    def _load_calendar(self):
+        """Load the snapshot and replay the journal on top of it"""
+        with self._file_lock:
+            if os.path.exists(self.calendar_file):
+                self.events, self._file_state = _read_json(self.calendar_file)
+            else:
+                self.events = []
+                self._write_snapshot()
+            self._snapshot_entries = len(self.events)
+            self._event_ids = {event.get("id") for event in self.events}
+            self._journal_offset = 0
+            self._journal_entries = 0
+            self._replay_journal()
+            if self._journal_offset < os.path.getsize(self.journal_file):
+                # A torn write from a crash; everything after it is dropped.
+                # Safe here because no other process appends without the lock.
+                with open(self.journal_file, 'r+b') as f:
+                    f.truncate(self._journal_offset)
+            if self._journal is None:
+                self._journal = open(self.journal_file, 'ab')
+
+    def _replay_journal(self):
+        """Apply journal lines written since ``_journal_offset``"""
+        if not os.path.exists(self.journal_file):
+            open(self.journal_file, 'ab').close()
+            return
+        with open(self.journal_file, 'rb') as f:
+            f.seek(self._journal_offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    # Still being written, or torn
+                    break
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break
+                self._journal_offset += len(line)
+                self._journal_entries += 1
+                # Entries already folded into the snapshot by an interrupted compaction
+                if event.get("id") not in self._event_ids:
+                    self._event_ids.add(event.get("id"))
+                    self.events.append(event)
+
+    def _save_calendar(self):
+        """Persist by compacting the journal into the snapshot"""
+        self.compact()
+
+    def _write_snapshot(self):
+        """Atomically replace the snapshot with the current events"""
+        self._file_state = _atomic_write_json(self.calendar_file, self.events, separators=(',', ':'))
+
+    def refresh(self):
+        """Pick up events other processes appended or compacted since the last look"""
+        snapshot_changed = _file_state(self.calendar_file) != self._file_state
+        journal_size = _file_state(self.journal_file)
+        if not snapshot_changed and journal_size is not None and journal_size[2] == self._journal_offset:
+            return
+        with self._file_lock:
+            journal_size = _file_state(self.journal_file)
+            if _file_state(self.calendar_file) != self._file_state or journal_size is None \
+                    or journal_size[2] < self._journal_offset:
+                self._load_calendar()
+                self.revision += 1
+            elif journal_size[2] > self._journal_offset:
+                known = len(self.events)
+                self._replay_journal()
+                if len(self.events) != known:
+                    self.revision += 1
+
+    def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Append a new event to the journal"""
+        with self._file_lock:
+            self.refresh()
+            event = self._new_event(event_data)
+            line = json.dumps(event).encode() + b"\n"
+            self._journal.write(line)
+            self._journal.flush()
+            self._journal_offset += len(line)
+            self.events.append(event)
+            self._event_ids.add(event["id"])
+            self.revision += 1
+            self._journal_entries += 1
+            self._pending += 1
+            if self._pending >= self.group_commit_size:
+                self._sync()
+            elif self._sync_timer is None:
+                self._sync_timer = threading.Timer(self.group_commit_interval, self.sync)
+                self._sync_timer.daemon = True
+                self._sync_timer.start()
+            if self._should_compact():
+                self.compact()
+            return event
+
+    def _should_compact(self) -> bool:
+        if self._journal_entries >= max(self.compact_threshold, self._snapshot_entries // 2):
+            return True
+        return self._journal_entries > 0 and time.monotonic() - self._last_compaction >= self.compact_interval
+
+    def _sync(self):
+        if self._sync_timer is not None:
+            self._sync_timer.cancel()
+            self._sync_timer = None
+        if self._pending and self._journal is not None:
+            os.fsync(self._journal.fileno())
+            self._pending = 0
+
+    def sync(self):
+        """Make every appended event durable"""
+        with self._file_lock:
+            self._sync()
+
+    def compact(self):
+        """Fold the journal into the snapshot and start an empty journal"""
+        with self._file_lock:
+            self.refresh()
+            self._sync()
+            self._write_snapshot()
+            # Truncate in place: other processes keep appending through their
+            # own O_APPEND handles to the same file
+            self._journal.truncate(0)
+            os.fsync(self._journal.fileno())
+            self._journal_offset = 0
+            self._snapshot_entries = len(self.events)
+            self._journal_entries = 0
+            self._last_compaction = time.monotonic()
+
+    def close(self):
+        """Flush pending appends and close the journal"""
+        with self._file_lock:
+            if self._journal is not None:
+                self._sync()
+                self._journal.close()
+                self._journal = None
+
+class SQLiteCalendarStorage(CalendarStorage):
+    """Calendar storage backed by SQLite.
+
+    Events are stored as JSON with their start time and meeting ID in
+    indexed columns, so date and range queries use an index range scan
+    instead of a full pass over the calendar. The database runs in WAL mode
+    and every thread gets its own connection, so several threads and
+    processes can share one calendar; SQLite does its own locking.
+    """
+
+    def __init__(self, calendar_file: str = DEFAULT_CALENDAR_FILE):
+        self.db_file = os.path.splitext(calendar_file)[0] + ".db"
+        self._local = threading.local()
+        super().__init__(calendar_file)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.db_file, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.data_version = None
+        return connection
+
+    def _load_calendar(self):
+        """Create the schema if needed"""
+        with self._connection() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS events ("
+                "id TEXT PRIMARY KEY, start_time TEXT, meeting_id TEXT, data TEXT NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_events_start_time ON events(start_time)")
+            connection.execute("CREATE INDEX IF NOT EXISTS idx_events_meeting_id ON events(meeting_id)")
+
+    def _save_calendar(self):
+        """Every write is committed immediately"""
+
+    def refresh(self):
+        """Bump the revision if another connection committed since the last look"""
+        (data_version,) = self._connection().execute("PRAGMA data_version").fetchone()
+        if self._local.data_version is not None and data_version != self._local.data_version:
+            self.revision += 1
+        self._local.data_version = data_version
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        return self.list_events()
+
+    def add_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a new event"""
+        event = self._new_event(event_data)
+        with self._connection() as connection:
+            connection.execute(
+                "INSERT INTO events (id, start_time, meeting_id, data) VALUES (?, ?, ?, ?)",
+                (event["id"], event.get("start_time", ""), str(event.get("meeting_id", "")), json.dumps(event))
+            )
+        self.revision += 1
         return event
 
-    def list_events(self, date: str = None) -> List[Dict[str, Any]]:
-        """List events, optionally filtered by date"""
-        if date:
-            return [
-                event for event in self.events 
-                if event.get("date", "").startswith(date)
-            ]
-        return self.events
+    def list_events(
+        self,
+        date: str = None,
+        from_time: Optional[str] = None,
+        to_time: Optional[str] = None,
+        meeting_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """List events ordered by start time, optionally filtered by date, range or meeting ID"""
+        low, high = _range_bounds(date, from_time, to_time)
+        clauses, params = [], []
+        if low is not None:
+            clauses.append("start_time >= ?")
+            params.append(low)
+        if high is not None:
+            clauses.append("start_time < ?")
+            params.append(high)
+        if meeting_id:
+            clauses.append("meeting_id = ?")
+            params.append(str(meeting_id))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._connection().execute(f"SELECT data FROM events{where} ORDER BY start_time", params)
+        return [json.loads(data) for (data,) in rows]
 
-# Initialize calendar storage
-calendar_storage = CalendarStorage()
+def create_calendar_storage(backend: Optional[str] = None, calendar_file: Optional[str] = None) -> CalendarStorage:
+    """Create the calendar storage for the given or configured backend ("json", "journal" or "sqlite")"""
+    backend = backend or get_setting("CALENDAR_BACKEND", "json")
+    calendar_file = calendar_file or get_setting("CALENDAR_FILE", DEFAULT_CALENDAR_FILE)
+    if backend == "journal":
+        return JournalCalendarStorage(
+            calendar_file,
+            # fsync after this many appends or this many seconds, whichever comes first
+            group_commit_size=get_int("CALENDAR_GROUP_COMMIT_SIZE", 64),
+            group_commit_interval=get_float("CALENDAR_GROUP_COMMIT_INTERVAL", 0.05),
+            # Compact once the journal holds this many entries, or half the
+            # snapshot size if that is larger, so compaction cost stays amortized O(1)
+            compact_threshold=get_int("CALENDAR_COMPACT_THRESHOLD", 1000),
+            compact_interval=get_float("CALENDAR_COMPACT_INTERVAL", 300.0)
+        )
+    if backend == "sqlite":
+        return SQLiteCalendarStorage(calendar_file)
+    if backend != "json":
+        raise ValueError(f"Unknown calendar backend: {backend}")
+    return CalendarStorage(calendar_file)
 
+_calendar_storage: Optional[CalendarStorage] = None
+_calendar_storage_lock = threading.Lock()
+
+def get_calendar_storage() -> CalendarStorage:
+    """Return the shared calendar storage, opening it on first use"""
+    global _calendar_storage
+    if _calendar_storage is None:
+        with _calendar_storage_lock:
+            if _calendar_storage is None:
+                _calendar_storage = create_calendar_storage()
+    return _calendar_storage
+
+def __getattr__(name: str) -> Any:
+    # Keep ``calendar.calendar_storage`` working without opening it at import
+    if name == "calendar_storage":
+        return get_calendar_storage()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@traced()
 def add_to_calendar(
     title: str,
     start_time: str = "",
@@ -82,7 +523,7 @@ def add_to_calendar(
             "type": "zoom_meeting"
         }
 
-        event = calendar_storage.add_event(event_data)
+        event = get_calendar_storage().add_event(event_data)
 
         return {
             "status": "success",
@@ -104,17 +545,24 @@ def add_to_calendar(
             "error_message": f"Failed to add event to calendar: {str(e)}"
         }
 
-def list_calendar_events(date: Optional[str] = None) -> Dict[str, Any]:
-    """List calendar events, optionally filtered by date.
+@traced()
+def list_calendar_events(
+    date: Optional[str] = None,
+    from_date: Optional[str] = None,
+    to_date: Optional[str] = None
+) -> Dict[str, Any]:
+    """List calendar events, optionally filtered by date or date range.
     
     Args:
         date: Optional date filter (YYYY-MM-DD format)
+        from_date: Optional range start (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS format)
+        to_date: Optional inclusive range end (YYYY-MM-DD or YYYY-MM-DD HH:MM:SS format)
         
     Returns:
         dict: Status and list of events
     """
     try:
-        events = calendar_storage.list_events(date)
+        events = get_calendar_storage().list_events(date, from_time=from_date, to_time=to_date)
         
         if not events:
             return {
@@ -0,0 +1,49 @@
+import os
+import threading
+from typing import Optional
+
+_env_loaded = False
+_env_lock = threading.Lock()
+
+_TRUE = ('1', 'true', 'yes', 'on')
+_FALSE = ('0', 'false', 'no', 'off')
+
+
+def load_env() -> None:
+    """Load the .env file into the environment, once per process."""
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _env_lock:
+        if not _env_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            _env_loaded = True
+
+
+def get_setting(name: str, default: Optional[str] = None) -> Optional[str]:
+    """Return an environment setting, loading the .env file first if needed.
+
+    Modules call the getters when their singletons are first created, not at
+    import, so importing a tool module never reads .env.
+    """
+    load_env()
+    return os.getenv(name, default)
+
+
+def get_int(name: str, default: int) -> int:
+    return int(get_setting(name, str(default)))
+
+
+def get_float(name: str, default: float) -> float:
+    return float(get_setting(name, str(default)))
+
+
+def get_bool(name: str, default: bool) -> bool:
+    """Return a flag setting; unrecognized values fall back to ``default``."""
+    value = (get_setting(name) or '').strip().lower()
+    if value in _TRUE:
+        return True
+    if value in _FALSE:
+        return False
+    return default
@@ -1,5 +1,31 @@
-from typing import Dict, Any
+import json
+import re
+from typing import Dict, Any, List
 from datetime import datetime
+from .telemetry import traced
+
+# Triage rules. Each pattern is compiled once and matched against the
+# subject and content of every email.
+URGENT_RE = re.compile(r'\b(urgent|asap|immediately|emergency|critical|right away)\b', re.IGNORECASE)
+TIME_PRESSURE_RE = re.compile(r'\b(today|tonight|now|eod|end of (?:the )?day|deadline|by tomorrow)\b', re.IGNORECASE)
+MEETING_RE = re.compile(
+    r'\b(meeting|meet|schedule|call|sync|catch up|discuss|zoom|calendar|invite|agenda|1:1|one-on-one)\b',
+    re.IGNORECASE
+)
+SPAM_RE = re.compile(
+    r"\b(you(?:['’]ve| have)? won(?!['’]t)|winner|prize|claim|congratulations|lottery|free gift|click here|act now|limited time|selected to receive)\b",
+    re.IGNORECASE
+)
+SUBJECT_PREFIX_RE = re.compile(r'^\s*(?:(?:re|fwd?|urgent|important)\s*:\s*)+', re.IGNORECASE)
+
+PRIORITY_URGENCY = {"high": 0.6, "normal": 0.3, "low": 0.0}
+
+# Scores at or above the upper threshold are decided by the rules; scores
+# between the two thresholds are left to the analyzer model.
+SPAM_THRESHOLDS = (0.4, 0.8)
+MEETING_THRESHOLDS = (0.4, 0.8)
+URGENT_THRESHOLD = 0.7
+IMPORTANT_THRESHOLD = 0.4
 
 def get_mock_emails() -> Dict[str, Any]:
     """Get mock emails from our dummy email database.
@@ -41,6 +67,7 @@ def get_mock_emails() -> Dict[str, Any]:
         ]
     }
 
+@traced()
 def check_emails() -> Dict[str, Any]:
     """Check for new emails and return them with appropriate status.
     
@@ -63,6 +90,7 @@ def check_emails() -> Dict[str, Any]:
             "error_message": str(e)
         }
 
+@traced()
 def mark_as_read(email_id: str) -> Dict[str, Any]:
     """Mark an email as read (mock function).
     
@@ -75,4 +103,118 @@ def mark_as_read(email_id: str) -> Dict[str, Any]:
     return {
         "status": "success",
         "report": f"Email {email_id} marked as read"
-    } 
\ No newline at end of file
+    } 
+
+def _distinct_matches(pattern: re.Pattern, text: str) -> int:
+    return len({match.lower() for match in pattern.findall(text)})
+
+def score_email(email: Dict[str, Any]) -> Dict[str, Any]:
+    """Score one email for urgency, meeting intent and spam with local rules.
+
+    Returns the scores (0 to 1), tags and whether the rules were confident
+    enough to decide the email on their own.
+    """
+    text = f"{email.get('subject', '')}\n{email.get('content', '')}"
+    urgency = PRIORITY_URGENCY.get(email.get("priority", "normal"), 0.3)
+    if URGENT_RE.search(text):
+        urgency += 0.4
+    if TIME_PRESSURE_RE.search(text):
+        urgency += 0.2
+    meeting_terms = _distinct_matches(MEETING_RE, text)
+    meeting_intent = 0.0 if not meeting_terms else (0.5 if meeting_terms == 1 else 0.9)
+    spam = min(0.3 * _distinct_matches(SPAM_RE, text) + (0.2 if "!!!" in text else 0.0), 0.9)
+    spam = max(spam, float(email.get("spam_probability", 0.0)))
+
+    tags = []
+    ambiguous = False
+    if spam >= SPAM_THRESHOLDS[1]:
+        tags.append("spam")
+    else:
+        ambiguous = spam >= SPAM_THRESHOLDS[0]
+        if meeting_intent >= MEETING_THRESHOLDS[1]:
+            tags.append("meeting_request")
+        elif meeting_intent >= MEETING_THRESHOLDS[0]:
+            ambiguous = True
+        if urgency >= URGENT_THRESHOLD:
+            tags.append("urgent")
+        elif urgency >= IMPORTANT_THRESHOLD:
+            tags.append("important")
+    return {
+        "urgency": round(min(urgency, 1.0), 2),
+        "meeting_intent": meeting_intent,
+        "spam": round(spam, 2),
+        "tags": tags or ["fyi"],
+        "ambiguous": ambiguous
+    }
+
+def _digest_line(email: Dict[str, Any], triage: Dict[str, Any]) -> str:
+    tags = ",".join(triage["tags"]) + (",ambiguous" if triage["ambiguous"] else "")
+    return f"[{email.get('id')}] {tags} | {email.get('sender', 'unknown')} | {email.get('subject', '')}"
+
+def _analysis_text(meeting_email: Dict[str, Any], urgent: bool, important: List[str], suspicious: List[str]) -> str:
+    """Render a decision in the format EmailAnalyzerAgent produces."""
+    lines = [f"MEETING_REQUIRED: {'yes' if meeting_email else 'no'}", f"URGENCY: {'urgent' if urgent else 'normal'}"]
+    if meeting_email:
+        topic = SUBJECT_PREFIX_RE.sub("", meeting_email.get("subject", "")).strip() or "Meeting"
+        description = meeting_email.get("content", "")[:160]
+        lines.append(
+            "MEETING_DETAILS: {\n"
+            f'    "topic": {json.dumps(topic)},\n'
+            f'    "description": {json.dumps(description)},\n'
+            '    "duration": 30\n'
+            "}"
+        )
+    lines.append(f"IMPORTANT: [{'; '.join(important)}]")
+    lines.append(f"SUSPICIOUS: [{'; '.join(suspicious)}]")
+    return "\n".join(lines)
+
+def triage_emails(emails: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Triage emails locally and summarize them as a compact digest.
+
+    Emails the rules decide with confidence are folded into a ready-made
+    analysis; the rest are returned as ``ambiguous`` for the analyzer model.
+    """
+    tagged, ambiguous, important, suspicious = [], [], [], []
+    meeting_email = None
+    meeting_urgent = False
+    for email in emails:
+        triage = score_email(email)
+        tagged.append({"id": email.get("id"), "sender": email.get("sender"), "subject": email.get("subject"), **triage})
+        if triage["ambiguous"]:
+            ambiguous.append(email)
+            continue
+        if "spam" in triage["tags"]:
+            suspicious.append(email.get("subject", ""))
+            continue
+        if "urgent" in triage["tags"] or "important" in triage["tags"]:
+            important.append(email.get("subject", ""))
+        is_urgent = "urgent" in triage["tags"]
+        if "meeting_request" in triage["tags"] and (meeting_email is None or (is_urgent and not meeting_urgent)):
+            meeting_email, meeting_urgent = email, is_urgent
+    return {
+        "digest": "\n".join(_digest_line(email, triage) for email, triage in zip(emails, tagged)),
+        "emails": tagged,
+        "ambiguous": ambiguous,
+        "analysis": _analysis_text(meeting_email, meeting_urgent, important, suspicious)
+    }
+
+@traced()
+def triage_inbox() -> Dict[str, Any]:
+    """Check for new emails and triage them without a model call.
+    
+    Returns:
+        dict: A compact digest, per-email tags and scores, the emails the
+        rules could not decide, and the rule-based analysis
+    """
+    try:
+        emails = [email for email in get_mock_emails()["emails"] if not email.get("is_read")]
+        return {
+            "status": "success",
+            "report": f"You have {len(emails)} unread emails.",
+            **triage_emails(emails)
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error_message": str(e)
+        }
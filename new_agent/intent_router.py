@@ -0,0 +1,156 @@
+import re
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+from .zoom import (
+    delete_zoom_meeting, get_zoom_meeting, list_zoom_meetings, start_zoom_meeting, join_zoom_meeting,
+    delete_zoom_meeting_async, get_zoom_meeting_async, list_zoom_meetings_async, start_zoom_meeting_async,
+    join_zoom_meeting_async
+)
+
+logger = logging.getLogger(__name__)
+
+# A meeting ID, possibly written in groups like "812 3456 7890" or "812-3456-7890"
+_ID = r'(?:id\s*)?#?(?P<meeting_id>\d[\d -]{7,14}\d)'
+_MEETING = r'(?:the\s+)?(?:zoom\s+)?meeting'
+_DATE = r'\d{4}-\d{2}-\d{2}'
+_POLITE = r'^\s*(?:please\s+)?'
+_END = r'\s*(?:please\s*)?[.!?]?\s*$'
+
+DELETE_RE = re.compile(rf'{_POLITE}(?:delete|cancel|remove)\s+{_MEETING}\s+{_ID}{_END}', re.IGNORECASE)
+GET_RE = re.compile(
+    rf'{_POLITE}(?:get|show|describe)(?:\s+me)?\s+(?:the\s+)?(?:details\s+(?:of|for)\s+)?{_MEETING}\s+{_ID}(?:\s+details)?{_END}',
+    re.IGNORECASE
+)
+START_RE = re.compile(rf'{_POLITE}start\s+{_MEETING}\s+{_ID}{_END}', re.IGNORECASE)
+JOIN_RE = re.compile(rf'{_POLITE}join\s+{_MEETING}\s+{_ID}{_END}', re.IGNORECASE)
+LIST_RE = re.compile(
+    rf'{_POLITE}(?:list|show)(?:\s+me)?\s+(?:all\s+)?(?:of\s+)?(?:my\s+)?(?:zoom\s+)?meetings'
+    rf'(?:\s+(?:(?P<relative>today|tomorrow|this\s+week|next\s+week)'
+    rf'|on\s+(?P<on>{_DATE})'
+    rf'|(?:from|between)\s+(?P<from_date>{_DATE})\s+(?:to|and|until)\s+(?P<to_date>{_DATE})))?{_END}',
+    re.IGNORECASE
+)
+MEETING_ID_RE = re.compile(r'^\d{9,11}$')
+
+
+class Intent(NamedTuple):
+    """A fully specified command that can run without the model."""
+    name: str
+    kwargs: Dict[str, Any]
+
+
+def _meeting_id(match: "re.Match") -> Optional[str]:
+    meeting_id = re.sub(r'[\s-]', '', match.group('meeting_id'))
+    return meeting_id if MEETING_ID_RE.match(meeting_id) else None
+
+
+def _list_window(match: "re.Match", today: datetime) -> Tuple[Optional[str], Optional[str]]:
+    """Resolve the date phrase of a list command to a from/to date pair."""
+    if match.group('on'):
+        return match.group('on'), match.group('on')
+    if match.group('from_date'):
+        return match.group('from_date'), match.group('to_date')
+    relative = re.sub(r'\s+', ' ', (match.group('relative') or '').lower())
+    if relative == 'today':
+        start, end = today, today
+    elif relative == 'tomorrow':
+        start = end = today + timedelta(days=1)
+    elif relative == 'this week':
+        start, end = today, today + timedelta(days=6 - today.weekday())
+    elif relative == 'next week':
+        start = today + timedelta(days=7 - today.weekday())
+        end = start + timedelta(days=6)
+    else:
+        # No date phrase: let list_zoom_meetings apply its default window
+        return None, None
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+
+def match_intent(text: str, now: Optional[datetime] = None) -> Optional[Intent]:
+    """Return the command ``text`` unambiguously asks for, or None if the model should handle it."""
+    for name, pattern in (("delete", DELETE_RE), ("get", GET_RE), ("start", START_RE), ("join", JOIN_RE)):
+        match = pattern.match(text)
+        if match:
+            meeting_id = _meeting_id(match)
+            return Intent(name, {"meeting_id": meeting_id}) if meeting_id else None
+    match = LIST_RE.match(text)
+    if match:
+        from_date, to_date = _list_window(match, now or datetime.now())
+        return Intent("list", {"from_date": from_date, "to_date": to_date})
+    return None
+
+
+def _split_time(start_time: str) -> Tuple[str, str]:
+    date, _, time = start_time.partition(' ')
+    return date, time
+
+
+def _format_meeting(meeting: Dict[str, Any]) -> str:
+    date, time = _split_time(meeting.get('start_time', ''))
+    return (
+        f"Meeting \"{meeting.get('topic', '')}\"\n\n"
+        f"Scheduled for: {date} at {time}\n\n"
+        f"Duration: {meeting.get('duration', 0)} minutes\n\n"
+        f"Status: {meeting.get('status', 'unknown')}\n\n"
+        f"Meeting ID: {meeting['meeting_id']}\n\n"
+        f"[Click here to join]({meeting.get('join_url', '')})"
+    )
+
+
+def _format_list(meetings: List[Dict[str, Any]], message: str) -> str:
+    lines = [f"{message}:" if meetings else f"{message}."]
+    for number, meeting in enumerate(meetings, 1):
+        date, time = _split_time(meeting['start_time'])
+        lines.append(
+            f"{number}. \"{meeting['topic']}\" on {date} at {time}\n"
+            f"Meeting ID: {meeting['meeting_id']}\n"
+            f"[Join]({meeting.get('join_url', '')})"
+        )
+    return "\n\n".join(lines)
+
+
+def format_result(intent: Intent, result: Dict[str, Any]) -> str:
+    """Render a tool result in the same format the Zoom agent uses."""
+    if result.get("status") != "success":
+        return f"Error: {result.get('message', 'Unknown error')}"
+    if intent.name == "delete":
+        return f"The meeting with ID {intent.kwargs['meeting_id']} has been deleted."
+    if intent.name == "get":
+        return _format_meeting(result["meeting"])
+    if intent.name == "list":
+        return _format_list(result["meetings"], result["message"])
+    return result["message"]
+
+
+# Intent name -> (sync tool, async tool, extra arguments)
+_TOOLS: Dict[str, Tuple[Callable[..., Dict[str, Any]], Callable[..., Any], Dict[str, Any]]] = {
+    "delete": (delete_zoom_meeting, delete_zoom_meeting_async, {}),
+    "get": (get_zoom_meeting, get_zoom_meeting_async, {"compact": True}),
+    "list": (list_zoom_meetings, list_zoom_meetings_async, {"compact": True}),
+    "start": (start_zoom_meeting, start_zoom_meeting_async, {}),
+    "join": (join_zoom_meeting, join_zoom_meeting_async, {})
+}
+
+
+def route(text: str) -> Optional[str]:
+    """Run ``text`` directly against the Zoom tools if it is a fully specified command.
+
+    Returns the formatted response, or None when the request should go to the agent.
+    """
+    intent = match_intent(text)
+    if intent is None:
+        return None
+    logger.debug("Routing %r to %s without the model", text, intent.name)
+    tool, _, extra = _TOOLS[intent.name]
+    return format_result(intent, tool(**intent.kwargs, **extra))
+
+
+async def route_async(text: str) -> Optional[str]:
+    """Async counterpart of route."""
+    intent = match_intent(text)
+    if intent is None:
+        return None
+    logger.debug("Routing %r to %s without the model", text, intent.name)
+    _, async_tool, extra = _TOOLS[intent.name]
+    return format_result(intent, await async_tool(**intent.kwargs, **extra))
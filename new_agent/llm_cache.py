@@ -0,0 +1,242 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from .config import get_float, get_int, get_setting
+from typing import Dict, Any, Optional, Tuple
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.models import LlmRequest, LlmResponse
+
+# Both model callbacks of one call share the event's state delta. A ``temp:``
+# key is never persisted, so a call that fails before after_model_callback
+# leaves nothing behind.
+_PENDING_KEY = 'temp:llm_cache_key'
+
+class MemoryCacheBackend:
+    """In-process LRU of cached responses with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCacheBackend:
+    """One JSON file per entry in ``directory``, shared by every worker on the host.
+
+    Files are written to a temporary name and renamed into place, so readers
+    never see a partial entry. Once more than ``max_entries`` files exist the
+    least recently written ones are removed.
+    """
+
+    def __init__(self, directory: str = '.llm_cache', max_entries: int = 256):
+        self.directory = directory
+        self.max_entries = max_entries
+        self._writes = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(key), 'r') as f:
+                expires_at, value = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if expires_at < time.time():
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            return None
+        return value
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_file = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump([time.time() + ttl, value], f)
+        os.replace(tmp_file, self._path(key))
+        self._writes += 1
+        # Listing the directory is O(n), so only prune every few writes
+        if self._writes % max(1, self.max_entries // 10) == 0:
+            self._prune()
+
+    def _prune(self) -> None:
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(entry.path)
+                self.evictions += 1
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        if os.path.isdir(self.directory):
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+
+
+class LlmResponseCache:
+    """Content-addressed cache for model responses of side-effect-free agents.
+
+    Attach ``before_model_callback`` and ``after_model_callback`` to an
+    LlmAgent. The key is a SHA-256 over the agent name, model, rendered
+    system instruction (which already has the session state filled in),
+    request contents and tool names, so identical input skips the model
+    call. Only complete text responses are stored; responses that call tools
+    or carry an error are never cached.
+    """
+
+    def __init__(self, backend: Any, ttl: float = 600.0):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    @staticmethod
+    def request_key(agent_name: str, llm_request: LlmRequest) -> str:
+        config = llm_request.config
+        payload = {
+            "agent": agent_name,
+            "model": llm_request.model,
+            "instruction": str(config.system_instruction) if config and config.system_instruction else "",
+            "contents": [content.model_dump(mode="json", exclude_none=True) for content in llm_request.contents],
+            "tools": sorted(llm_request.tools_dict)
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def before_model_callback(self, callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+        """Return the cached response for this request, or remember its key for storing."""
+        key = self.request_key(callback_context.agent_name, llm_request)
+        cached = self.backend.get(key)
+        with self._lock:
+            if cached is not None:
+                self._stats["hits"] += 1
+                return LlmResponse.model_validate(cached)
+            self._stats["misses"] += 1
+        callback_context.state[_PENDING_KEY] = key
+        return None
+
+    def after_model_callback(self, callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+        """Store a complete text response under the key of its request."""
+        if llm_response.partial:
+            return None
+        key = callback_context.state.get(_PENDING_KEY)
+        callback_context.state[_PENDING_KEY] = None
+        content = llm_response.content
+        if key is None or llm_response.error_code or not content or not content.parts:
+            return None
+        if any(part.function_call for part in content.parts):
+            return None
+        self.backend.set(key, llm_response.model_dump(mode="json", exclude_none=True), self.ttl)
+        with self._lock:
+            self._stats["stores"] += 1
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/store counters and the hit rate."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "evictions": self.backend.evictions,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0
+            }
+
+
+class _NoCacheBackend:
+    evictions = 0
+
+    def get(self, key: str) -> None:
+        return None
+
+    def set(self, key: str, value: Dict[str, Any], ttl: float) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+
+def create_llm_cache(backend: Optional[str] = None) -> LlmResponseCache:
+    """Create the response cache for the given or configured backend ("memory", "disk" or "off")"""
+    backend = (backend or get_setting('LLM_CACHE_BACKEND', 'memory')).lower()
+    ttl = get_float('LLM_CACHE_TTL', 600.0)
+    max_entries = get_int('LLM_CACHE_MAX_ENTRIES', 256)
+    if backend == "disk":
+        return LlmResponseCache(DiskCacheBackend(get_setting('LLM_CACHE_DIR', '.llm_cache'), max_entries), ttl)
+    if backend in ("off", "none", "0", "false"):
+        return LlmResponseCache(_NoCacheBackend(), ttl)
+    if backend != "memory":
+        raise ValueError(f"Unknown LLM cache backend: {backend}")
+    return LlmResponseCache(MemoryCacheBackend(max_entries), ttl)
+
+
+_llm_cache: Optional[LlmResponseCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> LlmResponseCache:
+    """Return the shared response cache, creating it on first use."""
+    global _llm_cache
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = create_llm_cache()
+    return _llm_cache
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``llm_cache.llm_cache`` working without creating it at import
+    if name == "llm_cache":
+        return get_llm_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def before_model_callback(callback_context: CallbackContext, llm_request: LlmRequest) -> Optional[LlmResponse]:
+    """``LlmResponseCache.before_model_callback`` of the shared cache, for agents defined at import."""
+    return get_llm_cache().before_model_callback(callback_context, llm_request)
+
+
+def after_model_callback(callback_context: CallbackContext, llm_response: LlmResponse) -> Optional[LlmResponse]:
+    """``LlmResponseCache.after_model_callback`` of the shared cache, for agents defined at import."""
+    return get_llm_cache().after_model_callback(callback_context, llm_response)
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters of the LLM response cache."""
+    return get_llm_cache().stats()
@@ -1,15 +1,144 @@
-from .agent import root_agent
+import sys
+import asyncio
+import logging
+import threading
+from typing import NamedTuple, Optional
+from .intent_router import route_async
+from .profiling import new_request_id, profile_request
 
-def handle_zoom_request(request: str) -> str:
-    """Handle a Zoom meeting request and return the response."""
-    try:
-        response = root_agent.run(request)
-        return response.get("meeting_result", "No response from agent")
-    except Exception as e:
-        return f"Error processing request: {str(e)}"
+APP_NAME = "zoom_agent"
+DEFAULT_USER_ID = "local_user"
+
+
+class RequestResult(NamedTuple):
+    """The response text of a request and whether it was handled without an exception."""
+    text: str
+    ok: bool
+
+
+_runner = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_runner():
+    """Return the shared Runner for the agent workflow, creating it on first use.
+
+    The agent is only imported here, so requests the intent router answers
+    never pay for loading the ADK agents.
+    """
+    global _runner
+    if _runner is None:
+        from google.adk.runners import Runner
+        from google.adk.sessions import InMemorySessionService
+        from .agent import root_agent
+        from .telemetry_plugin import TelemetryPlugin
+        _runner = Runner(
+            app_name=APP_NAME, agent=root_agent, session_service=InMemorySessionService(), plugins=[TelemetryPlugin()]
+        )
+    return _runner
+
+
+async def _run_agent(request: str, user_id: str, session_id: Optional[str]) -> str:
+    """Send ``request`` through the agent workflow and return the Zoom agent's result."""
+    from google.genai import types
+    runner = get_runner()
+    sessions = runner.session_service
+    session = None
+    if session_id:
+        session = await sessions.get_session(app_name=APP_NAME, user_id=user_id, session_id=session_id)
+    if session is None:
+        session = await sessions.create_session(app_name=APP_NAME, user_id=user_id, session_id=session_id)
+
+    final_text = ""
+    message = types.Content(role="user", parts=[types.Part(text=request)])
+    async for event in runner.run_async(user_id=user_id, session_id=session.id, new_message=message):
+        if event.is_final_response() and event.content and event.content.parts:
+            final_text = "".join(part.text or "" for part in event.content.parts)
+
+    session = await sessions.get_session(app_name=APP_NAME, user_id=user_id, session_id=session.id)
+    return session.state.get("meeting_result") or final_text or "No response from agent"
+
+
+async def end_session(user_id: str, session_id: str) -> None:
+    """Drop a finished session from the in-memory session store, if the agent ever created it."""
+    if _runner is not None:
+        await _runner.session_service.delete_session(app_name=APP_NAME, user_id=user_id, session_id=session_id)
+
+
+async def run_zoom_request(request: str, user_id: str = DEFAULT_USER_ID, session_id: Optional[str] = None,
+                           request_id: Optional[str] = None, profile: Optional[bool] = None) -> RequestResult:
+    """Handle a Zoom meeting request and return the response with its outcome.
+
+    Fully specified commands (e.g. "delete meeting 81234567890") are run
+    directly by the intent router; everything else goes to the agent.
+    ``profile`` forces profiling on or off for this request; by default
+    PROFILE_ENABLED and PROFILE_SAMPLE_RATE decide. Profiles are saved under
+    ``request_id``.
+    """
+    with profile_request(request_id or new_request_id(), profile):
+        try:
+            response = await route_async(request)
+            if response is not None:
+                return RequestResult(response, True)
+            return RequestResult(await _run_agent(request, user_id, session_id), True)
+        except Exception as e:
+            return RequestResult(f"Error processing request: {str(e)}", False)
+
+
+async def handle_zoom_request_async(request: str, user_id: str = DEFAULT_USER_ID, session_id: Optional[str] = None,
+                                    request_id: Optional[str] = None, profile: Optional[bool] = None) -> str:
+    """Handle a Zoom meeting request and return the response, or the error message."""
+    result = await run_zoom_request(request, user_id, session_id, request_id=request_id, profile=profile)
+    return result.text
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the event loop sync callers run requests on, starting its thread on first use.
+
+    The async Zoom client and its connection pool belong to the loop that
+    created them, so one long-lived loop reuses them across calls where a
+    new loop per call would leave a client behind every time.
+    """
+    global _loop
+    if _loop is None:
+        with _loop_lock:
+            if _loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="zoom-agent-loop", daemon=True).start()
+                _loop = loop
+    return _loop
+
+
+def handle_zoom_request(request: str, user_id: str = DEFAULT_USER_ID, session_id: Optional[str] = None,
+                        request_id: Optional[str] = None, profile: Optional[bool] = None) -> str:
+    """Handle a Zoom meeting request and return the response.
+
+    Blocking wrapper around handle_zoom_request_async for callers without an
+    event loop; must not be called from a coroutine.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        handle_zoom_request_async(request, user_id, session_id, request_id=request_id, profile=profile),
+        _background_loop()
+    )
+    return future.result()
 
 if __name__ == "__main__":
-    # Example usage
-    request = input("Enter your Zoom meeting request: ")
-    response = handle_zoom_request(request)
-    print(response)
+    logging.basicConfig(level=logging.INFO)
+    if sys.argv[1:2] == ["serve"]:
+        # Long-running HTTP service: python -m new_agent.main serve
+        from .service import serve
+        serve()
+    elif sys.argv[1:2] == ["batch"]:
+        # Replay a JSONL file of requests: python -m new_agent.main batch INPUT OUTPUT
+        from .batch import main as batch_main
+        batch_main(sys.argv[2:])
+    elif sys.argv[1:2] == ["profiles"]:
+        # Summarize saved request profiles: python -m new_agent.main profiles [REQUEST_ID ...]
+        from .profiling import main as profiling_main
+        sys.exit(profiling_main(sys.argv[2:]))
+    else:
+        # Example usage
+        request = input("Enter your Zoom meeting request: ")
+        response = handle_zoom_request(request)
+        print(response)
@@ -0,0 +1,122 @@
+import time
+import threading
+from collections import OrderedDict
+from .config import get_bool, get_float, get_int
+from typing import Dict, Any, Optional
+
+
+class MeetingCache:
+    """In-process cache of raw Zoom meeting objects keyed by meeting ID.
+
+    Entries expire after ``ttl`` seconds and the least recently used entry is
+    evicted once ``max_entries`` is reached. Create, update and delete write
+    through to the cache, so the tools never need a follow-up GET to learn the
+    state they just wrote.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 300.0, enabled: bool = True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def _key(meeting_id: Any) -> str:
+        return str(meeting_id).replace(' ', '').strip()
+
+    def get(self, meeting_id: Any) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached meeting, or None if it is missing or expired."""
+        if not self.enabled:
+            return None
+        key = self._key(meeting_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return dict(entry[1])
+
+    def put(self, meeting_info: Dict[str, Any]) -> None:
+        """Store a full meeting object as returned by Zoom."""
+        if not self.enabled or 'id' not in meeting_info:
+            return
+        key = self._key(meeting_info['id'])
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, dict(meeting_info))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def update(self, meeting_id: Any, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Merge a successful PATCH into the cached meeting and return the result.
+
+        Returns None when the meeting is not cached, in which case the caller
+        has to fetch the full object from Zoom.
+        """
+        if not self.enabled:
+            return None
+        key = self._key(meeting_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                return None
+            meeting_info = {**entry[1], **changes}
+            self._entries[key] = (time.monotonic() + self.ttl, meeting_info)
+            self._entries.move_to_end(key)
+            return dict(meeting_info)
+
+    def invalidate(self, meeting_id: Any) -> None:
+        with self._lock:
+            self._entries.pop(self._key(meeting_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters and the hit rate."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "size": len(self._entries),
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+                "enabled": self.enabled
+            }
+
+
+_meeting_cache: Optional[MeetingCache] = None
+_meeting_cache_lock = threading.Lock()
+
+
+def get_meeting_cache() -> MeetingCache:
+    """Return the process-wide meeting cache, reading its settings on first use."""
+    global _meeting_cache
+    if _meeting_cache is None:
+        with _meeting_cache_lock:
+            if _meeting_cache is None:
+                _meeting_cache = MeetingCache(
+                    max_entries=get_int('ZOOM_MEETING_CACHE_SIZE', 256),
+                    ttl=get_float('ZOOM_MEETING_CACHE_TTL', 300.0),
+                    enabled=get_bool('ZOOM_MEETING_CACHE', True)
+                )
+    return _meeting_cache
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``meeting_cache.meeting_cache`` working without creating it at import
+    if name == "meeting_cache":
+        return get_meeting_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_meeting_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters of the meeting cache."""
+    return get_meeting_cache().stats()
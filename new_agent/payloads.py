@@ -0,0 +1,125 @@
+import json
+import threading
+from .config import get_setting
+from . import telemetry
+from typing import Dict, Any, Callable, Iterable, List, Optional
+
+MEETING_FIELDS = ("meeting_id", "topic", "start_time", "duration", "join_url", "start_url", "status")
+# start_url signs whoever opens it in as the host, so compact records only
+# carry it when it is asked for through ``fields``
+DEFAULT_FIELDS = frozenset(MEETING_FIELDS) - {"start_url"}
+
+# Rough size of one model token in bytes of JSON, used to estimate tokens saved
+BYTES_PER_TOKEN = 4
+
+
+def meeting_record(meeting_info: Dict[str, Any], meeting_id: Any = None) -> Dict[str, Any]:
+    """Build the canonical record of a raw Zoom meeting object.
+
+    Start time is "YYYY-MM-DD HH:MM:SS", duration is in minutes and URLs are
+    plain. Fields Zoom did not return are left out.
+    """
+    record = {
+        "meeting_id": meeting_info.get('id', meeting_id),
+        "topic": meeting_info.get('topic', 'Untitled Meeting'),
+        "start_time": meeting_info.get('start_time', '').replace('T', ' ').replace('Z', ''),
+        "duration": meeting_info.get('duration', 0),
+        "join_url": meeting_info.get('join_url', ''),
+        "start_url": meeting_info.get('start_url', ''),
+        "status": meeting_info.get('status', '')
+    }
+    return {field: value for field, value in record.items() if value not in ('', None)}
+
+
+def project(record: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Keep only ``fields`` of a record, DEFAULT_FIELDS if none are given.
+
+    The meeting ID is always kept so follow-up calls can use it.
+    """
+    wanted = set(fields) | {"meeting_id"} if fields else DEFAULT_FIELDS
+    return {field: value for field, value in record.items() if field in wanted}
+
+
+_response_mode: Optional[str] = None
+
+
+def response_mode() -> str:
+    """The configured ZOOM_RESPONSE_MODE, read once on first use.
+
+    "full" keeps the original tool results, "compact" returns one canonical
+    record per meeting.
+    """
+    global _response_mode
+    if _response_mode is None:
+        _response_mode = get_setting('ZOOM_RESPONSE_MODE', 'full').lower()
+    return _response_mode
+
+
+def use_compact(compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> bool:
+    """Resolve the response mode of one call: asking for fields implies compact."""
+    if fields:
+        return True
+    if compact is not None:
+        return compact
+    return response_mode() == "compact"
+
+
+def _size(result: Dict[str, Any]) -> int:
+    return len(json.dumps(result, default=str))
+
+
+class PayloadStats:
+    """Counts how many bytes (and roughly tokens) compact results kept out of the model context."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {"compact_responses": 0, "full_bytes": 0, "compact_bytes": 0}
+
+    def record(self, full: Dict[str, Any], compact: Dict[str, Any]) -> None:
+        full_bytes, compact_bytes = _size(full), _size(compact)
+        with self._lock:
+            self._stats["compact_responses"] += 1
+            self._stats["full_bytes"] += full_bytes
+            self._stats["compact_bytes"] += compact_bytes
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            saved = self._stats["full_bytes"] - self._stats["compact_bytes"]
+            return {
+                **self._stats,
+                "bytes_saved": saved,
+                "tokens_saved": saved // BYTES_PER_TOKEN,
+                "ratio": round(self._stats["compact_bytes"] / self._stats["full_bytes"], 3) if self._stats["full_bytes"] else 1.0
+            }
+
+
+payload_stats = PayloadStats()
+
+
+def _compact(result: Dict[str, Any], build_full: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    # Measuring the savings means building and serializing the full result
+    # as well, so it is only done while telemetry is recording
+    if telemetry.is_enabled():
+        payload_stats.record(build_full(), result)
+    return result
+
+
+def shape_meeting_result(message: str, record: Dict[str, Any], build_full: Callable[[], Dict[str, Any]],
+                         compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Return the full success result from ``build_full()``, or its compact form with a single ``meeting`` record."""
+    if not use_compact(compact, fields):
+        return build_full()
+    return _compact({"status": "success", "message": message, "meeting": project(record, fields)}, build_full)
+
+
+def shape_list_result(message: str, records: List[Dict[str, Any]], build_full: Callable[[], Dict[str, Any]],
+                      compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Return the full success result from ``build_full()``, or its compact form with one record per meeting."""
+    if not use_compact(compact, fields):
+        return build_full()
+    return _compact({"status": "success", "message": message, "meetings": [project(record, fields) for record in records]}, build_full)
+
+
+def get_payload_stats() -> Dict[str, Any]:
+    """Return how many bytes and estimated tokens compact tool results have saved while telemetry was enabled."""
+    return payload_stats.stats()
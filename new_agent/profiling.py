@@ -0,0 +1,227 @@
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import random
+import pstats
+import logging
+import argparse
+import cProfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from .config import get_bool, get_float, get_int, get_setting
+from typing import Dict, Any, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_SAFE_ID_RE = re.compile(r'[^A-Za-z0-9._-]')
+
+# cProfile and tracemalloc are process-wide, so only one request is profiled at a time
+_active = threading.Lock()
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _profile_dir() -> str:
+    return get_setting('PROFILE_DIR', 'profiles')
+
+
+def should_profile(requested: Optional[bool] = None) -> bool:
+    """Decide whether to profile a request.
+
+    An explicit ``requested`` (e.g. from a request header) wins; otherwise
+    PROFILE_ENABLED profiles everything and PROFILE_SAMPLE_RATE a random share.
+    """
+    if requested is not None:
+        return requested
+    sample_rate = get_float('PROFILE_SAMPLE_RATE', 0.0)
+    return get_bool('PROFILE_ENABLED', False) or (sample_rate > 0 and random.random() < sample_rate)
+
+
+def profile_paths(request_id: str, directory: Optional[str] = None) -> Dict[str, str]:
+    """Return where the cProfile stats and the allocation report of a request are saved."""
+    base = os.path.join(directory or _profile_dir(), _SAFE_ID_RE.sub('_', request_id))
+    return {"stats": f"{base}.prof", "allocations": f"{base}.json"}
+
+
+def _allocation_report(before: Optional[tracemalloc.Snapshot], after: tracemalloc.Snapshot,
+                       top: int) -> List[Dict[str, Any]]:
+    """Allocation sites that grew the most during the request, by bytes still held at its end."""
+    if before is not None:
+        differences = after.compare_to(before, 'lineno')
+    else:
+        differences = after.statistics('lineno')
+    report = []
+    for stat in differences[:top]:
+        frame = stat.traceback[0]
+        report.append({
+            "site": f"{frame.filename}:{frame.lineno}",
+            "size_bytes": getattr(stat, 'size_diff', stat.size),
+            "count": getattr(stat, 'count_diff', stat.count)
+        })
+    return report
+
+
+@contextmanager
+def profile_request(request_id: str, requested: Optional[bool] = None,
+                    directory: Optional[str] = None) -> Iterator[Optional[Dict[str, str]]]:
+    """Profile the enclosed code if ``should_profile(requested)`` and save it under ``request_id``.
+
+    Yields the paths the profile will be written to, or None when the request
+    is not profiled, including when another request is being profiled. The
+    profiler follows the calling thread: with async requests it also sees
+    other coroutines running on the same event loop meanwhile, and misses
+    work handed to worker threads.
+    """
+    if not should_profile(requested):
+        yield None
+        return
+    if not _active.acquire(blocking=False):
+        logger.info("Not profiling request %s: another request is being profiled", request_id)
+        yield None
+        return
+
+    paths = profile_paths(request_id, directory)
+    # Recording allocations slows the profiled request down further
+    trace_allocations = get_bool('PROFILE_TRACEMALLOC', True)
+    started_tracing = trace_allocations and not tracemalloc.is_tracing()
+    before = None
+    profiler = cProfile.Profile()
+    try:
+        if trace_allocations:
+            if started_tracing:
+                tracemalloc.start(get_int('PROFILE_TRACEMALLOC_FRAMES', 10))
+            else:
+                before = tracemalloc.take_snapshot()
+            tracemalloc.reset_peak()
+        started_at = datetime.now(timezone.utc).isoformat()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield paths
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            report: Dict[str, Any] = {
+                "request_id": request_id,
+                "started_at": started_at,
+                "elapsed_ms": round(elapsed * 1000, 2),
+                "stats_file": os.path.basename(paths["stats"])
+            }
+            if trace_allocations:
+                after = tracemalloc.take_snapshot()
+                report["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                report["allocations"] = _allocation_report(before, after, get_int('PROFILE_TOP_ALLOCATIONS', 25))
+            _save(profiler, report, paths)
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _active.release()
+
+
+def _save(profiler: cProfile.Profile, report: Dict[str, Any], paths: Dict[str, str]) -> None:
+    try:
+        os.makedirs(os.path.dirname(paths["stats"]) or '.', exist_ok=True)
+        profiler.dump_stats(paths["stats"])
+        with open(paths["allocations"], 'w') as f:
+            json.dump(report, f, indent=2)
+        logger.info("Saved profile of request %s to %s", report["request_id"], paths["stats"])
+    except OSError as e:
+        # A profile that cannot be written must not fail the request itself
+        logger.warning("Could not save profile of request %s: %s", report["request_id"], e)
+
+
+def _profile_files(directory: str, request_ids: Optional[List[str]] = None) -> List[str]:
+    if request_ids:
+        return [path for path in (profile_paths(request_id, directory)["stats"] for request_id in request_ids)
+                if os.path.exists(path)]
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.endswith('.prof'))
+
+
+def summarize_profiles(directory: Optional[str] = None, request_ids: Optional[List[str]] = None,
+                       top: int = 20, sort: str = "cumulative") -> Dict[str, Any]:
+    """Merge saved profiles and return the hottest functions and allocation sites across them.
+
+    Functions are ranked by ``sort`` ("cumulative" or "tottime") summed over
+    all profiles; ``profiles`` counts how many requests the function showed up in.
+    """
+    directory = directory or _profile_dir()
+    files = _profile_files(directory, request_ids)
+    if not files:
+        return {"status": "error", "message": f"No profiles found in {directory}"}
+
+    functions: Dict[Any, Dict[str, Any]] = {}
+    allocations: Dict[str, Dict[str, Any]] = {}
+    for path in files:
+        for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in pstats.Stats(path).stats.items():
+            entry = functions.setdefault((filename, lineno, name), {
+                "function": f"{filename}:{lineno}({name})" if lineno else name,
+                "ncalls": 0, "tottime": 0.0, "cumulative": 0.0, "profiles": 0
+            })
+            entry["ncalls"] += ncalls
+            entry["tottime"] += tottime
+            entry["cumulative"] += cumtime
+            entry["profiles"] += 1
+        report_path = path[:-len('.prof')] + '.json'
+        if os.path.exists(report_path):
+            with open(report_path) as f:
+                for allocation in json.load(f).get("allocations", []):
+                    site = allocations.setdefault(allocation["site"], {"site": allocation["site"], "size_bytes": 0, "count": 0, "profiles": 0})
+                    site["size_bytes"] += allocation["size_bytes"]
+                    site["count"] += allocation["count"]
+                    site["profiles"] += 1
+
+    hottest = sorted(functions.values(), key=lambda entry: entry[sort], reverse=True)[:top]
+    for entry in hottest:
+        entry["tottime"] = round(entry["tottime"], 6)
+        entry["cumulative"] = round(entry["cumulative"], 6)
+    return {
+        "status": "success",
+        "profiles": len(files),
+        "functions": hottest,
+        "allocations": sorted(allocations.values(), key=lambda site: site["size_bytes"], reverse=True)[:top]
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m new_agent.profiling",
+        description="Summarize the hottest functions and allocation sites across saved request profiles."
+    )
+    parser.add_argument("request_ids", nargs="*", help="Only these requests (default: every saved profile)")
+    parser.add_argument("--dir", help="Directory holding the profiles (default: PROFILE_DIR)")
+    parser.add_argument("--top", type=int, default=20, help="Functions and allocation sites to show")
+    parser.add_argument("--sort", choices=["cumulative", "tottime"], default="cumulative")
+    parser.add_argument("--json", action="store_true", help="Print machine-readable output")
+    args = parser.parse_args(argv)
+
+    summary = summarize_profiles(args.dir, args.request_ids, args.top, args.sort)
+    if args.json:
+        print(json.dumps(summary))
+        return 0 if summary["status"] == "success" else 1
+    if summary["status"] != "success":
+        print(summary["message"], file=sys.stderr)
+        return 1
+
+    print(f"{summary['profiles']} profile(s), top {len(summary['functions'])} functions by {args.sort}")
+    print(f"{'ncalls':>10} {'tottime':>10} {'cumtime':>10} {'profiles':>8}  function")
+    for entry in summary["functions"]:
+        print(f"{entry['ncalls']:>10} {entry['tottime']:>10.4f} {entry['cumulative']:>10.4f} {entry['profiles']:>8}  {entry['function']}")
+    if summary["allocations"]:
+        print("\nTop allocation sites by bytes held at the end of the request")
+        print(f"{'bytes':>12} {'blocks':>8} {'profiles':>8}  site")
+        for site in summary["allocations"]:
+            print(f"{site['size_bytes']:>12} {site['count']:>8} {site['profiles']:>8}  {site['site']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
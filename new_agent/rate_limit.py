@@ -0,0 +1,245 @@
+import re
+import time
+import random
+import asyncio
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from .config import get_float, get_int
+from typing import Dict, Any, Iterator, Optional
+
+# Requests per second for each Zoom rate-limit category. The defaults match
+# the Pro plan; Business and higher plans can raise them (ZOOM_RATE_LIMIT_*).
+DEFAULT_RATE_LIMITS = {'light': 30.0, 'medium': 20.0, 'heavy': 10.0}
+
+_MEETING_PATH = re.compile(r'^/meetings/[^/]+$')
+
+# Safe to resend after a 5xx. Zoom may have created the meeting before failing
+# a POST, so POST is only retried on 429, which is rejected before any work.
+RETRYABLE_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'PATCH', 'DELETE'})
+
+
+def rate_limit_category(method: str, path: str) -> str:
+    """Return Zoom's rate-limit category for an endpoint."""
+    if path == '/users/me/meetings':
+        # Listing and creating meetings are both "Medium" endpoints
+        return 'medium'
+    if _MEETING_PATH.match(path):
+        return 'light'
+    return 'medium' if method.upper() == 'GET' else 'heavy'
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Convert a Retry-After header (seconds, HTTP date or ISO date) to seconds from now."""
+    if not value:
+        return None
+    now = time.time() if now is None else now
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            retry_at = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, retry_at.timestamp() - now)
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of rejecting callers.
+
+    ``reserve`` always takes a token, letting the balance go negative, and
+    returns how long the caller must wait before using it. Callers are
+    therefore served in arrival order without any busy waiting, and the same
+    bucket works for threads and for coroutines.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for ``seconds``, e.g. after a 429."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self.rate = rate
+            self.capacity = rate
+
+
+class RateLimitScheduler:
+    """Client-side scheduler in front of every Zoom API call.
+
+    Requests are queued per rate-limit category instead of being sent into a
+    429. Responses are inspected for ``Retry-After`` and ``X-RateLimit-*``
+    headers, and 429 responses (and 5xx responses to requests in
+    RETRYABLE_METHODS) are retried with jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, float]] = None,
+        max_retries: int = 4,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        # A Retry-After further away than this (e.g. the daily limit) is not waited out
+        max_retry_wait: float = 60.0
+    ):
+        limits = limits or DEFAULT_RATE_LIMITS
+        self.buckets = {category: TokenBucket(rate) for category, rate in limits.items()}
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_retry_wait = max_retry_wait
+        self._lock = threading.Lock()
+        self._queue_depth = 0
+        self._stats = {
+            "requests": 0,
+            "throttled": 0,
+            "throttle_seconds": 0.0,
+            "retries": 0,
+            "rate_limited": 0,
+            "server_errors": 0,
+            "max_queue_depth": 0
+        }
+
+    def _bucket(self, category: str) -> TokenBucket:
+        return self.buckets.get(category) or self.buckets['medium']
+
+    @contextmanager
+    def _queued(self, wait: float) -> Iterator[None]:
+        with self._lock:
+            self._stats["requests"] += 1
+            if wait > 0:
+                self._stats["throttled"] += 1
+                self._stats["throttle_seconds"] += wait
+                self._queue_depth += 1
+                self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queue_depth)
+        try:
+            yield
+        finally:
+            if wait > 0:
+                with self._lock:
+                    self._queue_depth -= 1
+
+    def acquire(self, category: str) -> None:
+        """Block until a request in ``category`` may be sent."""
+        wait = self._bucket(category).reserve()
+        with self._queued(wait):
+            if wait > 0:
+                time.sleep(wait)
+
+    async def acquire_async(self, category: str) -> None:
+        """Wait on the event loop until a request in ``category`` may be sent."""
+        wait = self._bucket(category).reserve()
+        with self._queued(wait):
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    def observe(self, category: str, response: Any) -> None:
+        """Adapt the category's bucket to the X-RateLimit-* headers of a response."""
+        headers = response.headers
+        bucket = self._bucket((headers.get('X-RateLimit-Category') or category).lower())
+        limit_type = (headers.get('X-RateLimit-Type') or '').lower()
+        limit = headers.get('X-RateLimit-Limit')
+        if limit_type == 'qps' and limit:
+            try:
+                if float(limit) > 0 and float(limit) != bucket.rate:
+                    bucket.set_rate(float(limit))
+            except ValueError:
+                pass
+        if headers.get('X-RateLimit-Remaining') == '0' or response.status_code == 429:
+            retry_after = parse_retry_after(headers.get('Retry-After'))
+            if retry_after:
+                bucket.pause(min(retry_after, self.max_retry_wait))
+
+    def retry_delay(self, method: str, response: Any, attempt: int) -> Optional[float]:
+        """Return how long to wait before retrying ``response`` to a ``method`` request, or None to give up."""
+        status_code = response.status_code
+        if status_code != 429 and status_code < 500:
+            return None
+        with self._lock:
+            self._stats["rate_limited" if status_code == 429 else "server_errors"] += 1
+        if status_code != 429 and method.upper() not in RETRYABLE_METHODS:
+            return None
+        if attempt >= self.max_retries:
+            return None
+        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+        if retry_after is not None:
+            if retry_after > self.max_retry_wait:
+                return None
+            delay = retry_after
+        else:
+            # Full jitter keeps concurrent retries from arriving in lockstep
+            delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * (2 ** attempt)))
+        with self._lock:
+            self._stats["retries"] += 1
+            self._stats["throttle_seconds"] += delay
+        return delay
+
+    def stats(self) -> Dict[str, Any]:
+        """Return request, throttling and retry counters plus the current queue depth."""
+        with self._lock:
+            return {
+                **self._stats,
+                "throttle_seconds": round(self._stats["throttle_seconds"], 3),
+                "queue_depth": self._queue_depth,
+                "rates": {category: bucket.rate for category, bucket in self.buckets.items()}
+            }
+
+
+_rate_limiter: Optional[RateLimitScheduler] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimitScheduler:
+    """Return the process-wide request scheduler, reading its settings on first use."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimitScheduler(
+                    limits={
+                        category: get_float(f'ZOOM_RATE_LIMIT_{category.upper()}', rate)
+                        for category, rate in DEFAULT_RATE_LIMITS.items()
+                    },
+                    max_retries=get_int('ZOOM_MAX_RETRIES', 4),
+                    backoff_base=get_float('ZOOM_BACKOFF_BASE', 0.5),
+                    backoff_cap=get_float('ZOOM_BACKOFF_CAP', 30.0),
+                    max_retry_wait=get_float('ZOOM_MAX_RETRY_WAIT', 60.0)
+                )
+    return _rate_limiter
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``rate_limit.rate_limiter`` working without creating it at import
+    if name == "rate_limiter":
+        return get_rate_limiter()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_rate_limit_stats() -> Dict[str, Any]:
+    """Return queue depth and throttle time of the Zoom request scheduler."""
+    return get_rate_limiter().stats()
@@ -0,0 +1,343 @@
+import threading
+from datetime import datetime, time, timedelta
+from .config import get_int, get_setting
+from typing import Dict, Any, Iterable, List, NamedTuple, Optional, Tuple
+from .calendar import get_calendar_storage
+from .zoom import iter_zoom_meetings, iter_zoom_meetings_async
+from .telemetry import traced
+from .time_parser import parse_meeting_time
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+class Interval(NamedTuple):
+    start: datetime
+    end: datetime
+    title: str
+    source: str
+    meeting_id: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "title": self.title,
+            "start_time": self.start.strftime(TIME_FORMAT),
+            "end_time": self.end.strftime(TIME_FORMAT),
+            "source": self.source,
+            "meeting_id": self.meeting_id
+        }
+
+
+class IntervalIndex:
+    """Static interval tree over a start-sorted array.
+
+    The array is treated as an implicit balanced binary tree (the middle
+    element of each range is its root) and every node stores the largest end
+    time in its subtree. An overlap query skips subtrees whose intervals all
+    end before the query starts and right subtrees that start after it ends,
+    so it runs in O(log n + k) for k results.
+    """
+
+    def __init__(self, intervals: Iterable[Interval]):
+        self._intervals = sorted(intervals, key=lambda interval: (interval.start, interval.end))
+        self._max_end: List[Optional[datetime]] = [None] * len(self._intervals)
+        if self._intervals:
+            self._build(0, len(self._intervals))
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    def _build(self, lo: int, hi: int) -> datetime:
+        mid = (lo + hi) // 2
+        max_end = self._intervals[mid].end
+        if lo < mid:
+            max_end = max(max_end, self._build(lo, mid))
+        if mid + 1 < hi:
+            max_end = max(max_end, self._build(mid + 1, hi))
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Interval]:
+        """Return the intervals overlapping [start, end), ordered by start time."""
+        found = []
+        stack = [(0, len(self._intervals))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            if self._max_end[mid] <= start:
+                # Nothing in this subtree ends after the query starts
+                continue
+            interval = self._intervals[mid]
+            if interval.start < end:
+                if interval.end > start:
+                    found.append(interval)
+                stack.append((mid + 1, hi))
+            stack.append((lo, mid))
+        found.sort(key=lambda interval: (interval.start, interval.end))
+        return found
+
+
+_index_lock = threading.Lock()
+_calendar_index: Tuple[Any, int, Optional[IntervalIndex]] = (None, -1, None)
+
+
+def _calendar_intervals(events: Iterable[Dict[str, Any]]) -> Iterable[Interval]:
+    for event in events:
+        try:
+            start = datetime.strptime(event["start_time"], TIME_FORMAT)
+            duration = int(event.get("duration") or 0)
+        except (KeyError, TypeError, ValueError):
+            continue
+        yield Interval(start, start + timedelta(minutes=duration), event.get("title", "Untitled Event"),
+                       "calendar", str(event.get("meeting_id", "")))
+
+
+def get_calendar_index() -> IntervalIndex:
+    """Return the interval index of the calendar, rebuilding it only after the calendar changed."""
+    global _calendar_index
+    calendar_storage = get_calendar_storage()
+    calendar_storage.refresh()
+    with _index_lock:
+        storage, revision, index = _calendar_index
+        if storage is not calendar_storage or revision != calendar_storage.revision or index is None:
+            revision = calendar_storage.revision
+            index = IntervalIndex(_calendar_intervals(calendar_storage.list_events()))
+            _calendar_index = (calendar_storage, revision, index)
+        return index
+
+
+def _zoom_interval(meeting: Dict[str, Any]) -> Optional[Interval]:
+    try:
+        start = datetime.strptime(meeting["start_time"], TIME_FORMAT)
+        duration = int(str(meeting.get("duration", "0")).split()[0])
+    except (KeyError, IndexError, ValueError):
+        return None
+    return Interval(start, start + timedelta(minutes=duration), meeting.get("topic", "Untitled Meeting"),
+                    "zoom", str(meeting.get("meeting_id", "")))
+
+
+def _zoom_window(start: datetime, end: datetime) -> Tuple[str, str]:
+    # A meeting overlapping the window may have started the day before
+    return (start - timedelta(days=1)).strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+
+def _merge_busy(start: datetime, end: datetime, zoom_meetings: List[Dict[str, Any]]) -> List[Interval]:
+    """Combine calendar and Zoom intervals overlapping [start, end), ordered by start time.
+
+    Zoom meetings that are also on the calendar are only reported once, with
+    Zoom's start time and duration, since they may have been rescheduled.
+    """
+    zoom_ids = set()
+    busy = []
+    for meeting in zoom_meetings:
+        interval = _zoom_interval(meeting)
+        if interval:
+            zoom_ids.add(interval.meeting_id)
+            if interval.start < end and interval.end > start:
+                busy.append(interval)
+    busy.extend(
+        interval for interval in get_calendar_index().overlapping(start, end)
+        if interval.meeting_id not in zoom_ids
+    )
+    busy.sort(key=lambda interval: (interval.start, interval.end))
+    return busy
+
+
+def busy_intervals(start: datetime, end: datetime) -> Tuple[List[Interval], Optional[str]]:
+    """Return everything busy in [start, end) from the calendar and Zoom, plus any Zoom error."""
+    try:
+        zoom_meetings, zoom_error = list(iter_zoom_meetings(*_zoom_window(start, end))), None
+    except Exception as e:
+        zoom_meetings, zoom_error = [], f"Zoom meetings could not be checked: {str(e)}"
+    return _merge_busy(start, end, zoom_meetings), zoom_error
+
+
+async def busy_intervals_async(start: datetime, end: datetime) -> Tuple[List[Interval], Optional[str]]:
+    """Async counterpart of busy_intervals."""
+    try:
+        zoom_meetings = [meeting async for meeting in iter_zoom_meetings_async(*_zoom_window(start, end))]
+        zoom_error = None
+    except Exception as e:
+        zoom_meetings, zoom_error = [], f"Zoom meetings could not be checked: {str(e)}"
+    return _merge_busy(start, end, zoom_meetings), zoom_error
+
+
+def _working_hours(day: datetime) -> Tuple[datetime, datetime]:
+    # Free slots are only offered inside working hours (HH:MM, local time)
+    start = time.fromisoformat(get_setting('SCHEDULING_WORKDAY_START', '09:00'))
+    end = time.fromisoformat(get_setting('SCHEDULING_WORKDAY_END', '18:00'))
+    return datetime.combine(day.date(), start), datetime.combine(day.date(), end)
+
+
+def free_slots(
+    busy: List[Interval], window_start: datetime, window_end: datetime, duration: int, max_slots: int
+) -> List[Tuple[datetime, datetime]]:
+    """Sweep start-ordered busy intervals and return free gaps of at least ``duration`` minutes."""
+    needed = timedelta(minutes=duration)
+    slots = []
+    day = window_start.replace(hour=0, minute=0, second=0, microsecond=0)
+    position = 0
+    while day < window_end and len(slots) < max_slots:
+        day_start, day_end = _working_hours(day)
+        cursor, limit = max(day_start, window_start), min(day_end, window_end)
+        while position < len(busy) and busy[position].end <= cursor:
+            position += 1
+        index = position
+        while cursor < limit and len(slots) < max_slots:
+            next_busy = busy[index] if index < len(busy) and busy[index].start < limit else None
+            gap_end = min(next_busy.start, limit) if next_busy else limit
+            if gap_end - cursor >= needed:
+                slots.append((cursor, gap_end))
+            if not next_busy:
+                break
+            cursor = max(cursor, next_busy.end)
+            index += 1
+        day += timedelta(days=1)
+    return slots
+
+
+def _conflict_window(start_time: str, duration: int) -> Tuple[datetime, datetime]:
+    start = parse_meeting_time(start_time)
+    return start, start + timedelta(minutes=duration)
+
+
+def _conflicts_result(start: datetime, end: datetime, conflicts: List[Interval], zoom_error: Optional[str]) -> Dict[str, Any]:
+    window = f"between {start.strftime(TIME_FORMAT)} and {end.strftime(TIME_FORMAT)}"
+    result = {
+        "status": "success",
+        "message": f"{len(conflicts)} conflict(s) {window}" if conflicts else f"No conflicts {window}",
+        "has_conflict": bool(conflicts),
+        "conflicts": [interval.to_dict() for interval in conflicts]
+    }
+    if zoom_error:
+        result["warning"] = zoom_error
+    return result
+
+
+def _slot_window(window_start: str, window_end: str) -> Tuple[datetime, datetime]:
+    """Resolve the search window, raising ValueError if it is empty."""
+    start = parse_meeting_time(window_start) if window_start else datetime.now().replace(second=0, microsecond=0)
+    end = parse_meeting_time(window_end) if window_end else start + timedelta(days=7)
+    if end <= start:
+        raise ValueError("The search window must end after it starts")
+    return start, end
+
+
+def _free_slots_result(
+    busy: List[Interval], start: datetime, end: datetime, duration: int, max_slots: int, zoom_error: Optional[str]
+) -> Dict[str, Any]:
+    slots = free_slots(busy, start, end, duration, max_slots or get_int('SCHEDULING_MAX_SLOTS', 5))
+    result = {
+        "status": "success",
+        "message": f"Found {len(slots)} free slot(s) of at least {duration} minutes",
+        "slots": [
+            {"start_time": slot_start.strftime(TIME_FORMAT), "end_time": slot_end.strftime(TIME_FORMAT)}
+            for slot_start, slot_end in slots
+        ]
+    }
+    if zoom_error:
+        result["warning"] = zoom_error
+    return result
+
+
+@traced()
+def check_conflicts(start_time: str, duration: int = 60) -> Dict[str, Any]:
+    """Checks whether a proposed meeting overlaps anything on the calendar or in Zoom.
+
+    Args:
+        start_time: Proposed start time (e.g. '2024-03-20 14:00', 'tomorrow 3pm')
+        duration: Proposed duration in minutes
+    """
+    try:
+        start, end = _conflict_window(start_time, duration)
+        return _conflicts_result(start, end, *busy_intervals(start, end))
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error checking conflicts: {str(e)}"
+        }
+
+
+@traced()
+def find_free_slots(
+    duration: int = 30, window_start: str = "", window_end: str = "", max_slots: int = 0
+) -> Dict[str, Any]:
+    """Finds free time slots within working hours across the calendar and Zoom.
+
+    Args:
+        duration: Required slot length in minutes
+        window_start: Earliest start (e.g. 'tomorrow', '2024-03-20 09:00'), defaults to now
+        window_end: Latest end (e.g. 'friday 18:00'), defaults to 7 days after window_start
+        max_slots: Maximum number of slots to return, 0 for the configured default
+    """
+    try:
+        start, end = _slot_window(window_start, window_end)
+        busy, zoom_error = busy_intervals(start, end)
+        return _free_slots_result(busy, start, end, duration, max_slots, zoom_error)
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error finding free slots: {str(e)}"
+        }
+
+
+@traced()
+async def check_conflicts_async(start_time: str, duration: int = 60) -> Dict[str, Any]:
+    """Checks whether a proposed meeting overlaps anything on the calendar or in Zoom.
+
+    Args:
+        start_time: Proposed start time (e.g. '2024-03-20 14:00', 'tomorrow 3pm')
+        duration: Proposed duration in minutes
+    """
+    try:
+        start, end = _conflict_window(start_time, duration)
+        return _conflicts_result(start, end, *(await busy_intervals_async(start, end)))
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error checking conflicts: {str(e)}"
+        }
+
+
+@traced()
+async def find_free_slots_async(
+    duration: int = 30, window_start: str = "", window_end: str = "", max_slots: int = 0
+) -> Dict[str, Any]:
+    """Finds free time slots within working hours across the calendar and Zoom.
+
+    Args:
+        duration: Required slot length in minutes
+        window_start: Earliest start (e.g. 'tomorrow', '2024-03-20 09:00'), defaults to now
+        window_end: Latest end (e.g. 'friday 18:00'), defaults to 7 days after window_start
+        max_slots: Maximum number of slots to return, 0 for the configured default
+    """
+    try:
+        start, end = _slot_window(window_start, window_end)
+        busy, zoom_error = await busy_intervals_async(start, end)
+        return _free_slots_result(busy, start, end, duration, max_slots, zoom_error)
+    except ValueError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error finding free slots: {str(e)}"
+        }
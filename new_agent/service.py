@@ -0,0 +1,254 @@
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from .config import get_float, get_int, get_setting
+from typing import Container, Dict, Any, List, Optional, Tuple
+from fastapi import FastAPI, Header, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+from pydantic import BaseModel
+from .main import DEFAULT_USER_ID, end_session, get_runner, run_zoom_request
+from .profiling import new_request_id
+from .telemetry import render_prometheus
+from .zoom import set_open_browser
+
+logger = logging.getLogger(__name__)
+
+
+class Saturated(Exception):
+    """Raised when every worker slot is busy and the wait queue is full."""
+
+
+class AdmissionController:
+    """Bounds how many requests run at once and how many may wait for a slot.
+
+    Requests beyond ``max_concurrency + max_queue`` are rejected right away
+    instead of piling up, so a saturated service answers 503 quickly rather
+    than timing out every caller.
+    """
+
+    def __init__(self, max_concurrency: int = 16, max_queue: int = 64):
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._admitted = 0
+        self.in_flight = 0
+        self.rejected = 0
+
+    @asynccontextmanager
+    async def slot(self):
+        if self._admitted >= self.max_concurrency + self.max_queue:
+            self.rejected += 1
+            raise Saturated()
+        self._admitted += 1
+        try:
+            async with self._semaphore:
+                self.in_flight += 1
+                try:
+                    yield
+                finally:
+                    self.in_flight -= 1
+        finally:
+            self._admitted -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "queued": self._admitted - self.in_flight,
+            "rejected": self.rejected,
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue
+        }
+
+
+class SessionLocks:
+    """One lock per session, so turns of a conversation run in order while sessions run in parallel.
+
+    Locks are dropped once no request holds or waits for them.
+    """
+
+    def __init__(self):
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._users: Dict[str, int] = {}
+
+    @asynccontextmanager
+    async def hold(self, session_id: str):
+        lock = self._locks.setdefault(session_id, asyncio.Lock())
+        self._users[session_id] = self._users.get(session_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._users[session_id] -= 1
+            if not self._users[session_id]:
+                del self._users[session_id]
+                del self._locks[session_id]
+
+    def __contains__(self, session_id: object) -> bool:
+        return session_id in self._locks
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+class SessionTracker:
+    """Picks client sessions to end once idle for ``ttl`` seconds or beyond ``max_sessions``.
+
+    Sessions named by the client carry a conversation across requests, so
+    they cannot be ended after each request. Without a bound the in-memory
+    session store would keep every one of them for the life of the process.
+    """
+
+    def __init__(self, ttl: float = 1800.0, max_sessions: int = 1000):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        # Least recently used first
+        self._last_used: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self.evicted = 0
+
+    def touch(self, user_id: str, session_id: str) -> None:
+        key = (user_id, session_id)
+        self._last_used[key] = time.monotonic()
+        self._last_used.move_to_end(key)
+
+    def evict(self, busy: Container[str]) -> List[Tuple[str, str]]:
+        """Stop tracking and return the sessions to end, skipping those in ``busy``."""
+        deadline = time.monotonic() - self.ttl
+        excess = len(self._last_used) - self.max_sessions
+        evicted = []
+        for key, last_used in self._last_used.items():
+            if excess <= 0 and last_used > deadline:
+                break
+            if key[1] in busy:
+                continue
+            evicted.append(key)
+            excess -= 1
+        for key in evicted:
+            del self._last_used[key]
+        self.evicted += len(evicted)
+        return evicted
+
+    def __len__(self) -> int:
+        return len(self._last_used)
+
+
+def _profile_header(value: Optional[str]) -> Optional[bool]:
+    """Map an X-Profile header to a profiling decision; absent means let the sampling settings decide."""
+    if value is None:
+        return None
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+class ZoomRequest(BaseModel):
+    request: str
+    session_id: Optional[str] = None
+    user_id: str = DEFAULT_USER_ID
+
+
+async def _warm_up() -> None:
+    """Build the agents and fetch a Zoom token before the first request needs them."""
+    get_runner()
+    try:
+        from .zoom_oauth import get_zoom_access_token
+        await asyncio.to_thread(get_zoom_access_token)
+    except Exception as e:
+        # The service still starts; the first Zoom call will report the problem
+        logger.warning("Could not fetch a Zoom access token at startup: %s", e)
+
+
+def create_app(max_concurrency: Optional[int] = None, max_queue: Optional[int] = None,
+               request_timeout: Optional[float] = None, warm_up: bool = True) -> FastAPI:
+    """Create the HTTP service around run_zoom_request.
+
+    Limits left as None come from SERVICE_MAX_CONCURRENCY, SERVICE_MAX_QUEUE
+    and SERVICE_REQUEST_TIMEOUT.
+    """
+    admission = AdmissionController(
+        max_concurrency or get_int('SERVICE_MAX_CONCURRENCY', 16), max_queue or get_int('SERVICE_MAX_QUEUE', 64)
+    )
+    request_timeout = request_timeout or get_float('SERVICE_REQUEST_TIMEOUT', 120.0)
+    # A browser tab opened on the server helps no one: return meeting URLs to the client instead
+    set_open_browser(False)
+    # Seconds clients are asked to wait before retrying a rejected request
+    retry_after = str(get_int('SERVICE_RETRY_AFTER', 1))
+    session_locks = SessionLocks()
+    sessions = SessionTracker(get_float('SERVICE_SESSION_TTL', 1800.0), get_int('SERVICE_MAX_SESSIONS', 1000))
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        if warm_up:
+            await _warm_up()
+        yield
+        from .zoom_client import get_async_zoom_client
+        await get_async_zoom_client().aclose()
+
+    app = FastAPI(title="Zoom agent", lifespan=lifespan)
+    app.state.admission = admission
+    app.state.session_locks = session_locks
+    app.state.sessions = sessions
+
+    async def end_idle_sessions() -> None:
+        for user_id, session_id in sessions.evict(session_locks):
+            await end_session(user_id, session_id)
+
+    @app.post("/requests")
+    async def handle_request(body: ZoomRequest, response: Response, x_request_id: Optional[str] = Header(None),
+                             x_profile: Optional[str] = Header(None)):
+        # Without a client session ID the request runs in a throwaway session
+        session_id = body.session_id or uuid.uuid4().hex
+        session = {"session_id": body.session_id} if body.session_id else {}
+        request_id = x_request_id or new_request_id()
+        headers = {"X-Request-ID": request_id}
+        if body.session_id:
+            sessions.touch(body.user_id, session_id)
+        try:
+            async with admission.slot():
+                async with session_locks.hold(session_id):
+                    result = await asyncio.wait_for(
+                        run_zoom_request(
+                            body.request, body.user_id, session_id,
+                            request_id=request_id, profile=_profile_header(x_profile)
+                        ),
+                        request_timeout
+                    )
+        except Saturated:
+            return JSONResponse(
+                {"status": "error", "message": "Service is busy, retry later", **session},
+                status_code=503,
+                headers={"Retry-After": retry_after, **headers}
+            )
+        except asyncio.TimeoutError:
+            return JSONResponse(
+                {"status": "error", "message": "Request timed out", **session}, status_code=504, headers=headers
+            )
+        finally:
+            if body.session_id:
+                await end_idle_sessions()
+            else:
+                await end_session(body.user_id, session_id)
+        if not result.ok:
+            return JSONResponse({"status": "error", "message": result.text, **session}, status_code=500, headers=headers)
+        response.headers.update(headers)
+        return {"status": "success", "response": result.text, **session}
+
+    @app.get("/healthz")
+    async def healthz():
+        return {
+            "status": "ok", **admission.stats(), "sessions_active": len(session_locks),
+            "sessions_tracked": len(sessions), "sessions_evicted": sessions.evicted
+        }
+
+    @app.get("/metrics")
+    async def metrics():
+        # Prometheus text format; spans are only recorded with TELEMETRY_ENABLED=1
+        return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+    return app
+
+
+def serve(host: Optional[str] = None, port: Optional[int] = None) -> None:
+    """Run the service with uvicorn in a single process with a single event loop."""
+    import uvicorn
+    uvicorn.run(create_app(), host=host or get_setting('SERVICE_HOST', '127.0.0.1'), port=port or get_int('SERVICE_PORT', 8080))
@@ -0,0 +1,274 @@
+import re
+import json
+import time
+import asyncio
+import logging
+import functools
+import threading
+from .config import get_bool
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds, in seconds, of the duration histogram buckets
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_NUMERIC_SEGMENT_RE = re.compile(r'/\d+(?=/|$)')
+
+# None until TELEMETRY_ENABLED is read on the first span, or enable()/disable() is called
+_enabled: Optional[bool] = None
+_tracer: Any = None
+_configure_lock = threading.Lock()
+
+
+def route_name(method: str, path: str) -> str:
+    """Collapse IDs in a URL path so metric labels stay low-cardinality."""
+    return f"{method} {_NUMERIC_SEGMENT_RE.sub('/{id}', path.split('?', 1)[0])}"
+
+
+class MetricsRegistry:
+    """Thread-safe in-process aggregates of finished spans, rendered in Prometheus text format."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DURATION_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._durations: Dict[Tuple[str, str, str], List[float]] = {}
+        self._bytes: Dict[Tuple[str, str], int] = {}
+        self._tokens: Dict[Tuple[str, str], int] = {}
+
+    def observe(self, kind: str, name: str, status: str, duration: float, attributes: Dict[str, Any]) -> None:
+        with self._lock:
+            # Per series: one counter per bucket, then the sum and the count
+            series = self._durations.setdefault((kind, name, status), [0] * len(self.buckets) + [0.0, 0])
+            for index, bound in enumerate(self.buckets):
+                if duration <= bound:
+                    series[index] += 1
+            series[-2] += duration
+            series[-1] += 1
+            if attributes.get("bytes"):
+                self._bytes[(kind, name)] = self._bytes.get((kind, name), 0) + attributes["bytes"]
+            for token_type in ("prompt_tokens", "completion_tokens"):
+                if attributes.get(token_type):
+                    key = (name, token_type.split('_')[0])
+                    self._tokens[key] = self._tokens.get(key, 0) + attributes[token_type]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return count, total and mean duration per span, plus byte and token totals."""
+        with self._lock:
+            return {
+                "spans": [
+                    {
+                        "kind": kind, "name": name, "status": status, "count": series[-1],
+                        "total_ms": round(series[-2] * 1000, 2),
+                        "mean_ms": round(series[-2] / series[-1] * 1000, 2) if series[-1] else 0.0
+                    }
+                    for (kind, name, status), series in sorted(self._durations.items())
+                ],
+                "bytes": {f"{kind}:{name}": total for (kind, name), total in sorted(self._bytes.items())},
+                "tokens": {f"{name}:{token_type}": total for (name, token_type), total in sorted(self._tokens.items())}
+            }
+
+    def render_prometheus(self) -> str:
+        lines = [
+            "# HELP agent_span_duration_seconds Duration of tool calls, agent stages, model calls and HTTP requests.",
+            "# TYPE agent_span_duration_seconds histogram"
+        ]
+        with self._lock:
+            for (kind, name, status), series in sorted(self._durations.items()):
+                labels = f'kind="{kind}",name="{_escape(name)}",status="{_escape(status)}"'
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f'agent_span_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'agent_span_duration_seconds_bucket{{{labels},le="+Inf"}} {series[-1]}')
+                lines.append(f'agent_span_duration_seconds_sum{{{labels}}} {series[-2]:.6f}')
+                lines.append(f'agent_span_duration_seconds_count{{{labels}}} {series[-1]}')
+            lines += [
+                "# HELP agent_span_payload_bytes_total Bytes of tool results and HTTP response bodies.",
+                "# TYPE agent_span_payload_bytes_total counter"
+            ]
+            for (kind, name), total in sorted(self._bytes.items()):
+                lines.append(f'agent_span_payload_bytes_total{{kind="{kind}",name="{_escape(name)}"}} {total}')
+            lines += [
+                "# HELP agent_llm_tokens_total Model tokens by agent and type.",
+                "# TYPE agent_llm_tokens_total counter"
+            ]
+            for (name, token_type), total in sorted(self._tokens.items()):
+                lines.append(f'agent_llm_tokens_total{{agent="{_escape(name)}",type="{token_type}"}} {total}')
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._durations.clear()
+            self._bytes.clear()
+            self._tokens.clear()
+
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+metrics = MetricsRegistry()
+
+
+class Span:
+    """Times one operation and records it in ``metrics`` (and OpenTelemetry, if enabled) on exit.
+
+    Set ``status``, ``status_code``, ``bytes``, ``prompt_tokens`` or
+    ``completion_tokens`` with ``set`` while the span is open. An exception
+    marks the span as "error".
+    """
+
+    __slots__ = ("kind", "name", "attributes", "_start", "_otel_span", "_otel_context")
+
+    def __init__(self, kind: str, name: str, otel: bool = True):
+        self.kind = kind
+        self.name = name
+        self.attributes: Dict[str, Any] = {}
+        self._otel_span = None
+        self._otel_context = None
+        if otel and _tracer is not None:
+            self._otel_context = _tracer.start_as_current_span(f"{kind} {name}")
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        if self._otel_context is not None:
+            self._otel_span = self._otel_context.__enter__()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.finish(exc)
+        if self._otel_context is not None:
+            self._otel_context.__exit__(exc_type, exc, tb)
+        return False
+
+    def start(self) -> "Span":
+        """Start a span that is finished explicitly, e.g. across two callbacks."""
+        self._start = time.perf_counter()
+        return self
+
+    def finish(self, exc: Optional[BaseException] = None, end: Optional[float] = None) -> None:
+        duration = (end or time.perf_counter()) - self._start
+        status = "error" if exc is not None else str(self.attributes.get("status", "ok"))
+        if self._otel_span is not None:
+            self._otel_span.set_attribute("duration_ms", round(duration * 1000, 3))
+            for key, value in self.attributes.items():
+                if isinstance(value, (str, bool, int, float)):
+                    self._otel_span.set_attribute(key, value)
+        metrics.observe(self.kind, self.name, status, duration, self.attributes)
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+def span(kind: str, name: str) -> Any:
+    """Return a span context manager, or a shared no-op one when telemetry is disabled."""
+    # Short-circuits on a plain flag check once the settings have been read
+    if not (_enabled or (_enabled is None and _configure())):
+        return _NOOP_SPAN
+    return Span(kind, name)
+
+
+def is_enabled() -> bool:
+    return bool(_enabled or (_enabled is None and _configure()))
+
+
+def _record_result(current: Span, result: Any) -> None:
+    if isinstance(result, dict):
+        current.set(status=result.get("status", "ok"), bytes=len(json.dumps(result, default=str)))
+
+
+def traced(kind: str = "tool", name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Wrap a sync or async function in a span named after it.
+
+    Dict results set the span status from their "status" field and the
+    payload size from their JSON length. The wrapper keeps the signature,
+    so ADK still builds the same tool declaration. When telemetry is
+    disabled the only cost is one flag check per call.
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not (_enabled or (_enabled is None and _configure())):
+                    return await func(*args, **kwargs)
+                with Span(kind, span_name) as current:
+                    result = await func(*args, **kwargs)
+                    _record_result(current, result)
+                    return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not (_enabled or (_enabled is None and _configure())):
+                return func(*args, **kwargs)
+            with Span(kind, span_name) as current:
+                result = func(*args, **kwargs)
+                _record_result(current, result)
+                return result
+        return wrapper
+
+    return decorator
+
+
+def _load_tracer() -> Any:
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        logger.warning("TELEMETRY_OTEL is set but opentelemetry-api is not installed; exporting metrics only")
+        return None
+    return trace.get_tracer("new_agent")
+
+
+def _configure() -> bool:
+    """Read TELEMETRY_ENABLED and TELEMETRY_OTEL when the first span is started."""
+    global _enabled, _tracer
+    with _configure_lock:
+        if _enabled is None:
+            enabled = get_bool('TELEMETRY_ENABLED', False)
+            # Also emit OpenTelemetry spans (needs opentelemetry-api and a configured tracer provider)
+            if enabled and get_bool('TELEMETRY_OTEL', False):
+                _tracer = _load_tracer()
+            _enabled = enabled
+    return _enabled
+
+
+def enable(otel: Optional[bool] = None) -> None:
+    """Turn span recording on at runtime; ``otel`` defaults to TELEMETRY_OTEL."""
+    global _enabled, _tracer
+    if otel is None:
+        otel = get_bool('TELEMETRY_OTEL', False)
+    _tracer = _load_tracer() if otel else None
+    _enabled = True
+
+
+def disable() -> None:
+    """Turn span recording off; instrumented code goes back to a single flag check."""
+    global _enabled
+    _enabled = False
+
+
+def render_prometheus() -> str:
+    """Return all recorded metrics in the Prometheus text exposition format."""
+    return metrics.render_prometheus()
+
+
+def get_telemetry_stats() -> Dict[str, Any]:
+    """Return per-span counts and durations plus byte and token totals."""
+    return {"enabled": is_enabled(), **metrics.snapshot()}
@@ -0,0 +1,73 @@
+import time
+from typing import Any, Dict, Optional, Tuple
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event
+from google.adk.models import LlmRequest, LlmResponse
+from google.adk.plugins import BasePlugin
+from . import telemetry
+
+
+class TelemetryPlugin(BasePlugin):
+    """Records a span for every agent stage and every model call of a Runner.
+
+    Model spans carry the prompt and completion token counts from the
+    response's usage metadata. A stage skipped by its before_agent_callback
+    gets no after_agent_callback, so it is closed as "skipped" when the run
+    ends, timed up to its last event. These spans only feed the metrics
+    registry; ADK already emits its own OpenTelemetry spans for agents and
+    model calls.
+    """
+
+    def __init__(self, name: str = "telemetry"):
+        super().__init__(name=name)
+        self._open: Dict[Tuple[str, str, str], telemetry.Span] = {}
+        self._last_event: Dict[Tuple[str, str, str], float] = {}
+
+    def _start(self, kind: str, invocation_id: str, name: str) -> None:
+        if telemetry.is_enabled():
+            self._open[(kind, invocation_id, name)] = telemetry.Span(kind, name, otel=False).start()
+
+    def _finish(self, kind: str, invocation_id: str, name: str, error: Optional[BaseException] = None, **attributes: Any) -> None:
+        self._last_event.pop((kind, invocation_id, name), None)
+        current = self._open.pop((kind, invocation_id, name), None)
+        if current is not None:
+            current.set(**attributes)
+            current.finish(error)
+
+    async def before_agent_callback(self, *, agent: BaseAgent, callback_context: CallbackContext) -> None:
+        self._start("agent", callback_context.invocation_id, agent.name)
+
+    async def after_agent_callback(self, *, agent: BaseAgent, callback_context: CallbackContext) -> None:
+        self._finish("agent", callback_context.invocation_id, agent.name)
+
+    async def before_model_callback(self, *, callback_context: CallbackContext, llm_request: LlmRequest) -> None:
+        self._start("llm", callback_context.invocation_id, callback_context.agent_name)
+
+    async def after_model_callback(self, *, callback_context: CallbackContext, llm_response: LlmResponse) -> None:
+        if llm_response.partial:
+            return
+        usage = llm_response.usage_metadata
+        self._finish(
+            "llm", callback_context.invocation_id, callback_context.agent_name,
+            status="error" if llm_response.error_code else "ok",
+            prompt_tokens=(usage.prompt_token_count or 0) if usage else 0,
+            completion_tokens=(usage.candidates_token_count or 0) if usage else 0
+        )
+
+    async def on_model_error_callback(
+        self, *, callback_context: CallbackContext, llm_request: LlmRequest, error: Exception
+    ) -> None:
+        self._finish("llm", callback_context.invocation_id, callback_context.agent_name, error)
+
+    async def on_event_callback(self, *, invocation_context: InvocationContext, event: Event) -> None:
+        key = ("agent", invocation_context.invocation_id, event.author)
+        if key in self._open:
+            self._last_event[key] = time.perf_counter()
+
+    async def after_run_callback(self, *, invocation_context: InvocationContext) -> None:
+        for key in [key for key in self._open if key[1] == invocation_context.invocation_id]:
+            current = self._open.pop(key)
+            current.set(status="skipped" if key[0] == "agent" else "incomplete")
+            current.finish(end=self._last_event.pop(key, None))
@@ -0,0 +1,179 @@
+import re
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+from .telemetry import traced
+
+_MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+_WEEKDAYS = {'mon': 0, 'tue': 1, 'wed': 2, 'thu': 3, 'fri': 4, 'sat': 5, 'sun': 6}
+_NUMBER_WORDS = {
+    'a': 1, 'an': 1, 'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5, 'six': 6,
+    'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10, 'eleven': 11, 'twelve': 12
+}
+
+_MONTH = r'jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?'
+_WEEKDAY = r'mon(?:day)?|tue(?:s(?:day)?)?|wed(?:nesday)?|thu(?:r(?:s(?:day)?)?)?|fri(?:day)?|sat(?:urday)?|sun(?:day)?'
+_NUMBER = r'\d+|an?|one|two|three|four|five|six|seven|eight|nine|ten|eleven|twelve'
+
+# One alternation per token kind, tried in order at the current position.
+# Longer and more specific forms come first so e.g. ISO dates win over times.
+_TOKEN_RE = re.compile(
+    rf'''
+    (?P<iso>(?P<iso_y>\d{{4}})-(?P<iso_mo>\d{{1,2}})-(?P<iso_d>\d{{1,2}})
+        (?:[t\s]+(?P<iso_h>\d{{1,2}}):(?P<iso_mi>\d{{2}})(?::(?P<iso_s>\d{{2}}))?(?:\.\d+)?z?)?)
+    |(?P<rel>in\s+(?P<rel_n>{_NUMBER})\s*(?P<rel_unit>min(?:ute)?s?|h(?:ou)?rs?|hours?|days?|weeks?)\b)
+    |(?P<after_tomorrow>(?:the\s+)?day\s+after\s+tomorrow\b)
+    |(?P<tomorrow>tomorrow\b|tmrw\b)
+    |(?P<today>today\b)
+    |(?P<next_week>next\s+week\b)
+    |(?P<weekday>(?:(?P<wd_mod>next|this|coming)\s+)?(?P<wd>{_WEEKDAY})\b)
+    |(?P<month_day>(?P<md_mo>{_MONTH})\.?\s+(?P<md_d>\d{{1,2}})(?:st|nd|rd|th)?\b(?:,?\s+(?P<md_y>\d{{4}})\b)?)
+    |(?P<day_month>(?P<dm_d>\d{{1,2}})(?:st|nd|rd|th)?\s+(?:of\s+)?(?P<dm_mo>{_MONTH})\b(?:,?\s+(?P<dm_y>\d{{4}})\b)?)
+    |(?P<clock12>(?P<c12_h>\d{{1,2}})(?:[:.](?P<c12_mi>\d{{2}}))?\s*(?P<c12_ap>[ap])\.?m\.?(?=\W|$))
+    |(?P<clock24>(?P<c24_h>\d{{1,2}}):(?P<c24_mi>\d{{2}})(?::(?P<c24_s>\d{{2}}))?\b)
+    |(?P<at_hour>at\s+(?P<ah_h>\d{{1,2}})(?![\d:.]|\s*[ap]\.?m)\b)
+    |(?P<noon>noon\b|midday\b)
+    |(?P<midnight>midnight\b)
+    |(?P<filler>(?:at|on|the|of|for|by)\b|[\s,]+)
+    ''',
+    re.VERBOSE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Cached resolutions are ("absolute", datetime) or ("relative", timedelta)
+Resolution = Tuple[str, Any]
+
+
+def normalize_time_text(time_str: str) -> str:
+    """Lowercase and collapse whitespace so equivalent inputs share a cache entry."""
+    return _WHITESPACE_RE.sub(' ', time_str.lower()).strip()
+
+
+def _number(value: str) -> int:
+    return int(value) if value.isdigit() else _NUMBER_WORDS[value]
+
+
+def _clock(hour: int, minute: int = 0, second: int = 0, meridiem: Optional[str] = None) -> time:
+    if meridiem:
+        if not 1 <= hour <= 12:
+            raise ValueError(f"Invalid hour for {meridiem}m: {hour}")
+        hour = hour % 12 + (12 if meridiem == 'p' else 0)
+    return time(hour, minute, second)
+
+
+def _month_day(month: str, day: str, year: Optional[str], today: date) -> date:
+    result = date(int(year) if year else today.year, _MONTHS[month[:3]], int(day))
+    if not year and result < today:
+        # "may 12th" in June means next year's May 12th
+        result = result.replace(year=today.year + 1)
+    return result
+
+
+@lru_cache(maxsize=1024)
+def _resolve(text: str, today: date) -> Resolution:
+    """Tokenize ``text`` in a single pass and resolve it against ``today``."""
+    day: Optional[date] = None
+    day_offset = 0
+    clock: Optional[time] = None
+    delta = timedelta()
+    position = 0
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position:
+            raise ValueError(f"Could not understand the time '{text}' near '{text[position:]}'")
+        position = match.end()
+        kind = match.lastgroup
+        g = match.group
+        if kind == 'filler':
+            continue
+        if kind == 'iso':
+            day = date(int(g('iso_y')), int(g('iso_mo')), int(g('iso_d')))
+            if g('iso_h'):
+                clock = _clock(int(g('iso_h')), int(g('iso_mi')), int(g('iso_s') or 0))
+        elif kind == 'rel':
+            amount = _number(g('rel_n'))
+            unit = g('rel_unit')
+            if unit.startswith('d'):
+                day_offset += amount
+            elif unit.startswith('w'):
+                day_offset += 7 * amount
+            elif unit.startswith('h'):
+                delta += timedelta(hours=amount)
+            else:
+                delta += timedelta(minutes=amount)
+        elif kind == 'after_tomorrow':
+            day_offset += 2
+        elif kind == 'tomorrow':
+            day_offset += 1
+        elif kind == 'today':
+            day = today
+        elif kind == 'next_week':
+            day = today + timedelta(days=7 - today.weekday())
+        elif kind == 'weekday':
+            weekday = _WEEKDAYS[g('wd')[:3]]
+            if g('wd_mod') == 'next':
+                # The given weekday in the following calendar week
+                day = today + timedelta(days=7 - today.weekday() + weekday)
+            else:
+                day = today + timedelta(days=(weekday - today.weekday()) % 7)
+        elif kind == 'month_day':
+            day = _month_day(g('md_mo'), g('md_d'), g('md_y'), today)
+        elif kind == 'day_month':
+            day = _month_day(g('dm_mo'), g('dm_d'), g('dm_y'), today)
+        elif kind == 'clock12':
+            clock = _clock(int(g('c12_h')), int(g('c12_mi') or 0), meridiem=g('c12_ap'))
+        elif kind == 'clock24':
+            clock = _clock(int(g('c24_h')), int(g('c24_mi')), int(g('c24_s') or 0))
+        elif kind == 'at_hour':
+            clock = _clock(int(g('ah_h')))
+        elif kind == 'noon':
+            clock = time(12)
+        elif kind == 'midnight':
+            clock = time(0)
+
+    if delta:
+        if day is not None or day_offset or clock is not None:
+            raise ValueError(f"Could not combine a relative time with a date in '{text}'")
+        return ("relative", delta)
+    if day is None and not day_offset and clock is None:
+        raise ValueError(f"Could not understand the time '{text}'")
+    day = (day or today) + timedelta(days=day_offset)
+    return ("absolute", datetime.combine(day, clock or time(0)))
+
+
+@traced("parse")
+def parse_meeting_time(time_str: str = "", now: Optional[datetime] = None) -> datetime:
+    """Parse meeting time from various formats including natural language.
+
+    Understands ISO dates and datetimes, "today"/"tomorrow"/"day after
+    tomorrow", weekdays ("friday", "next monday"), "next week", month names
+    ("may 12th", "12 may 2026"), relative offsets ("in 2 hours", "in 3 days")
+    and 12/24-hour clock times. A missing time means midnight; an empty
+    string means five minutes from now. Raises ValueError for anything else.
+
+    Args:
+        time_str: The time expression to parse
+        now: Reference time, defaults to the current local time
+    """
+    now = now or datetime.now()
+    if not time_str or not time_str.strip():
+        return now + timedelta(minutes=5)
+    kind, value = _resolve(normalize_time_text(time_str), now.date())
+    if kind == "relative":
+        return now.replace(microsecond=0) + value
+    return value
+
+
+def get_time_parser_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss counters of the memoized time parser."""
+    info = _resolve.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "hit_rate": round(info.hits / lookups, 3) if lookups else 0.0
+    }
@@ -0,0 +1,101 @@
+import re
+import bisect
+import threading
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+_NON_WORD = re.compile(r'[^0-9a-z]+')
+
+
+def normalize_topic(topic: str) -> str:
+    """Lowercase a topic and collapse punctuation and whitespace to single spaces."""
+    return ' '.join(_NON_WORD.split(topic.lower())).strip()
+
+
+class TopicIndex:
+    """In-memory index from normalized meeting topics to meeting IDs.
+
+    Supports exact, prefix and token (all query words present) lookups so
+    that start/join by name can be resolved without listing meetings again.
+    It is fed from listing results and kept current by create/update/delete.
+    """
+
+    def __init__(self):
+        self._topics: Dict[str, str] = {}
+        self._exact: Dict[str, Set[str]] = {}
+        self._sorted: List[Tuple[str, str]] = []
+        self._tokens: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._topics)
+
+    def add(self, meeting_id: Any, topic: str) -> None:
+        """Index a meeting under its topic, replacing any previous topic."""
+        meeting_id = str(meeting_id)
+        normalized = normalize_topic(topic or '')
+        with self._lock:
+            if self._topics.get(meeting_id) == normalized:
+                return
+            self._remove(meeting_id)
+            self._topics[meeting_id] = normalized
+            self._exact.setdefault(normalized, set()).add(meeting_id)
+            bisect.insort(self._sorted, (normalized, meeting_id))
+            for token in normalized.split():
+                self._tokens.setdefault(token, set()).add(meeting_id)
+
+    def remove(self, meeting_id: Any) -> None:
+        with self._lock:
+            self._remove(str(meeting_id))
+
+    def _remove(self, meeting_id: str) -> None:
+        normalized = self._topics.pop(meeting_id, None)
+        if normalized is None:
+            return
+        self._discard(self._exact, normalized, meeting_id)
+        position = bisect.bisect_left(self._sorted, (normalized, meeting_id))
+        if position < len(self._sorted) and self._sorted[position] == (normalized, meeting_id):
+            del self._sorted[position]
+        for token in normalized.split():
+            self._discard(self._tokens, token, meeting_id)
+
+    @staticmethod
+    def _discard(index: Dict[str, Set[str]], key: str, meeting_id: str) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(meeting_id)
+            if not ids:
+                del index[key]
+
+    def resolve(self, query: str) -> Optional[str]:
+        """Return the meeting ID that best matches a topic, or None.
+
+        Exact matches win over prefix matches, which win over token matches.
+        Within a tier the meeting with the shortest topic is preferred.
+        """
+        normalized = normalize_topic(query or '')
+        if not normalized:
+            return None
+        with self._lock:
+            candidates = self._exact.get(normalized)
+            if not candidates:
+                candidates = set()
+                position = bisect.bisect_left(self._sorted, (normalized, ''))
+                while position < len(self._sorted) and self._sorted[position][0].startswith(normalized):
+                    candidates.add(self._sorted[position][1])
+                    position += 1
+            if not candidates:
+                token_sets = [self._tokens.get(token, set()) for token in normalized.split()]
+                candidates = set.intersection(*token_sets) if token_sets else set()
+            if not candidates:
+                return None
+            return min(candidates, key=lambda meeting_id: (len(self._topics[meeting_id]), meeting_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._topics.clear()
+            self._exact.clear()
+            self._sorted.clear()
+            self._tokens.clear()
+
+
+topic_index = TopicIndex()
@@ -0,0 +1,215 @@
+import asyncio
+import json
+import re
+from datetime import datetime, timedelta
+from typing import Any, AsyncGenerator, Dict, List, Optional
+from google.adk.agents import BaseAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.events import Event, EventActions
+from google.adk.tools import BaseTool, ToolContext
+from google.genai import types
+from .gmail import triage_inbox
+from .calendar import get_calendar_storage
+from .zoom import iter_zoom_meetings_async
+
+_MEETING_REQUIRED_RE = re.compile(r'MEETING_REQUIRED:\s*\[?\s*(yes|no)\b', re.IGNORECASE)
+_URGENCY_RE = re.compile(r'URGENCY:\s*\[?\s*(urgent|normal)\b', re.IGNORECASE)
+_MEETING_DETAILS_RE = re.compile(r'MEETING_DETAILS:\s*(\{.*?\})', re.DOTALL)
+
+# Tools whose successful result means a meeting now exists for the calendar and joiner stages
+MEETING_CREATING_TOOLS = {
+    "create_zoom_meeting", "create_zoom_meeting_async",
+    "update_zoom_meeting", "update_zoom_meeting_async",
+    "bulk_create_zoom_meetings", "bulk_create_zoom_meetings_async"
+}
+
+
+def _text(text: str) -> types.Content:
+    return types.Content(role="model", parts=[types.Part(text=text)])
+
+
+def _format_emails(emails) -> str:
+    return "\n\n".join(
+        f"ID: {email.get('id')}\n"
+        f"From: {email.get('sender')}\n"
+        f"Subject: {email.get('subject')}\n"
+        f"Priority: {email.get('priority', 'normal')}\n"
+        f"Content: {email.get('content', '')}"
+        for email in emails
+    )
+
+
+def _state_event(agent: BaseAgent, ctx: InvocationContext, message: str, state_delta: Dict[str, Any]) -> Event:
+    """Build the event a non-LLM agent emits to report ``message`` and update session state."""
+    return Event(
+        invocation_id=ctx.invocation_id,
+        author=agent.name,
+        branch=ctx.branch,
+        content=_text(message),
+        actions=EventActions(state_delta=state_delta)
+    )
+
+
+class EmailTriageAgent(BaseAgent):
+    """Checks and triages new emails with local rules instead of a model call.
+
+    Writes the digest to ``email_check_result`` and the emails the rules
+    could not decide to ``ambiguous_emails``. When every email was decided,
+    the rule-based analysis is written to ``email_analysis`` as well, so the
+    analyzer can be skipped.
+    """
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        result = triage_inbox()
+        if result["status"] != "success":
+            message = f"Error checking emails: {result['error_message']}"
+            state_delta = {"email_check_result": message, "ambiguous_emails": "None", "ambiguous_email_count": 0}
+        else:
+            message = f"{result['report']}\n{result['digest']}"
+            state_delta = {
+                "email_check_result": message,
+                "email_triage": result["emails"],
+                "ambiguous_emails": _format_emails(result["ambiguous"]) or "None",
+                "ambiguous_email_count": len(result["ambiguous"])
+            }
+            if not result["ambiguous"]:
+                state_delta["email_analysis"] = result["analysis"]
+        yield _state_event(self, ctx, message, state_delta)
+
+
+def _format_calendar(events: List[Dict[str, Any]]) -> str:
+    return "\n".join(
+        f"{event.get('start_time')} | {event.get('title')} | {event.get('duration')} minutes | "
+        f"Meeting ID: {event.get('meeting_id') or 'N/A'}"
+        for event in events
+    ) or "No events."
+
+
+class CalendarSnapshotAgent(BaseAgent):
+    """Loads calendar events from today on into ``calendar_snapshot``.
+
+    Storage access is blocking, so it runs in a worker thread and does not
+    hold up the other prefetch branches.
+    """
+
+    days: int = 7
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        today = datetime.now().strftime("%Y-%m-%d")
+        to_date = (datetime.now() + timedelta(days=self.days)).strftime("%Y-%m-%d")
+        try:
+            events = await asyncio.to_thread(get_calendar_storage().list_events, None, today, to_date)
+            message = _format_calendar(events)
+        except Exception as e:
+            message = f"Could not load the calendar: {str(e)}"
+        yield _state_event(self, ctx, message, {"calendar_snapshot": message})
+
+
+def _format_upcoming(meetings: List[Dict[str, Any]], now: datetime) -> str:
+    lines = []
+    for meeting in meetings:
+        minutes = round((datetime.strptime(meeting["start_time"], "%Y-%m-%d %H:%M:%S") - now).total_seconds() / 60)
+        lines.append(
+            f"{meeting['start_time']} (starts in {minutes} minutes) | {meeting['topic']} | "
+            f"Meeting ID: {meeting['meeting_id']} | {meeting['join_url']}"
+        )
+    return "\n".join(lines) or "No upcoming meetings."
+
+
+class UpcomingMeetingsAgent(BaseAgent):
+    """Lists Zoom meetings starting within ``hours`` into ``upcoming_meetings``."""
+
+    hours: int = 24
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        now = datetime.now()
+        until = now + timedelta(hours=self.hours)
+        try:
+            meetings = [
+                meeting async for meeting in iter_zoom_meetings_async(now.strftime("%Y-%m-%d"), until.strftime("%Y-%m-%d"))
+                if now.strftime("%Y-%m-%d %H:%M:%S") <= meeting["start_time"] <= until.strftime("%Y-%m-%d %H:%M:%S")
+            ]
+            meetings.sort(key=lambda meeting: meeting["start_time"])
+            message = _format_upcoming(meetings, now)
+        except Exception as e:
+            message = f"Could not list Zoom meetings: {str(e)}"
+        yield _state_event(self, ctx, message, {"upcoming_meetings": message})
+
+
+def skip_analysis_when_triaged(callback_context: CallbackContext) -> Optional[types.Content]:
+    """before_agent_callback for the analyzer: skip the model if triage decided every email."""
+    state = callback_context.state
+    if state.get("ambiguous_email_count", 1) or not state.get("email_analysis"):
+        return None
+    return _text(state["email_analysis"])
+
+
+def parse_email_analysis(text: str) -> Dict[str, Any]:
+    """Parse the analyzer's structured output.
+
+    ``meeting_required`` is True/False, or None when the output does not
+    follow the format, in which case callers should not skip anything.
+    """
+    required = _MEETING_REQUIRED_RE.search(text or "")
+    urgency = _URGENCY_RE.search(text or "")
+    details = _MEETING_DETAILS_RE.search(text or "")
+    try:
+        meeting_details = json.loads(details.group(1)) if details else None
+    except ValueError:
+        meeting_details = None
+    return {
+        "meeting_required": required.group(1).lower() == "yes" if required else None,
+        "urgency": urgency.group(1).lower() if urgency else "normal",
+        "meeting_details": meeting_details
+    }
+
+
+def _skip(callback_context: CallbackContext, output_key: str, message: str) -> types.Content:
+    # Returning content skips the agent, so its output_key has to be written here
+    callback_context.state[output_key] = message
+    return _text(message)
+
+
+def _user_request(callback_context: CallbackContext) -> str:
+    content = callback_context.user_content
+    return "".join(part.text or "" for part in (content.parts or [])).strip() if content else ""
+
+
+def skip_meeting_when_not_required(callback_context: CallbackContext) -> Optional[types.Content]:
+    """before_agent_callback for the Zoom agent: skip it when the analysis needs no meeting.
+
+    Only email-polling runs, which carry no user request text, are skipped;
+    a direct request is always handed to the agent whatever the inbox says.
+    """
+    state = callback_context.state
+    state["meeting_created"] = False
+    if _user_request(callback_context):
+        return None
+    if parse_email_analysis(state.get("email_analysis", ""))["meeting_required"] is False:
+        return _skip(callback_context, "meeting_result", "No meeting required.")
+    return None
+
+
+def record_meeting_outcome(
+    tool: BaseTool, args: Dict[str, Any], tool_context: ToolContext, tool_response: Any
+) -> Optional[Dict[str, Any]]:
+    """after_tool_callback for the Zoom agent: remember whether a meeting was created."""
+    if tool.name in MEETING_CREATING_TOOLS and isinstance(tool_response, dict) \
+            and tool_response.get("status") in ("success", "partial"):
+        tool_context.state["meeting_created"] = True
+    return None
+
+
+def skip_calendar_when_no_meeting(callback_context: CallbackContext) -> Optional[types.Content]:
+    """before_agent_callback for the calendar agent: skip it unless a meeting was created."""
+    if not callback_context.state.get("meeting_created"):
+        return _skip(callback_context, "calendar_result", "No meeting to add to calendar.")
+    return None
+
+
+def skip_joiner_when_no_meeting(callback_context: CallbackContext) -> Optional[types.Content]:
+    """before_agent_callback for the joiner agent: skip it unless a meeting was created."""
+    if not callback_context.state.get("meeting_created"):
+        return _skip(callback_context, "meeting_join_result", "No immediate meetings to join.")
+    return None
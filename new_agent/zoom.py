@@ -1,242 +1,93 @@
-from google.adk.agents import Agent
-from google.adk.models.lite_llm import LiteLlm
-import os
-import requests
+import re
+import asyncio
 import webbrowser
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
-from typing import Dict, Any, Optional
-from .zoom_oauth import get_zoom_access_token
+from typing import Dict, Any, AsyncIterator, Generator, Iterator, List, NamedTuple, Optional, Tuple, Union
+from .config import get_bool
+from .zoom_client import ZoomAPIError, get_zoom_client, get_async_zoom_client
+from .meeting_cache import get_meeting_cache
+from .topic_index import topic_index
+from .time_parser import parse_meeting_time
+from .payloads import meeting_record, shape_meeting_result, shape_list_result
+from .telemetry import traced
 
-# Load environment variables
-load_dotenv()
+INVALID_START_TIME_MESSAGE = "Invalid start time format. Please use YYYY-MM-DD HH:MM:SS or a natural language time like 'tomorrow 1 pm' or '1 pm'"
+
+LIST_MEETINGS_PARAMS = {
+    'type': 'scheduled',
+    'page_size': 100  # Maximum allowed by Zoom
+}
+
+# Zoom meeting IDs are 9 to 11 digits, often written in groups like "812 3456 7890"
+MEETING_ID_PATTERN = re.compile(r'^\d{9,11}$')
 
 def format_zoom_time(dt: datetime) -> str:
     """Format datetime object to Zoom API compatible string."""
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
-def parse_meeting_time(time_str: str = "") -> datetime:
-    """Parse meeting time from various formats including natural language."""
-    try:
-        if not time_str:
-            return datetime.now() + timedelta(minutes=5)
-        
-        # Try to parse the time string
-        time_str = time_str.lower().strip()
-        
-        # Handle "in X days" format
-        if "in" in time_str and "days" in time_str:
-            try:
-                days = int(time_str.split("in")[1].split("days")[0].strip())
-                date = datetime.now() + timedelta(days=days)
-                time_part = time_str.split("at")[-1].strip() if "at" in time_str else "00:00:00"
-                
-                if "pm" in time_part:
-                    time_digits = time_part.split('pm')[0].strip().replace('.', ':')
-                    if ':' in time_digits:
-                        hour, minutes = map(int, time_digits.split(':'))
-                        if hour != 12:
-                            hour += 12
-                        time = f"{hour:02d}:{minutes:02d}:00"
-                    else:
-                        hour = int(time_digits)
-                        if hour != 12:
-                            hour += 12
-                        time = f"{hour:02d}:00:00"
-                elif "am" in time_part:
-                    time_digits = time_part.split('am')[0].strip().replace('.', ':')
-                    if ':' in time_digits:
-                        hour, minutes = map(int, time_digits.split(':'))
-                        if hour == 12:
-                            hour = 0
-                        time = f"{hour:02d}:{minutes:02d}:00"
-                    else:
-                        hour = int(time_digits)
-                        if hour == 12:
-                            hour = 0
-                        time = f"{hour:02d}:00:00"
-                else:
-                    time = "00:00:00"
-                
-                return datetime.strptime(f"{date.strftime('%Y-%m-%d')} {time}", "%Y-%m-%d %H:%M:%S")
-            except (ValueError, IndexError):
-                pass
-
-        # Handle month names (e.g., "may 12th")
-        months = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
-            'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
-        }
-        
-        for month_name, month_num in months.items():
-            if month_name in time_str:
-                try:
-                    # Extract the day
-                    day_part = time_str.split(month_name)[1].strip()
-                    day = int(''.join(filter(str.isdigit, day_part)))
-                    
-                    # Get current year
-                    year = datetime.now().year
-                    
-                    # Extract time if present
-                    time_part = time_str.split("at")[-1].strip() if "at" in time_str else "00:00:00"
-                    
-                    if "pm" in time_part:
-                        time_digits = time_part.split('pm')[0].strip().replace('.', ':')
-                        if ':' in time_digits:
-                            hour, minutes = map(int, time_digits.split(':'))
-                            if hour != 12:
-                                hour += 12
-                            time = f"{hour:02d}:{minutes:02d}:00"
-                        else:
-                            hour = int(time_digits)
-                            if hour != 12:
-                                hour += 12
-                            time = f"{hour:02d}:00:00"
-                    elif "am" in time_part:
-                        time_digits = time_part.split('am')[0].strip().replace('.', ':')
-                        if ':' in time_digits:
-                            hour, minutes = map(int, time_digits.split(':'))
-                            if hour == 12:
-                                hour = 0
-                            time = f"{hour:02d}:{minutes:02d}:00"
-                        else:
-                            hour = int(time_digits)
-                            if hour == 12:
-                                hour = 0
-                            time = f"{hour:02d}:00:00"
-                    else:
-                        time = "00:00:00"
-                    
-                    return datetime.strptime(f"{year}-{month_num:02d}-{day:02d} {time}", "%Y-%m-%d %H:%M:%S")
-                except (ValueError, IndexError):
-                    pass
-        
-        # Handle "tomorrow" format
-        if "tomorrow" in time_str:
-            date = datetime.now() + timedelta(days=1)
-            time_part = time_str.replace('tomorrow', '').strip()
-            
-            if "pm" in time_part:
-                time_digits = time_part.split('pm')[0].strip().replace('.', ':')
-                if ':' in time_digits:
-                    hour, minutes = map(int, time_digits.split(':'))
-                    if hour != 12:
-                        hour += 12
-                    time = f"{hour:02d}:{minutes:02d}:00"
-                else:
-                    hour = int(time_digits)
-                    if hour != 12:
-                        hour += 12
-                    time = f"{hour:02d}:00:00"
-            elif "am" in time_part:
-                time_digits = time_part.split('am')[0].strip().replace('.', ':')
-                if ':' in time_digits:
-                    hour, minutes = map(int, time_digits.split(':'))
-                    if hour == 12:
-                        hour = 0
-                    time = f"{hour:02d}:{minutes:02d}:00"
-                else:
-                    hour = int(time_digits)
-                    if hour == 12:
-                        hour = 0
-                    time = f"{hour:02d}:00:00"
-            else:
-                time = "00:00:00"
-            
-            return datetime.strptime(f"{date.strftime('%Y-%m-%d')} {time}", "%Y-%m-%d %H:%M:%S")
-        
-        # Handle today with time
-        elif any(x in time_str for x in ["am", "pm"]):
-            now = datetime.now()
-            time_part = time_str.lower()
-            
-            if "pm" in time_part:
-                time_digits = time_part.split('pm')[0].strip().replace('.', ':')
-                if ':' in time_digits:
-                    hour, minutes = map(int, time_digits.split(':'))
-                    if hour != 12:
-                        hour += 12
-                    time = f"{hour:02d}:{minutes:02d}:00"
-                else:
-                    hour = int(time_digits)
-                    if hour != 12:
-                        hour += 12
-                    time = f"{hour:02d}:00:00"
-            elif "am" in time_part:
-                time_digits = time_part.split('am')[0].strip().replace('.', ':')
-                if ':' in time_digits:
-                    hour, minutes = map(int, time_digits.split(':'))
-                    if hour == 12:
-                        hour = 0
-                    time = f"{hour:02d}:{minutes:02d}:00"
-                else:
-                    hour = int(time_digits)
-                    if hour == 12:
-                        hour = 0
-                    time = f"{hour:02d}:00:00"
-            else:
-                time = "00:00:00"
-            
-            return datetime.strptime(f"{now.strftime('%Y-%m-%d')} {time}", "%Y-%m-%d %H:%M:%S")
-        else:
-            # Try to parse as exact datetime
-            return datetime.strptime(time_str, "%Y-%m-%d %H:%M:%S")
-    except ValueError:
-        # If parsing fails, return current time + 5 minutes
-        return datetime.now() + timedelta(minutes=5)
-
-def create_zoom_meeting(topic: str = "Scheduled Meeting", duration: int = 60, start_time: str = "") -> Dict[str, Any]:
-    """Creates a Zoom meeting and returns the join URL."""
-    try:
-        access_token = get_zoom_access_token()
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
+def _remember_meeting(meeting_info: Dict[str, Any]) -> None:
+    """Record a full meeting object in the meeting cache and the topic index."""
+    get_meeting_cache().put(meeting_info)
+    if 'id' in meeting_info:
+        topic_index.add(meeting_info['id'], meeting_info.get('topic', ''))
+
+def _create_meeting_payload(topic: str, duration: int, start_time: str) -> Tuple[Dict[str, Any], datetime]:
+    """Build the request body for creating a meeting and return it with the parsed start time."""
+    # Parse the start time using shared function
+    meeting_time = parse_meeting_time(start_time)
+    
+    meeting_data = {
+        'topic': topic,
+        'type': 2,  # Scheduled meeting
+        'start_time': format_zoom_time(meeting_time),
+        'duration': duration,
+        'timezone': 'UTC',
+        'settings': {
+            'host_video': True,
+            'participant_video': True,
+            'join_before_host': True,
+            'mute_upon_entry': True,
+            'auto_recording': 'none'
         }
-        
-        # Parse the start time using shared function
-        meeting_time = parse_meeting_time(start_time)
-        
-        # Format time for Zoom API
-        zoom_time = format_zoom_time(meeting_time)
-        
-        meeting_data = {
-            'topic': topic,
-            'type': 2,  # Scheduled meeting
-            'start_time': zoom_time,
-            'duration': duration,
-            'timezone': 'UTC',
-            'settings': {
-                'host_video': True,
-                'participant_video': True,
-                'join_before_host': True,
-                'mute_upon_entry': True,
-                'auto_recording': 'none'
+    }
+    return meeting_data, meeting_time
+
+def _meeting_actions(meeting_info: Dict[str, Any], meeting_id: Any, display_time: str) -> Dict[str, Any]:
+    """Build the follow-up actions block returned after creating or updating a meeting."""
+    return {
+        "start_meeting": f"[Click to start]({meeting_info.get('start_url', '')})",
+        "edit_meeting": {
+            "meeting_id": meeting_info.get('id', meeting_id),
+            "current_details": {
+                "topic": meeting_info.get('topic', ''),
+                "duration": meeting_info.get('duration', ''),
+                "start_time": display_time
             }
+        },
+        "delete_meeting": {
+            "meeting_id": meeting_info.get('id', meeting_id)
         }
-        
-        response = requests.post(
-            'https://api.zoom.us/v2/users/me/meetings',
-            headers=headers,
-            json=meeting_data
-        )
-        
-        if response.status_code != 201:
-            return {
-                "status": "error",
-                "message": f"Failed to create meeting: {response.text}"
-            }
-        
-        meeting_info = response.json()
-        
+    }
+
+def _create_meeting_result(response: Any, meeting_time: datetime, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Turn the Zoom response of a create call into the tool result."""
+    if response.status_code != 201:
+        return {
+            "status": "error",
+            "message": f"Failed to create meeting: {response.text}"
+        }
+    
+    meeting_info = response.json()
+    _remember_meeting(meeting_info)
+    
+    message = "Meeting created successfully!"
+
+    def full() -> Dict[str, Any]:
         # Format the start time for display
         display_time = meeting_time.strftime("%Y-%m-%d %H:%M:%S")
-        
         return {
             "status": "success",
-            "message": "Meeting created successfully!",
+            "message": message,
             "details": {
                 "topic": meeting_info['topic'],
                 "join_url": f"[Click to join]({meeting_info['join_url']})",
@@ -244,82 +95,36 @@ def create_zoom_meeting(topic: str = "Scheduled Meeting", duration: int = 60, st
                 "duration": f"{meeting_info['duration']} minutes",
                 "start_time": display_time
             },
-            "actions": {
-                "start_meeting": f"[Click to start]({meeting_info['start_url']})",
-                "edit_meeting": {
-                    "meeting_id": meeting_info['id'],
-                    "current_details": {
-                        "topic": meeting_info['topic'],
-                        "duration": meeting_info['duration'],
-                        "start_time": display_time
-                    }
-                },
-                "delete_meeting": {
-                    "meeting_id": meeting_info['id']
-                }
-            }
-        }
-        
-    except Exception as e:
-        return {
-            "status": "error",
-            "message": f"Error creating meeting: {str(e)}"
+            "actions": _meeting_actions(meeting_info, meeting_info['id'], display_time)
         }
+    return shape_meeting_result(message, meeting_record(meeting_info), full, compact, fields)
 
-def update_zoom_meeting(meeting_id: Optional[str], topic: Optional[str] = None, duration: Optional[int] = None, start_time: Optional[str] = None) -> Dict[str, Any]:
-    """Updates a Zoom meeting's details and returns updated details."""
-    try:
-        access_token = get_zoom_access_token()
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        # Prepare update data
-        update_data = {}
-        if topic:
-            update_data['topic'] = topic
-        if duration:
-            update_data['duration'] = duration
-        if start_time:
-            try:
-                # Use shared time parsing function
-                meeting_time = parse_meeting_time(start_time)
-                update_data['start_time'] = format_zoom_time(meeting_time)
-            except Exception:
-                return {
-                    "status": "error",
-                    "message": "Invalid start time format. Please use YYYY-MM-DD HH:MM:SS or a natural language time like 'tomorrow 1 pm' or '1 pm'"
-                }
-        
-        response = requests.patch(
-            f'https://api.zoom.us/v2/meetings/{meeting_id}',
-            headers=headers,
-            json=update_data
-        )
-        
-        if response.status_code != 204:
-            return {
-                "status": "error",
-                "message": f"Failed to update meeting: {response.text}"
-            }
-        
-        # Fetch updated meeting details
-        get_response = requests.get(
-            f'https://api.zoom.us/v2/meetings/{meeting_id}',
-            headers=headers
-        )
-        if get_response.status_code != 200:
-            return {
-                "status": "error",
-                "message": f"Meeting updated but failed to fetch updated details: {get_response.text}"
-            }
-        meeting_info = get_response.json()
+def _update_meeting_payload(topic: Optional[str], duration: Optional[int], start_time: Optional[str]) -> Dict[str, Any]:
+    """Build the PATCH body for an update, raising ValueError for an unparseable start time."""
+    update_data = {}
+    if topic:
+        update_data['topic'] = topic
+    if duration:
+        update_data['duration'] = duration
+    if start_time:
+        try:
+            # Use shared time parsing function
+            meeting_time = parse_meeting_time(start_time)
+            update_data['start_time'] = format_zoom_time(meeting_time)
+        except Exception as e:
+            raise ValueError(str(e)) from e
+    return update_data
+
+def _update_meeting_result(meeting_info: Dict[str, Any], meeting_id: Any, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Turn the refreshed meeting details after an update into the tool result."""
+    topic_index.add(meeting_info.get('id', meeting_id), meeting_info.get('topic', ''))
+    message = "Meeting updated successfully!"
+
+    def full() -> Dict[str, Any]:
         display_time = meeting_info['start_time'].replace('T', ' ').replace('Z', '')
         return {
             "status": "success",
-            "message": "Meeting updated successfully!",
+            "message": message,
             "details": {
                 "topic": meeting_info.get('topic', ''),
                 "join_url": f"[Click to join]({meeting_info.get('join_url', '')})",
@@ -327,90 +132,49 @@ def update_zoom_meeting(meeting_id: Optional[str], topic: Optional[str] = None,
                 "duration": f"{meeting_info.get('duration', '')} minutes",
                 "start_time": display_time
             },
-            "actions": {
-                "start_meeting": f"[Click to start]({meeting_info.get('start_url', '')})",
-                "edit_meeting": {
-                    "meeting_id": meeting_info.get('id', meeting_id),
-                    "current_details": {
-                        "topic": meeting_info.get('topic', ''),
-                        "duration": meeting_info.get('duration', ''),
-                        "start_time": display_time
-                    }
-                },
-                "delete_meeting": {
-                    "meeting_id": meeting_info.get('id', meeting_id)
-                }
-            }
+            "actions": _meeting_actions(meeting_info, meeting_id, display_time)
         }
-        
-    except Exception as e:
+    return shape_meeting_result(message, meeting_record(meeting_info, meeting_id), full, compact, fields)
+
+def _delete_meeting_result(response: Any, meeting_id: Any) -> Dict[str, Any]:
+    """Turn the Zoom response of a delete call into the tool result."""
+    if response.status_code != 204:
         return {
             "status": "error",
-            "message": f"Error updating meeting: {str(e)}"
+            "message": f"Failed to delete meeting: {response.text}"
         }
+    
+    get_meeting_cache().invalidate(meeting_id)
+    topic_index.remove(meeting_id)
 
-def delete_zoom_meeting(meeting_id: str) -> Dict[str, Any]:
-    """Deletes a Zoom meeting."""
-    try:
-        access_token = get_zoom_access_token()
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.delete(
-            f'https://api.zoom.us/v2/meetings/{meeting_id}',
-            headers=headers
-        )
-        
-        if response.status_code != 204:
-            return {
-                "status": "error",
-                "message": f"Failed to delete meeting: {response.text}"
-            }
-        
-        return {
-            "status": "success",
-            "message": "Meeting deleted successfully!"
-        }
-        
-    except Exception as e:
+    return {
+        "status": "success",
+        "message": "Meeting deleted successfully!"
+    }
+
+def _get_meeting_result(response: Any, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Turn the Zoom response of a get call into the tool result."""
+    if response.status_code != 200:
         return {
             "status": "error",
-            "message": f"Error deleting meeting: {str(e)}"
+            "message": f"Failed to get meeting: {response.text}"
         }
+    
+    meeting_info = response.json()
+    _remember_meeting(meeting_info)
+    return _meeting_details_result(meeting_info, compact, fields)
 
-def get_zoom_meeting(meeting_id: str) -> Dict[str, Any]:
-    """Gets details of a specific Zoom meeting."""
-    try:
-        access_token = get_zoom_access_token()
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        response = requests.get(
-            f'https://api.zoom.us/v2/meetings/{meeting_id}',
-            headers=headers
-        )
-        
-        if response.status_code != 200:
-            return {
-                "status": "error",
-                "message": f"Failed to get meeting: {response.text}"
-            }
-        
-        meeting_info = response.json()
-        
+def _meeting_details_result(meeting_info: Dict[str, Any], compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Turn a raw Zoom meeting object into the get tool result."""
+    message = "Meeting details retrieved successfully!"
+
+    def full() -> Dict[str, Any]:
         # Parse the start time from Zoom's format
         start_time = datetime.strptime(meeting_info['start_time'], "%Y-%m-%dT%H:%M:%SZ")
         display_time = start_time.strftime("%Y-%m-%d %H:%M:%S")
-        
         return {
             "status": "success",
-            "message": "Meeting details retrieved successfully!",
+            "message": message,
             "details": {
                 "topic": meeting_info['topic'],
                 "join_url": f"[Click to join]({meeting_info['join_url']})",
@@ -421,97 +185,76 @@ def get_zoom_meeting(meeting_id: str) -> Dict[str, Any]:
                 "status": meeting_info['status']
             }
         }
-        
-    except Exception as e:
-        return {
-            "status": "error",
-            "message": f"Error getting meeting: {str(e)}"
-        }
+    return shape_meeting_result(message, meeting_record(meeting_info), full, compact, fields)
 
-def list_zoom_meetings(from_date: Optional[str] = None, to_date: Optional[str] = None) -> Dict[str, Any]:
-    """Lists Zoom meetings within a specified timeframe.
+def _list_meetings_window(from_date: Optional[str], to_date: Optional[str]) -> Tuple[str, str, datetime, datetime]:
+    """Resolve the default listing window and return it as strings and datetimes."""
+    if not from_date:
+        from_date = datetime.now().strftime("%Y-%m-%d")
+    if not to_date:
+        # Default to 7 days from from_date if not specified
+        to_date = (datetime.strptime(from_date, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+        
+    # Convert dates to datetime objects for comparison
+    from_datetime = datetime.strptime(from_date, "%Y-%m-%d")
+    to_datetime = datetime.strptime(to_date, "%Y-%m-%d") + timedelta(days=1)  # Include the entire end date
+    return from_date, to_date, from_datetime, to_datetime
+
+def _list_meetings_params(from_date: str, to_date: str, next_page_token: str = "") -> Dict[str, Any]:
+    """Build the query for one page of scheduled meetings, filtered by date on Zoom's side."""
+    params = {**LIST_MEETINGS_PARAMS, 'from': from_date, 'to': to_date}
+    if next_page_token:
+        params['next_page_token'] = next_page_token
+    return params
+
+def _meetings_page(response: Any) -> Tuple[List[Dict[str, Any]], str]:
+    """Return the meetings and the next page token of a list response, raising ZoomAPIError on failure."""
+    if response.status_code == 401:
+        raise ZoomAPIError(response.status_code, "Authentication failed. Please check your Zoom credentials.")
+    elif response.status_code != 200:
+        error_message = response.json().get('message', response.text) if response.text else 'Unknown error'
+        raise ZoomAPIError(response.status_code, f"Failed to list meetings: {error_message}")
     
-    Args:
-        from_date: Start date in format 'YYYY-MM-DD' (optional, defaults to today)
-        to_date: End date in format 'YYYY-MM-DD' (optional, defaults to 7 days from from_date)
-    """
+    meetings_data = response.json()
+    return meetings_data.get('meetings', []), meetings_data.get('next_page_token', '')
+
+def _listed_meeting_record(meeting: Dict[str, Any], from_datetime: datetime, to_datetime: datetime) -> Optional[Dict[str, Any]]:
+    """Return the canonical record of one listed meeting, or None if it is invalid or outside the window."""
     try:
-        access_token = get_zoom_access_token()
-        
-        headers = {
-            'Authorization': f'Bearer {access_token}',
-            'Content-Type': 'application/json'
-        }
-        
-        # Handle date parameters
-        if not from_date:
-            from_date = datetime.now().strftime("%Y-%m-%d")
-        if not to_date:
-            # Default to 7 days from from_date if not specified
-            to_date = (datetime.strptime(from_date, "%Y-%m-%d") + timedelta(days=7)).strftime("%Y-%m-%d")
+        # Handle cases where start_time might not be present
+        if 'start_time' not in meeting:
+            return None
             
-        # Convert dates to datetime objects for comparison
-        from_datetime = datetime.strptime(from_date, "%Y-%m-%d")
-        to_datetime = datetime.strptime(to_date, "%Y-%m-%d") + timedelta(days=1)  # Include the entire end date
-        
-        params = {
-            'type': 'scheduled',
-            'page_size': 100  # Maximum allowed by Zoom
-        }
-        
-        response = requests.get(
-            'https://api.zoom.us/v2/users/me/meetings',
-            headers=headers,
-            params=params
-        )
-        
-        if response.status_code == 401:
-            return {
-                "status": "error",
-                "message": "Authentication failed. Please check your Zoom credentials."
-            }
-        elif response.status_code != 200:
-            error_message = response.json().get('message', response.text) if response.text else 'Unknown error'
-            return {
-                "status": "error",
-                "message": f"Failed to list meetings: {error_message}"
-            }
-        
-        meetings_data = response.json()
-        filtered_meetings = []
-        
-        # Check if meetings exist in the response
-        if 'meetings' not in meetings_data:
-            return {
-                "status": "success",
-                "message": "No scheduled meetings found",
-                "meetings": []
-            }
-        
-        for meeting in meetings_data['meetings']:
-            try:
-                # Handle cases where start_time might not be present
-                if 'start_time' not in meeting:
-                    continue
-                    
-                meeting_time = datetime.strptime(meeting['start_time'], "%Y-%m-%dT%H:%M:%SZ")
-                
-                if from_datetime <= meeting_time <= to_datetime:
-                    filtered_meetings.append({
-                        "topic": meeting.get('topic', 'Untitled Meeting'),
-                        "meeting_id": meeting.get('id', 'N/A'),
-                        "start_time": meeting_time.strftime("%Y-%m-%d %H:%M:%S"),
-                        "duration": f"{meeting.get('duration', 0)} minutes",
-                        "join_url": f"[Click to join]({meeting.get('join_url', '#')})",
-                        "status": meeting.get('status', 'unknown')
-                    })
-            except (ValueError, KeyError) as e:
-                # Skip meetings with invalid data
-                continue
-        
+        meeting_time = datetime.strptime(meeting['start_time'], "%Y-%m-%dT%H:%M:%SZ")
+        
+        # Zoom already filters by date; this guards the edges of the window
+        if not from_datetime <= meeting_time <= to_datetime:
+            return None
+        return meeting_record(meeting, 'N/A')
+    except (ValueError, KeyError):
+        # Skip meetings with invalid data
+        return None
+
+def _meeting_summary(record: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a canonical meeting record the way the full list result shows it."""
+    return {
+        "topic": record['topic'],
+        "meeting_id": record['meeting_id'],
+        "start_time": record['start_time'],
+        "duration": f"{record['duration']} minutes",
+        "join_url": f"[Click to join]({record.get('join_url', '#')})",
+        "status": record.get('status', 'unknown')
+    }
+
+def _list_meetings_result(records: List[Dict[str, Any]], from_date: str, to_date: str, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Turn the canonical records of the listed meetings into the tool result."""
+    message = f"Found {len(records)} meetings between {from_date} and {to_date}"
+
+    def full() -> Dict[str, Any]:
+        meetings = [_meeting_summary(record) for record in records]
         # Create table format
         table_rows = []
-        for meeting in filtered_meetings:
+        for meeting in meetings:
             table_rows.append({
                 "Topic": meeting["topic"],
                 "Date": meeting["start_time"].split()[0],
@@ -520,25 +263,317 @@ def list_zoom_meetings(from_date: Optional[str] = None, to_date: Optional[str] =
                 "Meeting ID": meeting["meeting_id"],
                 "Join Link": meeting["join_url"]
             })
-        
         return {
             "status": "success",
-            "message": f"Found {len(filtered_meetings)} meetings between {from_date} and {to_date}",
-            "meetings": filtered_meetings,
+            "message": message,
+            "meetings": meetings,
             "table_format": {
                 "headers": ["Topic", "Date", "Time", "Duration", "Meeting ID", "Join Link"],
                 "rows": table_rows
             }
         }
+    return shape_list_result(message, records, full, compact, fields)
+
+class _ZoomCall(NamedTuple):
+    """One Zoom API request that a meeting flow needs answered."""
+    method: str
+    path: str
+    params: Optional[Dict[str, Any]] = None
+    json: Optional[Dict[str, Any]] = None
+
+# A meeting flow is a generator that yields the Zoom requests it needs, is sent
+# back each response and returns the tool result. Only the drivers below do
+# I/O, so the sync and async tools share all of their logic.
+MeetingFlow = Generator[_ZoomCall, Any, Dict[str, Any]]
+
+def _send(client: Any, call: _ZoomCall) -> Any:
+    return client.request(call.method, call.path, params=call.params, json=call.json)
+
+def _run_flow(flow: MeetingFlow) -> Dict[str, Any]:
+    """Drive a meeting flow with the shared sync client; client errors are raised inside the flow."""
+    try:
+        call = next(flow)
+        while True:
+            try:
+                response = _send(get_zoom_client(), call)
+            except Exception as e:
+                call = flow.throw(e)
+            else:
+                call = flow.send(response)
+    except StopIteration as stop:
+        return stop.value
+
+async def _run_flow_async(flow: MeetingFlow) -> Dict[str, Any]:
+    """Drive a meeting flow with the event loop's async client."""
+    try:
+        call = next(flow)
+        while True:
+            try:
+                response = await _send(get_async_zoom_client(), call)
+            except Exception as e:
+                call = flow.throw(e)
+            else:
+                call = flow.send(response)
+    except StopIteration as stop:
+        return stop.value
+
+def _create_meeting_flow(topic: str, duration: int, start_time: str, compact: Optional[bool], fields: Optional[List[str]]) -> MeetingFlow:
+    try:
+        meeting_data, meeting_time = _create_meeting_payload(topic, duration, start_time)
+        response = yield _ZoomCall('POST', '/users/me/meetings', json=meeting_data)
+        return _create_meeting_result(response, meeting_time, compact, fields)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error creating meeting: {str(e)}"
+        }
+
+def _update_meeting_flow(meeting_id: Optional[str], topic: Optional[str], duration: Optional[int], start_time: Optional[str],
+                         compact: Optional[bool], fields: Optional[List[str]]) -> MeetingFlow:
+    try:
+        try:
+            update_data = _update_meeting_payload(topic, duration, start_time)
+        except ValueError:
+            return {"status": "error", "message": INVALID_START_TIME_MESSAGE}
+        
+        response = yield _ZoomCall('PATCH', f'/meetings/{meeting_id}', json=update_data)
+        
+        if response.status_code != 204:
+            return {
+                "status": "error",
+                "message": f"Failed to update meeting: {response.text}"
+            }
+        
+        # The cached meeting plus the PATCH body is the new state; only fetch on a miss
+        meeting_info = get_meeting_cache().update(meeting_id, update_data)
+        if meeting_info:
+            return _update_meeting_result(meeting_info, meeting_id, compact, fields)
+        
+        get_response = yield _ZoomCall('GET', f'/meetings/{meeting_id}')
+        if get_response.status_code != 200:
+            return {
+                "status": "error",
+                "message": f"Meeting updated but failed to fetch updated details: {get_response.text}"
+            }
+        meeting_info = get_response.json()
+        _remember_meeting(meeting_info)
+        return _update_meeting_result(meeting_info, meeting_id, compact, fields)
         
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error updating meeting: {str(e)}"
+        }
+
+def _delete_meeting_flow(meeting_id: str) -> MeetingFlow:
+    try:
+        response = yield _ZoomCall('DELETE', f'/meetings/{meeting_id}')
+        return _delete_meeting_result(response, meeting_id)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error deleting meeting: {str(e)}"
+        }
+
+def _get_meeting_flow(meeting_id: str, use_cache: bool, compact: Optional[bool], fields: Optional[List[str]]) -> MeetingFlow:
+    try:
+        cached = get_meeting_cache().get(meeting_id) if use_cache else None
+        if cached:
+            return _meeting_details_result(cached, compact, fields)
+        response = yield _ZoomCall('GET', f'/meetings/{meeting_id}')
+        return _get_meeting_result(response, compact, fields)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error getting meeting: {str(e)}"
+        }
+
+class _MeetingPages:
+    """Pages through the scheduled meetings of a window, following next_page_token."""
+
+    def __init__(self, from_date: Optional[str], to_date: Optional[str]):
+        self.from_date, self.to_date, self._from_datetime, self._to_datetime = _list_meetings_window(from_date, to_date)
+        self._next_page_token = ""
+        self.done = False
+
+    def next_call(self) -> _ZoomCall:
+        return _ZoomCall('GET', '/users/me/meetings', params=_list_meetings_params(self.from_date, self.to_date, self._next_page_token))
+
+    def records(self, response: Any) -> List[Dict[str, Any]]:
+        """Return the canonical records of one page, raising ZoomAPIError if the page failed."""
+        meetings, self._next_page_token = _meetings_page(response)
+        self.done = not self._next_page_token
+        records = []
+        for meeting in meetings:
+            record = _listed_meeting_record(meeting, self._from_datetime, self._to_datetime)
+            if record:
+                topic_index.add(record['meeting_id'], record['topic'])
+                records.append(record)
+        return records
+
+def _list_meetings_flow(from_date: Optional[str], to_date: Optional[str], compact: Optional[bool], fields: Optional[List[str]]) -> MeetingFlow:
+    try:
+        pages = _MeetingPages(from_date, to_date)
+        records = []
+        while not pages.done:
+            records += pages.records((yield pages.next_call()))
+        return _list_meetings_result(records, pages.from_date, pages.to_date, compact, fields)
+    except ZoomAPIError as e:
+        return {
+            "status": "error",
+            "message": str(e)
+        }
     except Exception as e:
         return {
             "status": "error",
             "message": f"Error listing meetings: {str(e)}"
         }
 
-def open_zoom_url(url: str) -> None:
-    """Opens a Zoom URL in the default web browser."""
+@traced()
+def create_zoom_meeting(topic: str = "Scheduled Meeting", duration: int = 60, start_time: str = "", compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Creates a Zoom meeting and returns the join URL.
+    
+    Args:
+        compact: Return a single meeting record instead of the full result (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of the meeting record, e.g. ["meeting_id", "join_url"] (implies compact)
+    """
+    return _run_flow(_create_meeting_flow(topic, duration, start_time, compact, fields))
+
+@traced()
+def update_zoom_meeting(meeting_id: Optional[str], topic: Optional[str] = None, duration: Optional[int] = None, start_time: Optional[str] = None, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Updates a Zoom meeting's details and returns updated details.
+    
+    Args:
+        compact: Return a single meeting record instead of the full result (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of the meeting record (implies compact)
+    """
+    return _run_flow(_update_meeting_flow(meeting_id, topic, duration, start_time, compact, fields))
+
+@traced()
+def delete_zoom_meeting(meeting_id: str) -> Dict[str, Any]:
+    """Deletes a Zoom meeting."""
+    return _run_flow(_delete_meeting_flow(meeting_id))
+
+@traced()
+def get_zoom_meeting(meeting_id: str, use_cache: bool = True, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Gets details of a specific Zoom meeting.
+    
+    Args:
+        meeting_id: The Zoom meeting ID
+        use_cache: Set to False to bypass the local meeting cache and read from Zoom
+        compact: Return a single meeting record instead of the full result (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of the meeting record (implies compact)
+    """
+    return _run_flow(_get_meeting_flow(meeting_id, use_cache, compact, fields))
+
+def _iter_meeting_records(from_date: Optional[str] = None, to_date: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields the canonical records of the meetings within a timeframe, page by page."""
+    pages = _MeetingPages(from_date, to_date)
+    while not pages.done:
+        yield from pages.records(_send(get_zoom_client(), pages.next_call()))
+
+def iter_zoom_meetings(from_date: Optional[str] = None, to_date: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """Yields Zoom meetings within a timeframe, fetching result pages lazily.
+    
+    Follows next_page_token so no meetings are dropped, while holding only
+    one page in memory at a time. Raises ZoomAPIError if a page fails.
+    
+    Args:
+        from_date: Start date in format 'YYYY-MM-DD' (optional, defaults to today)
+        to_date: End date in format 'YYYY-MM-DD' (optional, defaults to 7 days from from_date)
+    """
+    for record in _iter_meeting_records(from_date, to_date):
+        yield _meeting_summary(record)
+
+@traced()
+def list_zoom_meetings(from_date: Optional[str] = None, to_date: Optional[str] = None, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Lists Zoom meetings within a specified timeframe.
+    
+    Args:
+        from_date: Start date in format 'YYYY-MM-DD' (optional, defaults to today)
+        to_date: End date in format 'YYYY-MM-DD' (optional, defaults to 7 days from from_date)
+        compact: Return one record per meeting instead of the full result with a table (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of each meeting, e.g. ["meeting_id", "topic", "start_time"] (implies compact)
+    """
+    return _run_flow(_list_meetings_flow(from_date, to_date, compact, fields))
+
+@traced()
+async def create_zoom_meeting_async(topic: str = "Scheduled Meeting", duration: int = 60, start_time: str = "", compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Creates a Zoom meeting and returns the join URL.
+    
+    Args:
+        compact: Return a single meeting record instead of the full result (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of the meeting record, e.g. ["meeting_id", "join_url"] (implies compact)
+    """
+    return await _run_flow_async(_create_meeting_flow(topic, duration, start_time, compact, fields))
+
+@traced()
+async def update_zoom_meeting_async(meeting_id: Optional[str], topic: Optional[str] = None, duration: Optional[int] = None, start_time: Optional[str] = None, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Updates a Zoom meeting's details and returns updated details.
+    
+    Args:
+        compact: Return a single meeting record instead of the full result (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of the meeting record (implies compact)
+    """
+    return await _run_flow_async(_update_meeting_flow(meeting_id, topic, duration, start_time, compact, fields))
+
+@traced()
+async def delete_zoom_meeting_async(meeting_id: str) -> Dict[str, Any]:
+    """Deletes a Zoom meeting."""
+    return await _run_flow_async(_delete_meeting_flow(meeting_id))
+
+@traced()
+async def get_zoom_meeting_async(meeting_id: str, use_cache: bool = True, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Gets details of a specific Zoom meeting.
+    
+    Args:
+        meeting_id: The Zoom meeting ID
+        use_cache: Set to False to bypass the local meeting cache and read from Zoom
+        compact: Return a single meeting record instead of the full result (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of the meeting record (implies compact)
+    """
+    return await _run_flow_async(_get_meeting_flow(meeting_id, use_cache, compact, fields))
+
+async def _iter_meeting_records_async(from_date: Optional[str] = None, to_date: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of _iter_meeting_records."""
+    pages = _MeetingPages(from_date, to_date)
+    while not pages.done:
+        for record in pages.records(await _send(get_async_zoom_client(), pages.next_call())):
+            yield record
+
+async def iter_zoom_meetings_async(from_date: Optional[str] = None, to_date: Optional[str] = None) -> AsyncIterator[Dict[str, Any]]:
+    """Async counterpart of iter_zoom_meetings."""
+    async for record in _iter_meeting_records_async(from_date, to_date):
+        yield _meeting_summary(record)
+
+@traced()
+async def list_zoom_meetings_async(from_date: Optional[str] = None, to_date: Optional[str] = None, compact: Optional[bool] = None, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Lists Zoom meetings within a specified timeframe.
+    
+    Args:
+        from_date: Start date in format 'YYYY-MM-DD' (optional, defaults to today)
+        to_date: End date in format 'YYYY-MM-DD' (optional, defaults to 7 days from from_date)
+        compact: Return one record per meeting instead of the full result with a table (defaults to ZOOM_RESPONSE_MODE)
+        fields: Only return these fields of each meeting, e.g. ["meeting_id", "topic", "start_time"] (implies compact)
+    """
+    return await _run_flow_async(_list_meetings_flow(from_date, to_date, compact, fields))
+
+_open_browser: Optional[bool] = None
+
+def set_open_browser(enabled: bool) -> None:
+    """Choose whether start/join/open_zoom_url open a browser tab or only return the URL."""
+    global _open_browser
+    _open_browser = enabled
+
+def opens_browser() -> bool:
+    """ZOOM_OPEN_BROWSER, read once on first use unless set_open_browser was called."""
+    global _open_browser
+    if _open_browser is None:
+        _open_browser = get_bool('ZOOM_OPEN_BROWSER', True)
+    return _open_browser
+
+def open_zoom_url(url: str) -> Dict[str, Any]:
+    """Opens a Zoom URL in the default web browser, or only returns it when browsers are disabled."""
     try:
         # Clean the URL if it's in markdown format
         if url.startswith('[') and '](' in url:
@@ -546,92 +581,161 @@ def open_zoom_url(url: str) -> None:
         # Ensure the URL is properly formatted
         if not url.startswith('http'):
             url = 'https://' + url
+        if not opens_browser():
+            return {"status": "success", "message": f"Open the meeting at {url}", "url": url}
         # Open in new tab
         webbrowser.open(url, new=2)
+        return {"status": "success", "message": "Opened the meeting in a new tab.", "url": url}
     except Exception as e:
-        print(f"Error opening URL: {str(e)}")
+        return {"status": "error", "message": f"Error opening URL: {str(e)}"}
+
+async def open_zoom_url_async(url: str) -> Dict[str, Any]:
+    """Opens a Zoom URL in the default web browser, or only returns it when browsers are disabled."""
+    return await asyncio.to_thread(open_zoom_url, url)
+
+def _looks_like_meeting_id(value: str) -> bool:
+    """Check whether the input is a numeric meeting ID rather than a topic."""
+    return bool(MEETING_ID_PATTERN.match(re.sub(r'[\s-]', '', str(value))))
 
+def _resolve_meeting_id(meeting_ref: str) -> Optional[str]:
+    """Resolve a meeting ID or topic to a meeting ID.
+    
+    Topics are looked up in the in-memory topic index. Only when the index
+    has no match are the upcoming meetings listed once to refresh it.
+    """
+    if _looks_like_meeting_id(meeting_ref):
+        return re.sub(r'[\s-]', '', str(meeting_ref))
+    meeting_id = topic_index.resolve(meeting_ref)
+    if meeting_id is None:
+        for _ in iter_zoom_meetings():
+            pass
+        meeting_id = topic_index.resolve(meeting_ref)
+    return meeting_id
+
+async def _resolve_meeting_id_async(meeting_ref: str) -> Optional[str]:
+    """Async counterpart of _resolve_meeting_id."""
+    if _looks_like_meeting_id(meeting_ref):
+        return re.sub(r'[\s-]', '', str(meeting_ref))
+    meeting_id = topic_index.resolve(meeting_ref)
+    if meeting_id is None:
+        async for _ in iter_zoom_meetings_async():
+            pass
+        meeting_id = topic_index.resolve(meeting_ref)
+    return meeting_id
+
+def _meeting_not_found(meeting_ref: str) -> Dict[str, Any]:
+    return {
+        "status": "error",
+        "message": f"No meeting found with ID or topic '{meeting_ref}'"
+    }
+
+def _find_meeting(meeting_ref: str) -> Dict[str, Any]:
+    """Get a meeting's details by ID or topic with at most one meeting lookup."""
+    meeting_id = _resolve_meeting_id(meeting_ref)
+    if meeting_id is None:
+        return _meeting_not_found(meeting_ref)
+    # start/join read the full "details" block, whatever the configured response mode
+    meeting_info = get_zoom_meeting(meeting_id, compact=False)
+    if meeting_info["status"] == "error":
+        # The index may point at a meeting that was deleted elsewhere
+        topic_index.remove(meeting_id)
+    return meeting_info
+
+async def _find_meeting_async(meeting_ref: str) -> Dict[str, Any]:
+    """Async counterpart of _find_meeting."""
+    meeting_id = await _resolve_meeting_id_async(meeting_ref)
+    if meeting_id is None:
+        return _meeting_not_found(meeting_ref)
+    meeting_info = await get_zoom_meeting_async(meeting_id, compact=False)
+    if meeting_info["status"] == "error":
+        topic_index.remove(meeting_id)
+    return meeting_info
+
+def _open_meeting(topic: str, url: str, note: str = "") -> Dict[str, Any]:
+    """Open a meeting URL and describe the result; with browsers disabled the URL is returned instead."""
+    opened = open_zoom_url(url)
+    if opened["status"] != "success":
+        return opened
+    if opens_browser():
+        message = f"Opening meeting '{topic}' in a new tab...{note}"
+    else:
+        message = f"Meeting '{topic}' is ready: {opened['url']}{note}"
+    return {"status": "success", "message": message, "url": opened["url"]}
+
+def _start_target(meeting_info: Dict[str, Any]) -> Union[Tuple[str, str, str], Dict[str, Any]]:
+    """Pick the URL that starts a found meeting, as (topic, url, note), or the error result."""
+    if meeting_info["status"] != "success":
+        return meeting_info
+    details = meeting_info["details"]
+    # Extract the start URL from the meeting details
+    start_url = details.get("start_url")
+    if start_url:
+        return details['topic'], start_url, ""
+    # If no start URL is available, provide the join URL instead
+    join_url = details.get("join_url", "")
+    if join_url:
+        return details['topic'], join_url, "\nNote: You may need to sign in to Zoom to start the meeting as host."
+    return {
+        "status": "error",
+        "message": "No start or join URL found for this meeting. Please check your Zoom account permissions."
+    }
+
+def _join_target(meeting_info: Dict[str, Any]) -> Union[Tuple[str, str, str], Dict[str, Any]]:
+    """Pick the URL that joins a found meeting, as (topic, url, note), or the error result."""
+    if meeting_info["status"] != "success":
+        return meeting_info
+    join_url = meeting_info["details"].get("join_url")
+    if join_url:
+        return meeting_info["details"]['topic'], join_url, ""
+    return {
+        "status": "error",
+        "message": "Join URL not found for this meeting"
+    }
+
+@traced()
 def start_zoom_meeting(meeting_id: str) -> Dict[str, Any]:
     """Starts a Zoom meeting by opening the start URL in a new tab."""
     try:
-        # First try to get the meeting by ID
-        meeting_info = get_zoom_meeting(meeting_id)
-        
-        # If that fails, try to find the meeting by topic
-        if meeting_info["status"] == "error":
-            # List all meetings
-            meetings = list_zoom_meetings()
-            if meetings["status"] == "success":
-                # Find the meeting with matching topic
-                for meeting in meetings.get("meetings", []):
-                    if meeting["topic"].lower() == meeting_id.lower():
-                        meeting_info = get_zoom_meeting(meeting["meeting_id"])
-                        break
-        
-        if meeting_info["status"] == "success":
-            # Extract the start URL from the meeting details
-            start_url = meeting_info["details"].get("start_url")
-            if start_url:
-                open_zoom_url(start_url)
-                return {
-                    "status": "success",
-                    "message": f"Opening meeting '{meeting_info['details']['topic']}' in a new tab..."
-                }
-            else:
-                # If no start URL is available, provide the join URL instead
-                join_url = meeting_info["details"].get("join_url", "")
-                if join_url:
-                    open_zoom_url(join_url)
-                    return {
-                        "status": "success",
-                        "message": f"Opening meeting '{meeting_info['details']['topic']}' in a new tab...\nNote: You may need to sign in to Zoom to start the meeting as host."
-                    }
-                else:
-                    return {
-                        "status": "error",
-                        "message": "No start or join URL found for this meeting. Please check your Zoom account permissions."
-                    }
-        return meeting_info
+        target = _start_target(_find_meeting(meeting_id))
+        return target if isinstance(target, dict) else _open_meeting(*target)
     except Exception as e:
         return {
             "status": "error",
             "message": f"Error starting meeting: {str(e)}"
         }
 
+@traced()
+async def start_zoom_meeting_async(meeting_id: str) -> Dict[str, Any]:
+    """Starts a Zoom meeting by opening the start URL in a new tab."""
+    try:
+        target = _start_target(await _find_meeting_async(meeting_id))
+        return target if isinstance(target, dict) else await asyncio.to_thread(_open_meeting, *target)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error starting meeting: {str(e)}"
+        }
+
+@traced()
 def join_zoom_meeting(meeting_id: str) -> Dict[str, Any]:
     """Joins a Zoom meeting by opening the join URL in a new tab."""
     try:
-        # First try to get the meeting by ID
-        meeting_info = get_zoom_meeting(meeting_id)
-        
-        # If that fails, try to find the meeting by topic
-        if meeting_info["status"] == "error":
-            # List all meetings
-            meetings = list_zoom_meetings()
-            if meetings["status"] == "success":
-                # Find the meeting with matching topic
-                for meeting in meetings.get("meetings", []):
-                    if meeting["topic"].lower() == meeting_id.lower():
-                        meeting_info = get_zoom_meeting(meeting["meeting_id"])
-                        break
-        
-        if meeting_info["status"] == "success":
-            # Extract the join URL from the meeting details
-            join_url = meeting_info["details"].get("join_url")
-            if join_url:
-                open_zoom_url(join_url)
-                return {
-                    "status": "success",
-                    "message": f"Opening meeting '{meeting_info['details']['topic']}' in a new tab..."
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": "Join URL not found for this meeting"
-                }
-        return meeting_info
+        target = _join_target(_find_meeting(meeting_id))
+        return target if isinstance(target, dict) else _open_meeting(*target)
     except Exception as e:
         return {
             "status": "error",
             "message": f"Error joining meeting: {str(e)}"
-        } 
\ No newline at end of file
+        }
+
+@traced()
+async def join_zoom_meeting_async(meeting_id: str) -> Dict[str, Any]:
+    """Joins a Zoom meeting by opening the join URL in a new tab."""
+    try:
+        target = _join_target(await _find_meeting_async(meeting_id))
+        return target if isinstance(target, dict) else await asyncio.to_thread(_open_meeting, *target)
+    except Exception as e:
+        return {
+            "status": "error",
+            "message": f"Error joining meeting: {str(e)}"
+        }
@@ -0,0 +1,154 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from .config import get_int
+from .telemetry import traced
+from typing import Dict, Any, Callable, List, Optional
+from .zoom import (
+    create_zoom_meeting, update_zoom_meeting, delete_zoom_meeting,
+    create_zoom_meeting_async, update_zoom_meeting_async, delete_zoom_meeting_async
+)
+
+CREATE_FIELDS = {'topic', 'duration', 'start_time'}
+UPDATE_FIELDS = {'meeting_id', 'topic', 'duration', 'start_time'}
+
+
+def _spec_error(spec: Any, allowed: set, required: set) -> Optional[str]:
+    """Return why a bulk item cannot be run, or None if it is valid."""
+    if not isinstance(spec, dict):
+        return "Each item must be an object"
+    unknown = set(spec) - allowed
+    if unknown:
+        return f"Unknown fields: {', '.join(sorted(unknown))}"
+    missing = required - set(spec)
+    if missing:
+        return f"Missing fields: {', '.join(sorted(missing))}"
+    return None
+
+
+def _prepare(items: List[Any], allowed: set, required: set) -> List[Any]:
+    """Pair each item with a validation error, if any."""
+    return [(spec, _spec_error(spec, allowed, required)) for spec in items]
+
+
+def _bulk_result(operation: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    succeeded = sum(1 for result in results if result.get("status") == "success")
+    failed = len(results) - succeeded
+    return {
+        "status": "success" if not failed else ("error" if not succeeded else "partial"),
+        "message": f"{operation}: {succeeded} succeeded, {failed} failed",
+        "succeeded": succeeded,
+        "failed": failed,
+        "results": results
+    }
+
+
+def _concurrency(max_concurrency: int) -> int:
+    return max_concurrency or get_int('ZOOM_BULK_CONCURRENCY', 8)
+
+
+def _run_bulk(func: Callable[..., Dict[str, Any]], prepared: List[Any], max_concurrency: int) -> List[Dict[str, Any]]:
+    """Run a sync tool over every item on a bounded thread pool, keeping input order."""
+    def run(index: int, spec: Dict[str, Any], error: Optional[str]) -> Dict[str, Any]:
+        if error:
+            return {"index": index, "status": "error", "message": error}
+        return {"index": index, **func(**spec)}
+
+    if not prepared:
+        return []
+    max_concurrency = _concurrency(max_concurrency)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(prepared)))) as executor:
+        futures = [executor.submit(run, index, spec, error) for index, (spec, error) in enumerate(prepared)]
+        return [future.result() for future in futures]
+
+
+async def _run_bulk_async(func: Callable[..., Any], prepared: List[Any], max_concurrency: int) -> List[Dict[str, Any]]:
+    """Run an async tool over every item with at most ``max_concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(max(1, _concurrency(max_concurrency)))
+
+    async def run(index: int, spec: Dict[str, Any], error: Optional[str]) -> Dict[str, Any]:
+        if error:
+            return {"index": index, "status": "error", "message": error}
+        async with semaphore:
+            return {"index": index, **(await func(**spec))}
+
+    return list(await asyncio.gather(*(run(index, spec, error) for index, (spec, error) in enumerate(prepared))))
+
+
+def _delete_specs(meeting_ids: List[str]) -> List[Any]:
+    return [({"meeting_id": str(meeting_id)}, None) for meeting_id in meeting_ids]
+
+
+def _with_meeting_ids(results: List[Dict[str, Any]], meeting_ids: List[str]) -> List[Dict[str, Any]]:
+    return [{**result, "meeting_id": str(meeting_ids[result["index"]])} for result in results]
+
+
+@traced()
+def bulk_create_zoom_meetings(meetings: List[Dict[str, Any]], max_concurrency: int = 0) -> Dict[str, Any]:
+    """Creates several Zoom meetings concurrently in one call.
+
+    Args:
+        meetings: List of meeting specs, each with optional 'topic', 'duration' and 'start_time'
+        max_concurrency: Maximum number of meetings created at the same time, 0 for the configured default
+    """
+    prepared = _prepare(meetings, CREATE_FIELDS, set())
+    return _bulk_result("Create meetings", _run_bulk(create_zoom_meeting, prepared, max_concurrency))
+
+
+@traced()
+def bulk_update_zoom_meetings(updates: List[Dict[str, Any]], max_concurrency: int = 0) -> Dict[str, Any]:
+    """Updates several Zoom meetings concurrently in one call.
+
+    Args:
+        updates: List of update specs, each with 'meeting_id' and optional 'topic', 'duration' and 'start_time'
+        max_concurrency: Maximum number of meetings updated at the same time, 0 for the configured default
+    """
+    prepared = _prepare(updates, UPDATE_FIELDS, {'meeting_id'})
+    return _bulk_result("Update meetings", _run_bulk(update_zoom_meeting, prepared, max_concurrency))
+
+
+@traced()
+def bulk_delete_zoom_meetings(meeting_ids: List[str], max_concurrency: int = 0) -> Dict[str, Any]:
+    """Deletes several Zoom meetings concurrently in one call.
+
+    Args:
+        meeting_ids: IDs of the meetings to delete
+        max_concurrency: Maximum number of meetings deleted at the same time, 0 for the configured default
+    """
+    results = _run_bulk(delete_zoom_meeting, _delete_specs(meeting_ids), max_concurrency)
+    return _bulk_result("Delete meetings", _with_meeting_ids(results, meeting_ids))
+
+
+@traced()
+async def bulk_create_zoom_meetings_async(meetings: List[Dict[str, Any]], max_concurrency: int = 0) -> Dict[str, Any]:
+    """Creates several Zoom meetings concurrently in one call.
+
+    Args:
+        meetings: List of meeting specs, each with optional 'topic', 'duration' and 'start_time'
+        max_concurrency: Maximum number of meetings created at the same time, 0 for the configured default
+    """
+    prepared = _prepare(meetings, CREATE_FIELDS, set())
+    return _bulk_result("Create meetings", await _run_bulk_async(create_zoom_meeting_async, prepared, max_concurrency))
+
+
+@traced()
+async def bulk_update_zoom_meetings_async(updates: List[Dict[str, Any]], max_concurrency: int = 0) -> Dict[str, Any]:
+    """Updates several Zoom meetings concurrently in one call.
+
+    Args:
+        updates: List of update specs, each with 'meeting_id' and optional 'topic', 'duration' and 'start_time'
+        max_concurrency: Maximum number of meetings updated at the same time, 0 for the configured default
+    """
+    prepared = _prepare(updates, UPDATE_FIELDS, {'meeting_id'})
+    return _bulk_result("Update meetings", await _run_bulk_async(update_zoom_meeting_async, prepared, max_concurrency))
+
+
+@traced()
+async def bulk_delete_zoom_meetings_async(meeting_ids: List[str], max_concurrency: int = 0) -> Dict[str, Any]:
+    """Deletes several Zoom meetings concurrently in one call.
+
+    Args:
+        meeting_ids: IDs of the meetings to delete
+        max_concurrency: Maximum number of meetings deleted at the same time, 0 for the configured default
+    """
+    results = await _run_bulk_async(delete_zoom_meeting_async, _delete_specs(meeting_ids), max_concurrency)
+    return _bulk_result("Delete meetings", _with_meeting_ids(results, meeting_ids))
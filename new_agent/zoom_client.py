@@ -0,0 +1,253 @@
+import time
+import asyncio
+import functools
+import threading
+import weakref
+import requests
+from requests.adapters import HTTPAdapter
+from .config import get_float, get_int, get_setting
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+from .zoom_oauth import get_zoom_access_token, get_token_cache
+from .rate_limit import RateLimitScheduler, get_rate_limiter, rate_limit_category
+from . import telemetry
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def http_timeout() -> Tuple[float, float]:
+    """(connect, read) timeout in seconds for requests to Zoom."""
+    return get_float('ZOOM_HTTP_CONNECT_TIMEOUT', 5.0), get_float('ZOOM_HTTP_READ_TIMEOUT', 30.0)
+
+
+def _client_settings() -> Dict[str, Any]:
+    return {
+        "base_url": get_setting('ZOOM_API_BASE_URL', 'https://api.zoom.us/v2'),
+        "pool_size": get_int('ZOOM_HTTP_POOL_SIZE', 10),
+        "timeout": http_timeout()
+    }
+
+
+class ZoomAPIError(Exception):
+    """Raised when the Zoom API answers with an unexpected status code."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _rate_limit_error(response: Any) -> ZoomAPIError:
+    retry_after = response.headers.get('Retry-After')
+    hint = f" Retry after {retry_after}." if retry_after else ""
+    return ZoomAPIError(429, f"Zoom API rate limit reached.{hint}")
+
+
+class ZoomClient:
+    """Shared HTTP client for the Zoom REST API.
+
+    Wraps a single ``requests.Session`` so connections to api.zoom.us are kept
+    alive and reused across tool calls instead of paying a TCP+TLS handshake
+    per request. The bearer token comes from the S2S token cache and every
+    request passes through the rate-limit scheduler.
+    """
+
+    def __init__(
+        self,
+        base_url: str = 'https://api.zoom.us/v2',
+        pool_size: int = 10,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        scheduler: Optional[RateLimitScheduler] = None
+    ):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.scheduler = scheduler or get_rate_limiter()
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Accept': 'application/json'
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send an authenticated, rate-limited request to the Zoom API.
+
+        Requests wait for their rate-limit category instead of failing, and
+        429 responses are retried with backoff, as are 5xx responses except
+        to POST, which may already have created the meeting. Raises
+        ZoomAPIError once the retries for a 429 are exhausted.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        category = rate_limit_category(method, path)
+        attempt = 0
+        while True:
+            self.scheduler.acquire(category)
+            response = self._send(method, f'{self.base_url}{path}', **kwargs)
+            self.scheduler.observe(category, response)
+            delay = self.scheduler.retry_delay(method, response, attempt)
+            if delay is None:
+                break
+            time.sleep(delay)
+            attempt += 1
+        if response.status_code == 429:
+            raise _rate_limit_error(response)
+        return response
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one request, retrying once with a fresh token on 401.
+
+        A 401 usually means the cached access token was revoked or expired
+        early.
+        """
+        access_token = get_zoom_access_token()
+        response = self._http(method, url, access_token, **kwargs)
+        if response.status_code == 401:
+            access_token = get_zoom_access_token(force_refresh=True, stale_token=access_token)
+            response = self._http(method, url, access_token, **kwargs)
+        return response
+
+    def _http(self, method: str, url: str, access_token: str, **kwargs) -> requests.Response:
+        if not telemetry.is_enabled():
+            return self.session.request(method, url, headers=self._auth_headers(access_token), **kwargs)
+        with telemetry.span("http", telemetry.route_name(method, url[len(self.base_url):])) as current:
+            response = self.session.request(method, url, headers=self._auth_headers(access_token), **kwargs)
+            current.set(status=str(response.status_code), status_code=response.status_code, bytes=len(response.content))
+        return response
+
+    def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        return self.request('GET', path, params=params)
+
+    def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
+        return self.request('POST', path, json=json)
+
+    def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
+        return self.request('PATCH', path, json=json)
+
+    def delete(self, path: str) -> requests.Response:
+        return self.request('DELETE', path)
+
+    def close(self) -> None:
+        self.session.close()
+
+    @staticmethod
+    def _auth_headers(access_token: str) -> Dict[str, str]:
+        return {'Authorization': f'Bearer {access_token}'}
+
+
+_client: Optional[ZoomClient] = None
+_client_lock = threading.Lock()
+
+
+def get_zoom_client() -> ZoomClient:
+    """Return the process-wide Zoom client, creating it on first use."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ZoomClient(**_client_settings())
+    return _client
+
+
+class AsyncZoomClient:
+    """Asyncio counterpart of ``ZoomClient`` built on ``httpx.AsyncClient``.
+
+    Shares the S2S token cache with the sync client. A cache miss fetches the
+    token in the default executor so the event loop is never blocked.
+    """
+
+    def __init__(
+        self,
+        base_url: str = 'https://api.zoom.us/v2',
+        pool_size: int = 10,
+        timeout: Tuple[float, float] = (5.0, 30.0),
+        scheduler: Optional[RateLimitScheduler] = None
+    ):
+        # Imported here so sync-only callers do not pay for httpx at import
+        import httpx
+
+        self.base_url = base_url.rstrip('/')
+        self.scheduler = scheduler or get_rate_limiter()
+        connect_timeout, read_timeout = timeout
+        self.client = httpx.AsyncClient(
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout)
+        )
+
+    async def request(self, method: str, path: str, **kwargs) -> "httpx.Response":
+        """Send an authenticated, rate-limited request to the Zoom API."""
+        category = rate_limit_category(method, path)
+        attempt = 0
+        while True:
+            await self.scheduler.acquire_async(category)
+            response = await self._send(method, f'{self.base_url}{path}', **kwargs)
+            self.scheduler.observe(category, response)
+            delay = self.scheduler.retry_delay(method, response, attempt)
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+            attempt += 1
+        if response.status_code == 429:
+            raise _rate_limit_error(response)
+        return response
+
+    async def _send(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        """Send one request, retrying once with a fresh token on 401."""
+        access_token = await self._access_token()
+        response = await self._http(method, url, access_token, **kwargs)
+        if response.status_code == 401:
+            access_token = await self._access_token(force_refresh=True, stale_token=access_token)
+            response = await self._http(method, url, access_token, **kwargs)
+        return response
+
+    async def _http(self, method: str, url: str, access_token: str, **kwargs) -> "httpx.Response":
+        if not telemetry.is_enabled():
+            return await self.client.request(method, url, headers=ZoomClient._auth_headers(access_token), **kwargs)
+        with telemetry.span("http", telemetry.route_name(method, url[len(self.base_url):])) as current:
+            response = await self.client.request(method, url, headers=ZoomClient._auth_headers(access_token), **kwargs)
+            current.set(status=str(response.status_code), status_code=response.status_code, bytes=len(response.content))
+        return response
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> "httpx.Response":
+        return await self.request('GET', path, params=params)
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> "httpx.Response":
+        return await self.request('POST', path, json=json)
+
+    async def patch(self, path: str, json: Optional[Dict[str, Any]] = None) -> "httpx.Response":
+        return await self.request('PATCH', path, json=json)
+
+    async def delete(self, path: str) -> "httpx.Response":
+        return await self.request('DELETE', path)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    @staticmethod
+    async def _access_token(force_refresh: bool = False, stale_token: Optional[str] = None) -> str:
+        if not force_refresh:
+            access_token = get_token_cache().get_if_fresh()
+            if access_token:
+                return access_token
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(get_zoom_access_token, force_refresh=force_refresh, stale_token=stale_token)
+        )
+
+
+# httpx connection pools are bound to the event loop that created them
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncZoomClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_zoom_client() -> AsyncZoomClient:
+    """Return the Zoom async client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncZoomClient(**_client_settings())
+        _async_clients[loop] = client
+    return client
@@ -1,24 +1,101 @@
-import os
+import time
+import threading
 import requests
 import base64
-from dotenv import load_dotenv
+from typing import Dict, Any, Optional, Tuple
 import logging
+from .config import get_int, get_setting
+from .telemetry import span
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Load environment variables
-load_dotenv()
 
-CLIENT_ID = os.getenv('ZOOM_CLIENT_ID')
-CLIENT_SECRET = os.getenv('ZOOM_CLIENT_SECRET')
-ACCOUNT_ID = os.getenv('ZOOM_ACCOUNT_ID')
-TOKEN_URL = 'https://zoom.us/oauth/token'
+class TokenCache:
+    """In-memory cache for the S2S access token.
 
-def get_zoom_access_token() -> str:
-    """Fetch a new Zoom S2S OAuth access token using account credentials."""
-    auth_str = f"{CLIENT_ID}:{CLIENT_SECRET}"
+    The token is kept together with its expiry and refreshed proactively once
+    it is within ``refresh_margin`` seconds of expiring. Refreshes are
+    single-flight: concurrent callers that find the token stale wait on one
+    lock and only the first of them talks to the token endpoint.
+    """
+
+    def __init__(self, refresh_margin: int = 300):
+        self.refresh_margin = refresh_margin
+        self._token: Optional[str] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+        # Separate from _lock, which is held for the whole token fetch
+        self._stats_lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "refreshes": 0, "forced_refreshes": 0}
+
+    def _count(self, *names: str) -> None:
+        with self._stats_lock:
+            for name in names:
+                self._stats[name] += 1
+
+    def _is_fresh(self) -> bool:
+        return self._token is not None and time.monotonic() < self._expires_at - self.refresh_margin
+
+    def get(self, force_refresh: bool = False, stale_token: Optional[str] = None) -> str:
+        """Return a valid token, fetching a new one only when needed.
+
+        Args:
+            force_refresh: Discard the cached token and fetch a new one.
+            stale_token: The token the caller saw rejected. If another thread
+                has already replaced it, the forced refresh is skipped.
+        """
+        if not force_refresh:
+            token = self.get_if_fresh()
+            if token is not None:
+                return token
+
+        with self._lock:
+            if force_refresh and stale_token is not None and self._token != stale_token:
+                # Somebody else refreshed while we were waiting for the lock
+                force_refresh = False
+            if not force_refresh and self._is_fresh():
+                self._count("hits")
+                return self._token
+
+            self._count("misses")
+            if force_refresh:
+                self._count("forced_refreshes")
+            token_data = fetch_zoom_access_token()
+            self._token = token_data['access_token']
+            self._expires_at = time.monotonic() + int(token_data.get('expires_in', 3600))
+            self._count("refreshes")
+            return self._token
+
+    def get_if_fresh(self) -> Optional[str]:
+        """Return the cached token if it is still fresh, without ever blocking."""
+        token, expires_at = self._token, self._expires_at
+        if token is not None and time.monotonic() < expires_at - self.refresh_margin:
+            self._count("hits")
+            return token
+        return None
+
+    def invalidate(self) -> None:
+        """Drop the cached token so the next call fetches a new one."""
+        with self._lock:
+            self._token = None
+            self._expires_at = 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/refresh counters and the remaining token lifetime."""
+        remaining = max(0.0, self._expires_at - time.monotonic()) if self._token else 0.0
+        with self._stats_lock:
+            return {**self._stats, "expires_in": int(remaining)}
+
+
+def _credentials() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Read the S2S app credentials when a token is first needed, not at import."""
+    return get_setting('ZOOM_CLIENT_ID'), get_setting('ZOOM_CLIENT_SECRET'), get_setting('ZOOM_ACCOUNT_ID')
+
+
+def fetch_zoom_access_token() -> Dict[str, Any]:
+    """Fetch a new Zoom S2S OAuth token response using account credentials."""
+    client_id, client_secret, account_id = _credentials()
+    auth_str = f"{client_id}:{client_secret}"
     b64_auth = base64.b64encode(auth_str.encode()).decode()
     headers = {
         "Authorization": f"Basic {b64_auth}",
@@ -26,11 +103,49 @@ def get_zoom_access_token() -> str:
     }
     data = {
         "grant_type": "account_credentials",
-        "account_id": ACCOUNT_ID
+        "account_id": account_id
     }
-    response = requests.post(TOKEN_URL, headers=headers, data=data)
+    # Imported here because zoom_client imports this module
+    from .zoom_client import http_timeout
+    token_url = get_setting('ZOOM_OAUTH_TOKEN_URL', 'https://zoom.us/oauth/token')
+    with span("http", "POST /oauth/token") as current:
+        # The fetch runs under the single-flight refresh lock, so a hung token
+        # endpoint must time out like any other Zoom request
+        response = requests.post(token_url, headers=headers, data=data, timeout=http_timeout())
+        current.set(status=str(response.status_code), status_code=response.status_code, bytes=len(response.content))
     if response.status_code != 200:
         logger.error(f"Failed to get S2S access token: {response.text}")
         raise Exception(f"Failed to get S2S access token: {response.text}")
-    token_data = response.json()
-    return token_data['access_token'] 
\ No newline at end of file
+    return response.json()
+
+
+_token_cache: Optional[TokenCache] = None
+_token_cache_lock = threading.Lock()
+
+
+def get_token_cache() -> TokenCache:
+    """Return the process-wide token cache, reading its settings on first use."""
+    global _token_cache
+    if _token_cache is None:
+        with _token_cache_lock:
+            if _token_cache is None:
+                # Refresh the token this many seconds before Zoom says it expires
+                _token_cache = TokenCache(refresh_margin=get_int('ZOOM_TOKEN_REFRESH_MARGIN', 300))
+    return _token_cache
+
+
+def __getattr__(name: str) -> Any:
+    # Keep ``zoom_oauth.token_cache`` working without creating it at import
+    if name == "token_cache":
+        return get_token_cache()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_zoom_access_token(force_refresh: bool = False, stale_token: Optional[str] = None) -> str:
+    """Return a cached Zoom S2S OAuth access token, refreshing it when it is about to expire."""
+    return get_token_cache().get(force_refresh=force_refresh, stale_token=stale_token)
+
+
+def get_token_cache_stats() -> Dict[str, Any]:
+    """Return hit/miss/refresh counters of the access token cache."""
+    return get_token_cache().stats()
@@ -0,0 +1,161 @@
+import asyncio
+import json
+
+import pytest
+
+from new_agent import batch
+from new_agent.batch import Watermark
+from new_agent.main import RequestResult
+
+
+def test_watermark_waits_for_gaps():
+    watermark = Watermark()
+    watermark.complete(2, 20)
+    watermark.complete(3, 30)
+    assert (watermark.line, watermark.offset) == (0, 0)
+    watermark.complete(1, 10)
+    assert (watermark.line, watermark.offset) == (3, 30)
+    watermark.complete(5, 50)
+    assert watermark.line == 3
+    watermark.complete(4, 40)
+    assert (watermark.line, watermark.offset) == (5, 50)
+
+
+def test_watermark_resumes_from_checkpoint():
+    watermark = Watermark(10, 100)
+    watermark.complete(12, 120)
+    assert watermark.line == 10
+    watermark.complete(11, 110)
+    assert (watermark.line, watermark.offset) == (12, 120)
+
+
+@pytest.mark.parametrize("content, expected", [
+    (b"", b""),
+    (b'{"line": 1}\n', b'{"line": 1}\n'),
+    (b'{"line": 1}\n{"line": 2, "sta', b'{"line": 1}\n'),
+    (b'{"line": 1, "sta', b""),
+])
+def test_truncate_torn_tail(tmp_path, content, expected):
+    path = tmp_path / "out.jsonl"
+    path.write_bytes(content)
+    batch._truncate_torn_tail(str(path))
+    assert path.read_bytes() == expected
+
+
+def test_truncate_torn_tail_reads_past_one_chunk(tmp_path):
+    path = tmp_path / "out.jsonl"
+    path.write_bytes(b'{"line": 1}\n' + b"x" * 100)
+    batch._truncate_torn_tail(str(path), chunk_size=16)
+    assert path.read_bytes() == b'{"line": 1}\n'
+
+
+def test_truncate_torn_tail_ignores_missing_file(tmp_path):
+    batch._truncate_torn_tail(str(tmp_path / "missing.jsonl"))
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    """Replace the agent with one that fails requests ending in "!" and records what it ran."""
+    seen = []
+
+    async def run_zoom_request(request, user_id, session_id, request_id=None):
+        seen.append(request)
+        if request.endswith("!"):
+            return RequestResult("Error processing request: boom", False)
+        return RequestResult(f"done {request}", True)
+
+    async def end_session(user_id, session_id):
+        pass
+
+    monkeypatch.setattr(batch, "run_zoom_request", run_zoom_request)
+    monkeypatch.setattr(batch, "end_session", end_session)
+    return seen
+
+
+def write_input(path, requests):
+    path.write_text("".join(json.dumps({"id": index, "request": request}) + "\n" for index, request in enumerate(requests)))
+
+
+def read_results(path):
+    return sorted((json.loads(line) for line in path.read_text().splitlines()), key=lambda result: result["line"])
+
+
+def test_failed_requests_are_counted(tmp_path, agent):
+    input_path, output_path = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(input_path, ["a", "b!", "c"])
+    input_path.write_text(input_path.read_text() + "not json\n")
+
+    summary = asyncio.run(batch.run_batch(str(input_path), str(output_path), concurrency=2))
+
+    assert (summary["processed"], summary["failed"], summary["last_line"]) == (4, 2, 4)
+    assert [result["status"] for result in read_results(output_path)] == ["success", "error", "success", "error"]
+
+
+def test_resume_skips_finished_records_and_torn_output(tmp_path, agent):
+    input_path, output_path = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(input_path, ["a", "b", "c", "d"])
+    # An interrupted run: line 1 checkpointed, line 3 finished out of order, line 2 torn mid-write
+    with open(input_path, "rb") as f:
+        first_line_end = len(f.readline())
+    (tmp_path / "out.jsonl.checkpoint").write_text(json.dumps({"input": str(input_path), "line": 1, "offset": first_line_end}))
+    output_path.write_text(
+        json.dumps({"line": 1, "status": "success"}) + "\n"
+        + json.dumps({"line": 3, "status": "success"}) + "\n"
+        + '{"line": 2, "sta'
+    )
+
+    summary = asyncio.run(batch.run_batch(str(input_path), str(output_path)))
+
+    assert sorted(agent) == ["b", "d"]
+    assert (summary["processed"], summary["skipped"], summary["last_line"]) == (2, 1, 4)
+    assert [result["line"] for result in read_results(output_path)] == [1, 2, 3, 4]
+
+
+def test_missing_input_is_reported_as_a_failure(tmp_path, agent, capsys):
+    input_path, output_path = tmp_path / "missing.jsonl", tmp_path / "out.jsonl"
+
+    with pytest.raises(SystemExit) as exit_info:
+        batch.main([str(input_path), str(output_path)])
+
+    assert exit_info.value.code == 1
+    summary = json.loads(capsys.readouterr().out)
+    assert (summary["processed"], summary["failed"]) == (0, 1)
+    assert "missing.jsonl" in summary["error"]
+
+
+def test_read_error_lets_queued_records_finish(tmp_path, agent, monkeypatch):
+    input_path, output_path = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    write_input(input_path, ["a", "b", "c", "d"])
+
+    class FailingInput:
+        """The input file, vanishing after two lines."""
+
+        def __init__(self, f):
+            self.f = f
+            self.lines = 0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.f.close()
+
+        def __getattr__(self, name):
+            return getattr(self.f, name)
+
+        def readline(self):
+            self.lines += 1
+            if self.lines > 2:
+                raise OSError("Stale file handle")
+            return self.f.readline()
+
+    def fake_open(path, mode="r", *args, **kwargs):
+        f = open(path, mode, *args, **kwargs)
+        return FailingInput(f) if str(path) == str(input_path) else f
+
+    monkeypatch.setattr(batch, "open", fake_open, raising=False)
+    summary = asyncio.run(batch.run_batch(str(input_path), str(output_path)))
+
+    assert sorted(agent) == ["a", "b"]
+    assert (summary["processed"], summary["failed"], summary["last_line"]) == (2, 1, 2)
+    assert "Stale file handle" in summary["error"]
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from new_agent.calendar import JournalCalendarStorage
+
+
+@pytest.fixture
+def calendar_file(tmp_path):
+    return str(tmp_path / "calendar.json")
+
+
+def open_storage(calendar_file, **kwargs):
+    return JournalCalendarStorage(calendar_file, group_commit_size=1, **kwargs)
+
+
+def event(title, start_time="2030-01-07 10:00:00"):
+    return {"title": title, "start_time": start_time, "duration": 30}
+
+
+def titles(storage):
+    return [entry["title"] for entry in storage.list_events()]
+
+
+def read_journal(calendar_file):
+    with open(calendar_file + ".journal", "rb") as f:
+        return f.read()
+
+
+def test_reopen_replays_the_journal(calendar_file):
+    storage = open_storage(calendar_file)
+    storage.add_event(event("first"))
+    storage.add_event(event("second"))
+    storage.close()
+
+    reopened = open_storage(calendar_file)
+    assert titles(reopened) == ["first", "second"]
+    reopened.close()
+
+
+def test_torn_last_line_is_dropped_and_truncated(calendar_file):
+    storage = open_storage(calendar_file)
+    storage.add_event(event("kept"))
+    storage.close()
+    complete = read_journal(calendar_file)
+    with open(calendar_file + ".journal", "ab") as f:
+        f.write(b'{"id": "torn", "title": "tor')
+
+    reopened = open_storage(calendar_file)
+    assert titles(reopened) == ["kept"]
+    assert read_journal(calendar_file) == complete
+
+    # New appends start on a line of their own and survive the next replay
+    reopened.add_event(event("after crash"))
+    reopened.close()
+    replayed = open_storage(calendar_file)
+    assert titles(replayed) == ["kept", "after crash"]
+    replayed.close()
+
+
+def test_corrupt_line_drops_everything_after_it(calendar_file):
+    storage = open_storage(calendar_file)
+    storage.add_event(event("kept"))
+    storage.close()
+    with open(calendar_file + ".journal", "ab") as f:
+        f.write(b"not json\n")
+        f.write(json.dumps({"id": "later", "title": "later"}).encode() + b"\n")
+
+    reopened = open_storage(calendar_file)
+    assert titles(reopened) == ["kept"]
+    reopened.close()
+
+
+def test_entries_already_in_the_snapshot_are_not_replayed_twice(calendar_file):
+    storage = open_storage(calendar_file)
+    added = storage.add_event(event("once"))
+    storage.close()
+    # A compaction that wrote the snapshot but crashed before emptying the journal
+    with open(calendar_file, "w") as f:
+        json.dump([added], f)
+
+    reopened = open_storage(calendar_file)
+    assert titles(reopened) == ["once"]
+    reopened.close()
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(calendar_file):
+    storage = open_storage(calendar_file, compact_threshold=3)
+    for index in range(3):
+        storage.add_event(event(f"event {index}"))
+    assert read_journal(calendar_file) == b""
+    with open(calendar_file) as f:
+        assert [entry["title"] for entry in json.load(f)] == ["event 0", "event 1", "event 2"]
+    storage.close()
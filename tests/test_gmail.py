@@ -0,0 +1,45 @@
+import pytest
+
+from new_agent.gmail import get_mock_emails, score_email, triage_emails
+
+
+def email(subject, content="", priority="normal", **extra):
+    return {"id": "1", "sender": "someone@company.com", "subject": subject, "content": content, "priority": priority, **extra}
+
+
+@pytest.mark.parametrize("text", [
+    "I won't be able to join on Friday",
+    "Sorry, you won't get the report today",
+    "Good news: we won the bid",
+    "The team won the award",
+])
+def test_won_alone_is_not_spam(text):
+    assert score_email(email("Update", text))["spam"] == 0.0
+
+
+@pytest.mark.parametrize("text", ["You won a free cruise", "You've won!", "you have won the draw"])
+def test_you_won_is_spam(text):
+    assert score_email(email("Hello", text))["spam"] > 0.0
+
+
+def test_mock_inbox_is_decided_by_the_rules():
+    result = triage_emails(get_mock_emails()["emails"])
+    assert [entry["tags"] for entry in result["emails"]] == [["meeting_request", "urgent"], ["urgent"], ["spam"]]
+    assert result["ambiguous"] == []
+    analysis = result["analysis"]
+    assert analysis.startswith("MEETING_REQUIRED: yes\nURGENCY: urgent")
+    assert '"topic": "Need to schedule a meeting now"' in analysis
+    assert "SUSPICIOUS: [You've won a prize! Claim now!!!]" in analysis
+
+
+def test_single_meeting_term_is_left_to_the_analyzer():
+    vague = email("Quick question", "Can we discuss the budget?")
+    result = triage_emails([vague])
+    assert result["ambiguous"] == [vague]
+    assert result["emails"][0]["meeting_intent"] == 0.5
+
+
+def test_no_meeting_email_gives_no_meeting_analysis():
+    result = triage_emails([email("Weekly report", "Numbers attached.", priority="low")])
+    assert result["emails"][0]["tags"] == ["fyi"]
+    assert result["analysis"].startswith("MEETING_REQUIRED: no\nURGENCY: normal")
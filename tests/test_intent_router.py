@@ -0,0 +1,76 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from new_agent import intent_router
+from new_agent.intent_router import Intent, format_result, match_intent
+
+NOW = datetime(2030, 1, 9, 14, 30)  # a Wednesday
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("delete meeting 81234567890", Intent("delete", {"meeting_id": "81234567890"})),
+    ("Please cancel the zoom meeting id 812 3456 7890.", Intent("delete", {"meeting_id": "81234567890"})),
+    ("remove meeting #812-3456-7890", Intent("delete", {"meeting_id": "81234567890"})),
+    ("get meeting 123456789 details", Intent("get", {"meeting_id": "123456789"})),
+    ("show me the details of meeting 123456789", Intent("get", {"meeting_id": "123456789"})),
+    ("start meeting 123456789", Intent("start", {"meeting_id": "123456789"})),
+    ("join the meeting #123456789!", Intent("join", {"meeting_id": "123456789"})),
+])
+def test_meeting_commands(text, expected):
+    assert match_intent(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text, window", [
+    ("list meetings", (None, None)),
+    ("list all my zoom meetings", (None, None)),
+    ("show meetings today", ("2030-01-09", "2030-01-09")),
+    ("list my meetings tomorrow", ("2030-01-10", "2030-01-10")),
+    ("list meetings this week", ("2030-01-09", "2030-01-13")),
+    ("list my meetings next week", ("2030-01-14", "2030-01-20")),
+    ("list meetings on 2030-02-01", ("2030-02-01", "2030-02-01")),
+    ("list meetings from 2030-02-01 to 2030-02-03", ("2030-02-01", "2030-02-03")),
+])
+def test_list_windows(text, window):
+    assert match_intent(text, NOW) == Intent("list", {"from_date": window[0], "to_date": window[1]})
+
+
+@pytest.mark.parametrize("text", [
+    "delete meeting 12",
+    "delete meeting 123456789012345",
+    "delete the standup meeting",
+    "delete meeting 123456789 and 987654321",
+    "list my meetings with Bob",
+    "schedule a meeting tomorrow at 3pm",
+    "what meetings do I have?",
+])
+def test_anything_else_goes_to_the_agent(text):
+    assert match_intent(text, NOW) is None
+
+
+def test_format_result():
+    meeting = {"meeting_id": 123456789, "topic": "Standup", "start_time": "2030-01-10 09:00:00", "duration": 15}
+    assert format_result(Intent("delete", {"meeting_id": "123456789"}), {"status": "success"}) == \
+        "The meeting with ID 123456789 has been deleted."
+    assert "Scheduled for: 2030-01-10 at 09:00:00" in format_result(Intent("get", {}), {"status": "success", "meeting": meeting})
+    listing = format_result(Intent("list", {}), {"status": "success", "message": "Found 1 meetings", "meetings": [meeting]})
+    assert listing.startswith("Found 1 meetings:\n\n1. \"Standup\" on 2030-01-10 at 09:00:00")
+    assert format_result(Intent("get", {}), {"status": "error", "message": "Not found"}) == "Error: Not found"
+
+
+def test_route_async_calls_the_async_tool(monkeypatch):
+    calls = []
+
+    async def delete(meeting_id):
+        calls.append(meeting_id)
+        return {"status": "success"}
+
+    def fail(**kwargs):
+        raise AssertionError("the sync tool must not be used")
+
+    monkeypatch.setitem(intent_router._TOOLS, "delete", (fail, delete, {}))
+    assert asyncio.run(intent_router.route_async("delete meeting 123456789")) == \
+        "The meeting with ID 123456789 has been deleted."
+    assert asyncio.run(intent_router.route_async("delete the standup meeting")) is None
+    assert calls == ["123456789"]
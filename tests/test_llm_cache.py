@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+from google.adk.models import LlmRequest, LlmResponse
+from google.genai import types
+
+from new_agent.llm_cache import LlmResponseCache, MemoryCacheBackend
+
+
+def callback_context():
+    return SimpleNamespace(state={}, agent_name="EmailAnalyzerAgent", invocation_id="e-1")
+
+
+def request(text="inbox"):
+    return LlmRequest(model="gemini-2.0-flash", contents=[types.Content(role="user", parts=[types.Part(text=text)])])
+
+
+def response(text="MEETING_REQUIRED: no"):
+    return LlmResponse(content=types.Content(role="model", parts=[types.Part(text=text)]))
+
+
+def test_miss_is_stored_and_then_served():
+    cache = LlmResponseCache(MemoryCacheBackend())
+    context = callback_context()
+    assert cache.before_model_callback(context, request()) is None
+    cache.after_model_callback(context, response())
+
+    hit = cache.before_model_callback(callback_context(), request())
+    assert hit.content.parts[0].text == "MEETING_REQUIRED: no"
+    assert (cache.stats()["hits"], cache.stats()["misses"], cache.stats()["stores"]) == (1, 1, 1)
+
+
+def test_failed_model_call_leaves_nothing_behind():
+    cache = LlmResponseCache(MemoryCacheBackend())
+    # The model call raises, so after_model_callback never runs for this context
+    cache.before_model_callback(callback_context(), request())
+
+    assert set(vars(cache)) == {"backend", "ttl", "_lock", "_stats"}
+    assert cache.stats()["stores"] == 0
+    # A later call of the same agent and invocation is not stored under the failed call's key
+    context = callback_context()
+    cache.before_model_callback(context, request("other inbox"))
+    cache.after_model_callback(context, response())
+    assert cache.before_model_callback(callback_context(), request()) is None
+    assert cache.before_model_callback(callback_context(), request("other inbox")) is not None
+
+
+def test_tool_calls_are_not_cached():
+    cache = LlmResponseCache(MemoryCacheBackend())
+    context = callback_context()
+    cache.before_model_callback(context, request())
+    call = types.Part(function_call=types.FunctionCall(name="check_emails", args={}))
+    cache.after_model_callback(context, LlmResponse(content=types.Content(role="model", parts=[call])))
+    assert cache.stats()["stores"] == 0
+    assert context.state["temp:llm_cache_key"] is None
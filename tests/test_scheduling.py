@@ -0,0 +1,121 @@
+import random
+from datetime import datetime, timedelta
+
+from new_agent.scheduling import Interval, IntervalIndex, free_slots
+
+DAY = datetime(2030, 1, 7)  # a Monday
+
+
+def at(hour, minute=0, day=0):
+    return DAY + timedelta(days=day, hours=hour, minutes=minute)
+
+
+def busy(start, end, title="Busy"):
+    return Interval(start, end, title, "calendar", "")
+
+
+def brute_force_overlapping(intervals, start, end):
+    return sorted(
+        (interval for interval in intervals if interval.start < end and interval.end > start),
+        key=lambda interval: (interval.start, interval.end)
+    )
+
+
+def test_overlapping_empty_index():
+    index = IntervalIndex([])
+    assert len(index) == 0
+    assert index.overlapping(at(9), at(17)) == []
+
+
+def test_overlapping_excludes_touching_intervals():
+    before, after = busy(at(9), at(10), "before"), busy(at(11), at(12), "after")
+    index = IntervalIndex([before, after])
+    assert index.overlapping(at(10), at(11)) == []
+    assert index.overlapping(at(9, 59), at(11, 1)) == [before, after]
+
+
+def test_overlapping_finds_interval_containing_query():
+    long_meeting = busy(at(8), at(18))
+    index = IntervalIndex([busy(at(7), at(7, 30)), long_meeting, busy(at(19), at(20))])
+    assert index.overlapping(at(12), at(12, 30)) == [long_meeting]
+
+
+def test_overlapping_ignores_zero_length_intervals_at_query_start():
+    index = IntervalIndex([busy(at(10), at(10))])
+    assert index.overlapping(at(10), at(11)) == []
+
+
+def test_overlapping_matches_brute_force():
+    rng = random.Random(7)
+    intervals = []
+    for _ in range(300):
+        start = at(0) + timedelta(minutes=rng.randrange(0, 7 * 24 * 60, 15))
+        intervals.append(busy(start, start + timedelta(minutes=rng.choice([0, 15, 30, 60, 240, 1440]))))
+    index = IntervalIndex(intervals)
+    for _ in range(300):
+        start = at(0) + timedelta(minutes=rng.randrange(0, 7 * 24 * 60, 5))
+        end = start + timedelta(minutes=rng.randrange(5, 600, 5))
+        assert index.overlapping(start, end) == brute_force_overlapping(intervals, start, end)
+
+
+def test_free_slots_empty_calendar_returns_working_hours():
+    assert free_slots([], at(0), at(0, day=2), 30, 5) == [(at(9), at(18)), (at(9, day=1), at(18, day=1))]
+
+
+def test_free_slots_fully_booked_window():
+    assert free_slots([busy(at(8), at(19))], at(9), at(18), 30, 5) == []
+
+
+def test_free_slots_touching_busy_intervals_leave_no_gap():
+    booked = [busy(at(9), at(10)), busy(at(10), at(11)), busy(at(11), at(18))]
+    assert free_slots(booked, at(9), at(18), 15, 5) == []
+
+
+def test_free_slots_gap_exactly_duration_is_offered():
+    booked = [busy(at(9), at(10)), busy(at(10, 30), at(18))]
+    assert free_slots(booked, at(9), at(18), 30, 5) == [(at(10), at(10, 30))]
+    assert free_slots(booked, at(9), at(18), 31, 5) == []
+
+
+def test_free_slots_skips_gaps_hidden_by_a_longer_meeting():
+    # The 10:00-10:30 meeting ends inside the 09:30-12:00 one, so 10:30-11:00 is not free
+    booked = [busy(at(9, 30), at(12)), busy(at(10), at(10, 30)), busy(at(13), at(18))]
+    assert free_slots(booked, at(9), at(18), 30, 5) == [(at(9), at(9, 30)), (at(12), at(13))]
+
+
+def test_free_slots_respects_window_and_max_slots():
+    booked = [busy(at(10), at(11)), busy(at(12), at(13)), busy(at(14), at(15))]
+    assert free_slots(booked, at(10, 30), at(14, 30), 30, 5) == [(at(11), at(12)), (at(13), at(14))]
+    assert free_slots(booked, at(9), at(18), 30, 2) == [(at(9), at(10)), (at(11), at(12))]
+
+
+def test_free_slots_meeting_spanning_midnight():
+    overnight = busy(at(17), at(10, day=1))
+    assert free_slots([overnight], at(0), at(0, day=2), 60, 5) == [(at(9), at(17)), (at(10, day=1), at(18, day=1))]
+
+
+def brute_force_free_slots(intervals, day, duration):
+    """Maximal free runs of whole minutes within 09:00-18:00 of ``day``."""
+    minutes = [at(9, day=day) + timedelta(minutes=m) for m in range(9 * 60)]
+    free = [not any(i.start <= minute < i.end for i in intervals) for minute in minutes]
+    slots, run_start = [], None
+    for minute, is_free in zip(minutes + [at(18, day=day)], free + [False]):
+        if is_free and run_start is None:
+            run_start = minute
+        elif not is_free and run_start is not None:
+            if minute - run_start >= timedelta(minutes=duration):
+                slots.append((run_start, minute))
+            run_start = None
+    return slots
+
+
+def test_free_slots_matches_brute_force():
+    rng = random.Random(11)
+    for _ in range(100):
+        intervals = []
+        for _ in range(rng.randrange(0, 12)):
+            start = at(7) + timedelta(minutes=rng.randrange(0, 13 * 60, 5))
+            intervals.append(busy(start, start + timedelta(minutes=rng.choice([5, 15, 30, 60, 120, 300]))))
+        intervals.sort(key=lambda interval: (interval.start, interval.end))
+        duration = rng.choice([5, 15, 30, 60])
+        assert free_slots(intervals, at(0), at(0, day=1), duration, 100) == brute_force_free_slots(intervals, 0, duration)
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from new_agent.time_parser import parse_meeting_time
+
+NOW = datetime(2030, 1, 9, 14, 30, 15, 500)  # a Wednesday
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2030-02-01", datetime(2030, 2, 1)),
+    ("2030-02-01 10:00", datetime(2030, 2, 1, 10)),
+    ("2030-02-01T10:00:30Z", datetime(2030, 2, 1, 10, 0, 30)),
+    ("today at 4pm", datetime(2030, 1, 9, 16)),
+    ("tomorrow at 3pm", datetime(2030, 1, 10, 15)),
+    ("tmrw 9:15", datetime(2030, 1, 10, 9, 15)),
+    ("the day after tomorrow 9:30am", datetime(2030, 1, 11, 9, 30)),
+    ("friday 10am", datetime(2030, 1, 11, 10)),
+    ("wednesday", datetime(2030, 1, 9)),
+    ("next monday at 9", datetime(2030, 1, 14, 9)),
+    ("next wednesday noon", datetime(2030, 1, 16, 12)),
+    ("next week", datetime(2030, 1, 14)),
+    ("may 12th", datetime(2030, 5, 12)),
+    ("jan 3", datetime(2031, 1, 3)),
+    ("12th of march 2031 at 2.30pm", datetime(2031, 3, 12, 14, 30)),
+    ("in three days", datetime(2030, 1, 12)),
+    ("in 1 week", datetime(2030, 1, 16)),
+    ("12am", datetime(2030, 1, 9, 0)),
+    ("12pm", datetime(2030, 1, 9, 12)),
+    ("midnight", datetime(2030, 1, 9, 0)),
+])
+def test_absolute_times(text, expected):
+    assert parse_meeting_time(text, NOW) == expected
+
+
+@pytest.mark.parametrize("text, delta", [
+    ("in 2 hours", timedelta(hours=2)),
+    ("in an hour", timedelta(hours=1)),
+    ("in 45 minutes", timedelta(minutes=45)),
+    ("in 10 mins", timedelta(minutes=10)),
+])
+def test_relative_times_drop_microseconds(text, delta):
+    assert parse_meeting_time(text, NOW) == NOW.replace(microsecond=0) + delta
+
+
+def test_empty_means_five_minutes_from_now():
+    assert parse_meeting_time("", NOW) == NOW + timedelta(minutes=5)
+    assert parse_meeting_time("   ", NOW) == NOW + timedelta(minutes=5)
+
+
+def test_case_and_whitespace_do_not_matter():
+    assert parse_meeting_time("  Tomorrow   AT 3PM ", NOW) == parse_meeting_time("tomorrow at 3pm", NOW)
+
+
+@pytest.mark.parametrize("text", [
+    "sometime soon",
+    "13pm",
+    "25:00",
+    "in 2 hours tomorrow",
+    "at",
+    "2030-02-30",
+])
+def test_invalid_input_raises_value_error(text):
+    with pytest.raises(ValueError):
+        parse_meeting_time(text, NOW)
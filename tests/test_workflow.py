@@ -0,0 +1,36 @@
+from types import SimpleNamespace
+
+from google.genai import types
+
+from new_agent.workflow import parse_email_analysis, skip_meeting_when_not_required
+
+NO_MEETING = "MEETING_REQUIRED: no\nURGENCY: normal"
+
+
+def callback_context(text, analysis):
+    user_content = types.Content(role="user", parts=[types.Part(text=text)]) if text is not None else None
+    return SimpleNamespace(state={"email_analysis": analysis}, user_content=user_content)
+
+
+def test_parse_email_analysis():
+    parsed = parse_email_analysis('MEETING_REQUIRED: [yes]\nURGENCY: urgent\nMEETING_DETAILS: {"topic": "Sync"}')
+    assert parsed == {"meeting_required": True, "urgency": "urgent", "meeting_details": {"topic": "Sync"}}
+    assert parse_email_analysis("free text")["meeting_required"] is None
+
+
+def test_polling_run_is_skipped_when_no_meeting_is_required():
+    for text in (None, "", "  "):
+        context = callback_context(text, NO_MEETING)
+        assert skip_meeting_when_not_required(context).parts[0].text == "No meeting required."
+        assert context.state["meeting_result"] == "No meeting required."
+        assert context.state["meeting_created"] is False
+
+
+def test_user_request_runs_even_when_no_meeting_is_required():
+    context = callback_context("create a meeting tomorrow at 3pm", NO_MEETING)
+    assert skip_meeting_when_not_required(context) is None
+    assert "meeting_result" not in context.state
+
+
+def test_polling_run_continues_when_a_meeting_is_required():
+    assert skip_meeting_when_not_required(callback_context(None, "MEETING_REQUIRED: yes")) is None
@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+from new_agent import zoom
+
+MEETING = {
+    "status": "success",
+    "details": {"topic": "Standup", "start_url": "https://zoom.test/s/1", "join_url": "https://zoom.test/j/1"}
+}
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    """Record the URLs opened in a browser and serve MEETING for every lookup."""
+    opened = []
+
+    async def find_meeting_async(meeting_ref):
+        return MEETING
+
+    monkeypatch.setattr(zoom.webbrowser, "open", lambda url, new=0: opened.append(url))
+    monkeypatch.setattr(zoom, "_find_meeting", lambda meeting_ref: MEETING)
+    monkeypatch.setattr(zoom, "_find_meeting_async", find_meeting_async)
+    monkeypatch.setattr(zoom, "_open_browser", None)
+    return opened
+
+
+def test_start_opens_the_start_url(browser):
+    zoom.set_open_browser(True)
+    result = zoom.start_zoom_meeting("123456789")
+    assert result["message"] == "Opening meeting 'Standup' in a new tab..."
+    assert browser == ["https://zoom.test/s/1"]
+
+
+def test_urls_are_returned_when_browsers_are_disabled(browser):
+    zoom.set_open_browser(False)
+    assert zoom.start_zoom_meeting("123456789")["url"] == "https://zoom.test/s/1"
+    joined = asyncio.run(zoom.join_zoom_meeting_async("123456789"))
+    assert joined == {"status": "success", "message": "Meeting 'Standup' is ready: https://zoom.test/j/1", "url": "https://zoom.test/j/1"}
+    assert asyncio.run(zoom.open_zoom_url_async("[Join](zoom.test/j/1)"))["url"] == "https://zoom.test/j/1"
+    assert browser == []
+
+
+def test_open_browser_setting(browser, monkeypatch):
+    monkeypatch.setenv("ZOOM_OPEN_BROWSER", "false")
+    assert zoom.opens_browser() is False
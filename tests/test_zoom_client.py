@@ -0,0 +1,93 @@
+import asyncio
+
+import httpx
+import pytest
+
+from new_agent import zoom_client
+from new_agent.rate_limit import RateLimitScheduler
+from new_agent.zoom_client import AsyncZoomClient, ZoomClient
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.content = b"{}"
+        self.text = "{}"
+
+
+class FakeSession:
+    """Answers every request with the next status code in ``statuses``."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.sent = []
+
+    def request(self, method, url, **kwargs):
+        self.sent.append(method)
+        return FakeResponse(self.statuses.pop(0))
+
+
+class FreshToken:
+    def get_if_fresh(self):
+        return "token"
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(zoom_client, "get_zoom_access_token", lambda **kwargs: "token")
+    monkeypatch.setattr(zoom_client, "get_token_cache", lambda: FreshToken())
+    return RateLimitScheduler(backoff_base=0.001, backoff_cap=0.001)
+
+
+def sync_client(scheduler, statuses):
+    client = ZoomClient(base_url="https://zoom.test/v2", scheduler=scheduler)
+    client.session = FakeSession(statuses)
+    return client
+
+
+def async_client(scheduler, statuses):
+    sent = []
+
+    def handler(request):
+        sent.append(request.method)
+        return httpx.Response(statuses.pop(0), json={})
+
+    client = AsyncZoomClient(base_url="https://zoom.test/v2", scheduler=scheduler)
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client, sent
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504])
+def test_post_is_not_retried_on_server_error(scheduler, status_code):
+    client = sync_client(scheduler, [status_code, 201])
+    assert client.post("/users/me/meetings", json={"topic": "x"}).status_code == status_code
+    assert client.session.sent == ["POST"]
+    assert scheduler.stats()["server_errors"] == 1
+    assert scheduler.stats()["retries"] == 0
+
+
+def test_post_is_retried_on_rate_limit(scheduler):
+    client = sync_client(scheduler, [429, 201])
+    assert client.post("/users/me/meetings", json={"topic": "x"}).status_code == 201
+    assert client.session.sent == ["POST", "POST"]
+
+
+@pytest.mark.parametrize("method", ["GET", "PATCH", "DELETE"])
+def test_idempotent_requests_are_retried_on_server_error(scheduler, method):
+    client = sync_client(scheduler, [503, 502, 200])
+    assert client.request(method, "/meetings/123").status_code == 200
+    assert client.session.sent == [method] * 3
+
+
+def test_async_post_is_not_retried_on_server_error(scheduler):
+    client, sent = async_client(scheduler, [503, 201])
+    response = asyncio.run(client.post("/users/me/meetings", json={"topic": "x"}))
+    assert response.status_code == 503
+    assert sent == ["POST"]
+
+
+def test_async_get_is_retried_on_server_error(scheduler):
+    client, sent = async_client(scheduler, [503, 200])
+    assert asyncio.run(client.get("/meetings/123")).status_code == 200
+    assert sent == ["GET", "GET"]
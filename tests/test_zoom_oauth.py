@@ -0,0 +1,82 @@
+import threading
+import time
+
+import pytest
+
+from new_agent import zoom_oauth
+from new_agent.zoom_oauth import TokenCache
+
+
+@pytest.fixture
+def token_endpoint(monkeypatch):
+    """Replace the token fetch with a counter that hands out token-1, token-2, ..."""
+    endpoint = {"calls": 0, "expires_in": 3600, "delay": 0.0}
+    lock = threading.Lock()
+
+    def fetch():
+        time.sleep(endpoint["delay"])
+        with lock:
+            endpoint["calls"] += 1
+            return {"access_token": f"token-{endpoint['calls']}", "expires_in": endpoint["expires_in"]}
+
+    monkeypatch.setattr(zoom_oauth, "fetch_zoom_access_token", fetch)
+    return endpoint
+
+
+def test_fresh_token_is_reused(token_endpoint):
+    cache = TokenCache(refresh_margin=300)
+    assert cache.get() == "token-1"
+    assert cache.get() == "token-1"
+    assert token_endpoint["calls"] == 1
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["refreshes"]) == (1, 1, 1)
+
+
+def test_token_inside_refresh_margin_is_refreshed(token_endpoint):
+    token_endpoint["expires_in"] = 200
+    cache = TokenCache(refresh_margin=300)
+    assert cache.get() == "token-1"
+    assert cache.get_if_fresh() is None
+    assert cache.get() == "token-2"
+
+
+def test_concurrent_misses_fetch_once(token_endpoint):
+    token_endpoint["delay"] = 0.05
+    cache = TokenCache()
+    start = threading.Barrier(16)
+    tokens = []
+
+    def worker():
+        start.wait()
+        tokens.append(cache.get())
+
+    threads = [threading.Thread(target=worker) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert token_endpoint["calls"] == 1
+    assert tokens == ["token-1"] * 16
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 15
+
+
+def test_forced_refresh_is_skipped_when_token_already_replaced(token_endpoint):
+    cache = TokenCache()
+    rejected = cache.get()
+    assert cache.get(force_refresh=True, stale_token=rejected) == "token-2"
+    # A second caller that saw the same rejected token gets the new one without a fetch
+    assert cache.get(force_refresh=True, stale_token=rejected) == "token-2"
+    assert token_endpoint["calls"] == 2
+    assert cache.stats()["forced_refreshes"] == 1
+
+
+def test_invalidate_drops_the_token(token_endpoint):
+    cache = TokenCache()
+    cache.get()
+    cache.invalidate()
+    assert cache.get_if_fresh() is None
+    assert cache.stats()["expires_in"] == 0
+    assert cache.get() == "token-2"